@@ -0,0 +1,52 @@
+"""
+Compares turning an Arrow edge table into a DashNetwork payload through Python dicts with the Arrow
+ingestion path (dashvis.arrow.from_arrow + GraphData.to_columns), with and without Arrow-side sampling.
+
+    python benchmarks/arrow_ingest.py [edge_count]
+"""
+import json
+import sys
+import time
+
+import numpy as np
+import pyarrow as pa
+
+from dashvis.arrow import from_arrow
+
+
+def generate(edge_count):
+    rng = np.random.default_rng(0)
+    node_count = edge_count // 4
+    return pa.table({
+        'src': rng.integers(0, node_count, edge_count),
+        'dst': rng.integers(0, node_count, edge_count),
+        'weight': rng.uniform(0, 1, edge_count),
+    })
+
+
+def with_dicts(table):
+    rows = table.to_pylist()
+    edges = [{'from': row['src'], 'to': row['dst'], 'weight': row['weight']} for row in rows]
+    node_ids = sorted({edge['from'] for edge in edges} | {edge['to'] for edge in edges})
+    return {'nodes': [{'id': node_id} for node_id in node_ids], 'edges': edges}
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    edge_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000000
+    table = generate(edge_count)
+
+    data, dict_time = timed(lambda: json.dumps(with_dicts(table)))
+    columns, arrow_time = timed(lambda: json.dumps(from_arrow(table, source='src', target='dst').to_columns()))
+    sampled, sample_time = timed(lambda: json.dumps(
+        from_arrow(table, source='src', target='dst', sample=100000, seed=0).to_columns()))
+
+    print('edges:                              {:,}'.format(edge_count))
+    print('dicts -> data:                      {:7.2f} s  {:>12,} bytes'.format(dict_time, len(data)))
+    print('from_arrow -> dataColumns:          {:7.2f} s  {:>12,} bytes'.format(arrow_time, len(columns)))
+    print('from_arrow, 100k sample:            {:7.2f} s  {:>12,} bytes'.format(sample_time, len(sampled)))
@@ -0,0 +1,63 @@
+"""
+Times the dashvis.clustering methods and the clusterAssignment payload on a graph with planted
+communities, and reports how well label propagation recovers them.
+
+    python benchmarks/clustering.py [node_count]
+"""
+import json
+import sys
+import time
+
+import numpy as np
+
+from dashvis import GraphData, clustering
+
+
+def planted_graph(node_count, community_count, seed=0):
+    # Dense communities of random sizes plus 10% of random edges between them
+    rng = np.random.default_rng(seed)
+    community = rng.integers(0, community_count, node_count)
+    members = np.split(np.argsort(community), np.cumsum(np.bincount(community))[:-1])
+    sources, targets = [], []
+    for nodes in members:
+        sources.append(nodes[rng.integers(0, len(nodes), 4 * len(nodes))])
+        targets.append(nodes[rng.integers(0, len(nodes), 4 * len(nodes))])
+    sources.append(rng.integers(0, node_count, node_count // 2))
+    targets.append(rng.integers(0, node_count, node_count // 2))
+    sources, targets = np.concatenate(sources), np.concatenate(targets)
+    loops = sources == targets
+    edges = np.stack([sources[~loops], targets[~loops]], axis=1)
+    return GraphData({'id': np.arange(node_count), 'community': community}, edges), community
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    node_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    graph, community = planted_graph(node_count, node_count // 100)
+    print('nodes / edges: {:,} / {:,}, {:,} planted communities'.format(graph.node_count, graph.edge_count,
+                                                                        node_count // 100))
+
+    for name, function in [
+        ('component_clusters', lambda: clustering.component_clusters(graph)),
+        ('hub_clusters', lambda: clustering.hub_clusters(graph)),
+        ('attribute_clusters', lambda: clustering.attribute_clusters(graph, 'community')),
+        ('label_propagation', lambda: clustering.label_propagation(graph, seed=0)),
+    ]:
+        labels, elapsed = timed(function)
+        print('{:<20}{:8.0f} ms  {:>8,} clusters'.format(name, elapsed * 1000, labels.max() + 1))
+
+    payload, elapsed = timed(lambda: json.dumps(clustering.cluster_assignment(graph, labels)))
+    print('{:<20}{:8.0f} ms  {:>8,} bytes'.format('cluster_assignment', elapsed * 1000, len(payload)))
+
+    # Share of clustered nodes whose found cluster's majority planted community is their own
+    clustered = labels >= 0
+    keys = labels[clustered] * (community.max() + 1) + community[clustered]
+    pairs, counts = np.unique(keys, return_counts=True)
+    majority = np.zeros(labels.max() + 1, dtype=np.int64)
+    np.maximum.at(majority, pairs // (community.max() + 1), counts)
+    print('label propagation purity: {:.1%}'.format(majority.sum() / clustered.sum()))
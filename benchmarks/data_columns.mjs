@@ -0,0 +1,45 @@
+// Browser-side half of benchmarks/data_columns.py: time to parse the `data` JSON payload and to parse and expand
+// the equivalent `dataColumns` payload (src/lib/utils/columns.js) into DataSet records.
+// Requires Node >= 20.19 (ES module syntax detection for the .js sources).
+//
+//     node benchmarks/data_columns.mjs [node_count]
+
+import {performance} from 'perf_hooks';
+import {expandDataColumns} from '../src/lib/utils/columns.js';
+
+function typed(ArrayType, values, dtype) {
+    return {dtype, data: Buffer.from(new ArrayType(values).buffer).toString('base64')};
+}
+
+const count = Number(process.argv[2] || 100000);
+const ids = Array.from({length: count}, (_, i) => i);
+const groups = ids.map(i => (i * 7) % 10);
+const sizes = ids.map(i => 5 + (i % 25));
+const targets = ids.map(i => (i * 31 + 1) % count);
+
+const data = JSON.stringify({
+    nodes: ids.map(i => ({id: i, label: 'Node ' + i, group: groups[i], size: sizes[i]})),
+    edges: ids.map(i => ({id: i, from: i, to: targets[i]})),
+});
+const columns = JSON.stringify({
+    nodes: {
+        id: typed(Int32Array, ids, 'int32'), label: ids.map(i => 'Node ' + i),
+        group: typed(Int32Array, groups, 'int32'), size: typed(Float64Array, sizes, 'float64'),
+    },
+    edges: {id: typed(Int32Array, ids, 'int32'), from: typed(Int32Array, ids, 'int32'),
+        to: typed(Int32Array, targets, 'int32')},
+});
+
+function timed(fn, repeat = 5) {
+    fn();
+    const start = performance.now();
+    for (let i = 0; i < repeat; i++) {
+        fn();
+    }
+    return (performance.now() - start) / repeat;
+}
+
+console.log(`nodes / edges: ${count} / ${count}`);
+console.log(`data:          ${data.length} bytes, ${timed(() => JSON.parse(data)).toFixed(1)} ms to parse`);
+console.log(`dataColumns:   ${columns.length} bytes, ` +
+    `${timed(() => expandDataColumns(JSON.parse(columns))).toFixed(1)} ms to parse and expand`);
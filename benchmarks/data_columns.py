@@ -0,0 +1,56 @@
+"""
+Compares building and serialising the `data` property from NumPy columns record by record with the
+columnar `dataColumns` property, by payload size and server-side time.
+The matching browser-side parse / expand times are measured by benchmarks/data_columns.mjs.
+
+    python benchmarks/data_columns.py [node_count]
+"""
+import json
+import sys
+import time
+
+import numpy as np
+
+from dashvis.columns import data_columns
+
+
+def generate_columns(node_count):
+    rng = np.random.default_rng(0)
+    ids = np.arange(node_count)
+    nodes = {
+        'id': ids,
+        'label': np.array(['Node ' + str(i) for i in ids], dtype=object),
+        'group': rng.integers(0, 10, node_count),
+        'size': rng.uniform(5, 30, node_count),
+    }
+    edges = {'id': ids, 'from': ids, 'to': rng.integers(0, node_count, node_count)}
+    return nodes, edges
+
+
+def records(nodes, edges):
+    return {
+        'nodes': [{'id': int(nodes['id'][i]), 'label': nodes['label'][i], 'group': int(nodes['group'][i]),
+                   'size': float(nodes['size'][i])} for i in range(len(nodes['id']))],
+        'edges': [{'id': int(edges['id'][i]), 'from': int(edges['from'][i]), 'to': int(edges['to'][i])}
+                  for i in range(len(edges['id']))],
+    }
+
+
+def timed(function, repeat=3):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = function()
+    return result, (time.perf_counter() - start) / repeat
+
+
+if __name__ == '__main__':
+    node_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    nodes, edges = generate_columns(node_count)
+
+    data, data_time = timed(lambda: json.dumps(records(nodes, edges), separators=(',', ':')))
+    columns, columns_time = timed(lambda: json.dumps(data_columns(nodes, edges), separators=(',', ':')))
+
+    print('nodes / edges:   {:,} / {:,}'.format(node_count, node_count))
+    print('data:            {:>12,} bytes  {:7.1f} ms to build and serialise'.format(len(data), data_time * 1000))
+    print('dataColumns:     {:>12,} bytes  {:7.1f} ms to build and serialise'.format(len(columns),
+                                                                                  columns_time * 1000))
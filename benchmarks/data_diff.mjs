@@ -0,0 +1,57 @@
+// Benchmark of the node / edge diffing done in DashNetwork.componentDidUpdate when `data` changes.
+//
+// Compares the previous indexOf-based removal scan with the Set/Map based diff in src/lib/utils/dataDiff.js.
+// Requires Node >= 20.19 (ES module syntax detection for the .js sources).
+//
+//     node benchmarks/data_diff.mjs [--skip-baseline-above N]
+
+import {performance} from 'perf_hooks';
+import {diffRecords} from '../src/lib/utils/dataDiff.js';
+
+const SIZES = [1000, 10000, 100000];
+
+function makeNodes(count, offset, label) {
+    const nodes = new Array(count);
+    for (let i = 0; i < count; i++) {
+        nodes[i] = {id: i + offset, label: label + (i + offset), group: (i + offset) % 7};
+    }
+    return nodes;
+}
+
+function baselineRemovals(existing, records) {
+    const new_ids = records.map(x => x.id);
+    return existing.map(x => x.id).filter(x => new_ids.indexOf(x) === -1);
+}
+
+function time(fn) {
+    const start = performance.now();
+    const result = fn();
+    return {ms: performance.now() - start, result};
+}
+
+const skipArg = process.argv.indexOf('--skip-baseline-above');
+const baselineLimit = skipArg === -1 ? Infinity : Number(process.argv[skipArg + 1]);
+
+console.log('items\tbaseline removals (ms)\tdiff (ms)\tadd\tupdate\tremove\tunchanged');
+for (const size of SIZES) {
+    // 5% of the nodes removed, 5% added and 5% relabelled; the rest is unchanged
+    const shift = Math.floor(size * 0.05);
+    const existing = makeNodes(size, 0, 'Node ');
+    const records = makeNodes(size, shift, 'Node ');
+    for (let i = 0; i < shift; i++) {
+        records[i].label = 'Renamed ' + records[i].id;
+    }
+
+    const baseline = size > baselineLimit ? null : time(() => baselineRemovals(existing, records));
+    const diff = time(() => diffRecords(existing, records));
+    const {add, update, remove} = diff.result;
+    console.log([
+        size,
+        baseline === null ? 'skipped' : baseline.ms.toFixed(1),
+        diff.ms.toFixed(1),
+        add.length,
+        update.length,
+        remove.length,
+        size - add.length - update.length,
+    ].join('\t'));
+}
@@ -0,0 +1,43 @@
+"""
+Measures the request payload sent to the Dash server when a callback listens to the network data,
+with the full `data` echo (echoData=True) and with the default `dataVersion` notification.
+
+    python benchmarks/data_echo_payload.py [node_count]
+"""
+import json
+import sys
+
+
+def generate_network(node_count):
+    nodes = [{'id': i, 'label': 'Node ' + str(i), 'title': 'This is Node ' + str(i)} for i in range(node_count)]
+    edges = [{'id': i, 'from': i, 'to': (i * 7 + 1) % node_count, 'title': 'This is Edge ' + str(i)}
+             for i in range(node_count)]
+    return {'nodes': nodes, 'edges': edges}
+
+
+def update_request(prop, value):
+    # Shape of the body the Dash renderer posts to /_dash-update-component for a callback with a single input
+    return {
+        'output': 'output.children',
+        'outputs': {'id': 'output', 'property': 'children'},
+        'inputs': [{'id': 'network', 'property': prop, 'value': value}],
+        'changedPropIds': ['network.' + prop],
+    }
+
+
+def payload_size(body):
+    return len(json.dumps(body, separators=(',', ':')).encode('utf-8'))
+
+
+if __name__ == '__main__':
+    node_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    data = generate_network(node_count)
+
+    full_echo = payload_size(update_request('data', data))
+    version_only = payload_size(update_request('dataVersion', 1))
+
+    print('nodes / edges:          {} / {}'.format(len(data['nodes']), len(data['edges'])))
+    print('echoData=True:          {:,} bytes'.format(full_echo))
+    print('dataVersion (default):  {:,} bytes'.format(version_only))
+    print('saved per data update:  {:,} bytes ({:.2%})'.format(full_echo - version_only,
+                                                             1 - version_only / full_echo))
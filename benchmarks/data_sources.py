@@ -0,0 +1,62 @@
+"""
+Compares loading a whole graph from SQLite into a `data` payload against the paged and neighbourhood
+queries of SQLiteSource, which only read the part of the graph shown.
+
+    python benchmarks/data_sources.py [edge_count]
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from dashvis.data_sources import SQLiteSource
+
+
+def create_database(path, node_count, edge_count):
+    rng = np.random.default_rng(0)
+    with sqlite3.connect(path) as connection:
+        connection.execute('CREATE TABLE nodes (id INTEGER PRIMARY KEY, label TEXT, team INTEGER)')
+        connection.execute('CREATE TABLE edges ("from" INTEGER, "to" INTEGER)')
+        connection.executemany('INSERT INTO nodes VALUES (?, ?, ?)',
+                               ((i, 'Node {}'.format(i), i % 10) for i in range(node_count)))
+        connection.executemany('INSERT INTO edges VALUES (?, ?)',
+                               zip(rng.integers(0, node_count, edge_count).tolist(),
+                                   rng.integers(0, node_count, edge_count).tolist()))
+        connection.execute('CREATE INDEX edges_from ON edges ("from")')
+        connection.execute('CREATE INDEX edges_to ON edges ("to")')
+    connection.close()
+
+
+def load_everything(path):
+    connection = sqlite3.connect(path)
+    nodes = [{'id': i, 'label': label, 'team': team} for i, label, team in connection.execute('SELECT * FROM nodes')]
+    edges = [{'from': source, 'to': target} for source, target in connection.execute('SELECT * FROM edges')]
+    connection.close()
+    return {'nodes': nodes, 'edges': edges}
+
+
+def timed(function, repeat=3):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = function()
+    return result, (time.perf_counter() - start) / repeat
+
+
+if __name__ == '__main__':
+    edge_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    node_count = edge_count // 5
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'graph.db')
+        create_database(path, node_count, edge_count)
+        source = SQLiteSource(path)
+
+        print('nodes / edges:           {:,} / {:,}'.format(node_count, edge_count))
+        _, elapsed = timed(lambda: load_everything(path), repeat=1)
+        print('whole graph:             {:8.1f} ms'.format(elapsed * 1000))
+        data, elapsed = timed(lambda: source.page(3, size=500, where={'team': [1, 2]}))
+        print('page of 500 nodes:       {:8.1f} ms, {:,} edges'.format(elapsed * 1000, len(data['edges'])))
+        data, elapsed = timed(lambda: source.neighbourhood([0], k=2))
+        print('2-hop neighbourhood:     {:8.1f} ms, {:,} nodes'.format(elapsed * 1000, len(data['nodes'])))
@@ -0,0 +1,67 @@
+"""
+Compares building a sized and grouped `data` payload with Python dict loops against GraphData.
+
+    python benchmarks/graph_data.py [node_count]
+"""
+import sys
+import time
+
+import numpy as np
+
+from dashvis import GraphData
+
+
+def generate(node_count, edge_count):
+    rng = np.random.default_rng(0)
+    return {
+        'ids': np.arange(node_count),
+        'categories': rng.choice(np.array(['a', 'b', 'c', 'd'], dtype=object), node_count),
+        'sources': rng.integers(0, node_count, edge_count),
+        'targets': rng.integers(0, node_count, edge_count),
+    }
+
+
+def with_loops(columns, groups):
+    nodes = {}
+    for node_id, category in zip(columns['ids'].tolist(), columns['categories'].tolist()):
+        nodes[node_id] = {'id': node_id, 'group': groups.get(category, 'other')}
+    degree = dict.fromkeys(nodes, 0)
+    edges = []
+    for source, target in zip(columns['sources'].tolist(), columns['targets'].tolist()):
+        if source not in nodes or target not in nodes:
+            raise ValueError('Unknown node')
+        degree[source] += 1
+        degree[target] += 1
+        edges.append({'from': source, 'to': target})
+    low, high = min(degree.values()), max(degree.values())
+    for node_id, node in nodes.items():
+        node['size'] = 10 + (degree[node_id] - low) / (high - low) * 30
+    return {'nodes': list(nodes.values()), 'edges': edges}
+
+
+def with_graph_data(columns, groups, output):
+    graph = GraphData({'id': columns['ids'], 'category': columns['categories']},
+                      {'from': columns['sources'], 'to': columns['targets']})
+    graph.group_by('category', groups, default='other').size_by('degree')
+    del graph.nodes['category']
+    return graph.to_data() if output == 'data' else graph.to_columns()
+
+
+def timed(function, repeat=3):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+if __name__ == '__main__':
+    node_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    columns = generate(node_count, node_count * 3)
+    groups = {'a': 'alpha', 'b': 'beta'}
+
+    print('nodes / edges:                 {:,} / {:,}'.format(node_count, node_count * 3))
+    print('dict loops:                    {:8.1f} ms'.format(timed(lambda: with_loops(columns, groups)) * 1000))
+    print('GraphData.to_data():           {:8.1f} ms'.format(
+        timed(lambda: with_graph_data(columns, groups, 'data')) * 1000))
+    print('GraphData.to_columns():        {:8.1f} ms'.format(
+        timed(lambda: with_graph_data(columns, groups, 'columns')) * 1000))
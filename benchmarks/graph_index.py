@@ -0,0 +1,56 @@
+"""
+Compares extracting the 2-hop neighbourhood of a node as a `data` payload by rebuilding dict
+adjacency per request against querying a GraphIndex built once.
+
+    python benchmarks/graph_index.py [edge_count]
+"""
+import sys
+import time
+
+import numpy as np
+
+from dashvis import GraphData
+from dashvis.graph_index import GraphIndex
+
+
+def with_dicts(sources, targets, seed, k):
+    # What a callback does without an index: adjacency rebuilt from the edge list on every request
+    adjacency = {}
+    for source, target in zip(sources, targets):
+        adjacency.setdefault(source, []).append(target)
+        adjacency.setdefault(target, []).append(source)
+    found = {seed}
+    frontier = [seed]
+    for _ in range(k):
+        reached = {neighbour for node in frontier for neighbour in adjacency.get(node, [])}
+        frontier = reached - found
+        found |= frontier
+    edges = [{'from': source, 'to': target} for source, target in zip(sources, targets)
+             if source in found and target in found]
+    return {'nodes': [{'id': node} for node in found], 'edges': edges}
+
+
+def timed(function, repeat=3):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = function()
+    return result, (time.perf_counter() - start) / repeat
+
+
+if __name__ == '__main__':
+    edge_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000000
+    node_count = edge_count // 5
+    rng = np.random.default_rng(0)
+    sources, targets = rng.integers(0, node_count, edge_count), rng.integers(0, node_count, edge_count)
+    graph = GraphData(np.arange(node_count), np.stack([sources, targets], axis=1))
+    source_list, target_list = sources.tolist(), targets.tolist()
+
+    print('nodes / edges:          {:,} / {:,}'.format(node_count, edge_count))
+    index, elapsed = timed(lambda: GraphIndex(graph), repeat=1)
+    print('GraphIndex build:       {:8.1f} ms (once)'.format(elapsed * 1000))
+    payload, elapsed = timed(lambda: with_dicts(source_list, target_list, 0, 2), repeat=1)
+    print('dict adjacency:         {:8.1f} ms per request, {:,} nodes'.format(elapsed * 1000, len(payload['nodes'])))
+    payload, elapsed = timed(lambda: index.k_hop_subgraph([0], k=2))
+    print('GraphIndex 2-hop:       {:8.1f} ms per request, {:,} nodes'.format(elapsed * 1000, len(payload['nodes'])))
+    payload, elapsed = timed(lambda: index.k_hop_subgraph([0], k=3))
+    print('GraphIndex 3-hop:       {:8.1f} ms per request, {:,} nodes'.format(elapsed * 1000, len(payload['nodes'])))
@@ -0,0 +1,80 @@
+// Micro-benchmark of the structural isEqual (src/lib/utils/isEqual.js) against the JSON.stringify based helper it
+// replaced, on options-sized and data-sized inputs.
+// Requires Node >= 20.19 (ES module syntax detection for the .js sources).
+//
+//     node benchmarks/is_equal.mjs
+
+import {performance} from 'perf_hooks';
+import {isEqual} from '../src/lib/utils/isEqual.js';
+
+const jsonIsEqual = (...objects) => objects.every(obj => JSON.stringify(obj) === JSON.stringify(objects[0]));
+
+function makeOptions() {
+    return {
+        autoResize: true, height: '100%', width: '100%',
+        configure: {enabled: false, showButton: false},
+        nodes: {
+            shape: 'box', margin: 10, size: 25, borderWidth: 2, borderWidthSelected: 2,
+            font: {multi: 'markdown', align: 'center'}, labelHighlightBold: true,
+            widthConstraint: {minimum: 30, maximum: 100},
+        },
+        edges: {
+            color: {inherit: 'both'}, arrows: {to: {enabled: true, scaleFactor: 0.5}}, chosen: false,
+            arrowStrikethrough: false, smooth: {type: 'dynamic', roundness: 0.5},
+        },
+        layout: {improvedLayout: true},
+        interaction: {
+            hover: true, hoverConnectedEdges: true, multiselect: true, navigationButtons: true,
+            keyboard: {enabled: true, bindToWindow: false, autoFocus: true},
+        },
+        manipulation: {enabled: true, initiallyActive: true, addEdge: true, editEdge: true},
+        physics: {enabled: true},
+    };
+}
+
+function makeData(count) {
+    const nodes = [];
+    const edges = [];
+    for (let i = 0; i < count; i++) {
+        nodes.push({id: i, label: 'Node ' + i, title: 'This is Node ' + i, group: i % 5});
+        edges.push({id: 'e' + i, from: i, to: (i * 7 + 1) % count});
+    }
+    return {nodes, edges};
+}
+
+function bench(fn, a, b) {
+    // Repeat until at least 200ms have passed, report the time per call
+    let runs = 0;
+    const start = performance.now();
+    let elapsed = 0;
+    while (elapsed < 200) {
+        fn(a, b);
+        runs += 1;
+        elapsed = performance.now() - start;
+    }
+    return elapsed / runs;
+}
+
+const cases = [];
+const options = makeOptions();
+cases.push(['options, equal', options, makeOptions()]);
+const reordered = makeOptions();
+cases.push(['options, keys reordered', options, Object.assign({physics: reordered.physics}, reordered)]);
+const changed_options = makeOptions();
+changed_options.autoResize = false;
+cases.push(['options, first key differs', options, changed_options]);
+for (const count of [1000, 10000]) {
+    const data = makeData(count);
+    cases.push([`data ${count} nodes, equal`, data, makeData(count)]);
+    const changed = makeData(count);
+    changed.nodes[0].label = 'Changed';
+    cases.push([`data ${count} nodes, first node differs`, data, changed]);
+}
+
+console.log('case\tJSON.stringify (us/call)\tstructural (us/call)\tresults (json / structural)');
+for (const [name, a, b] of cases) {
+    const json = bench(jsonIsEqual, a, b);
+    const structural = bench(isEqual, a, b);
+    console.log(`${name}\t${(json * 1000).toFixed(2)}\t${(structural * 1000).toFixed(2)}\t` +
+        `${jsonIsEqual(a, b)} / ${isEqual(a, b)}`);
+}
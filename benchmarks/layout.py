@@ -0,0 +1,74 @@
+"""
+Times dashvis.layout.barnes_hut on random sparse graphs of increasing size.
+
+It then compares barnes_hut with parallel_layout on a graph of 64,000 two-node components, where laying
+out and bookkeeping every component separately used to dominate.
+
+    python benchmarks/layout.py [iterations]
+
+The browser baseline is benchmarks/layout.html, which times vis.js stabilizing the same graphs for the
+same number of iterations. Export the graphs, serve the directory and open the page:
+
+    python benchmarks/layout.py --export benchmarks/graphs
+    python -m http.server --directory benchmarks
+    # http://localhost:8000/layout.html?iterations=100
+"""
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from dashvis import layout
+
+SIZES = [1000, 5000, 20000, 50000]
+
+
+def pairs_graph(pair_count):
+    return {
+        'nodes': [{'id': i} for i in range(2 * pair_count)],
+        'edges': [{'from': i, 'to': i + 1} for i in range(0, 2 * pair_count, 2)],
+    }
+
+
+def random_graph(node_count, edges_per_node=1.5, seed=0):
+    rng = np.random.default_rng(seed)
+    edge_count = int(node_count * edges_per_node)
+    sources = rng.integers(0, node_count, edge_count)
+    targets = rng.integers(0, node_count, edge_count)
+    return {
+        'nodes': [{'id': i} for i in range(node_count)],
+        'edges': [{'from': int(a), 'to': int(b)} for a, b in zip(sources, targets)],
+    }
+
+
+def export(directory):
+    # One graph_<nodes>.json per size, in the `data` format, for benchmarks/layout.html
+    os.makedirs(directory, exist_ok=True)
+    for size in SIZES:
+        with open(os.path.join(directory, 'graph_{}.json'.format(size)), 'w') as file:
+            json.dump(random_graph(size), file)
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--export']:
+        export(sys.argv[2])
+        sys.exit()
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    print('nodes\tedges\titerations\ttotal (s)\tper iteration (ms)')
+    for size in SIZES:
+        data = random_graph(size)
+        start = time.perf_counter()
+        layout.barnes_hut(data, iterations=iterations, seed=0)
+        elapsed = time.perf_counter() - start
+        print('{}\t{}\t{}\t{:.2f}\t{:.1f}'.format(size, len(data['edges']), iterations, elapsed,
+                                                1000 * elapsed / iterations))
+
+    data = pairs_graph(64000)
+    print('\n{:,} two-node components, {} iterations'.format(64000, iterations))
+    for name, function in [('barnes_hut', lambda: layout.barnes_hut(data, iterations=iterations, seed=0)),
+                           ('parallel_layout', lambda: layout.parallel_layout(data, iterations=iterations, seed=0))]:
+        start = time.perf_counter()
+        function()
+        print('{:<16}{:.2f} s'.format(name, time.perf_counter() - start))
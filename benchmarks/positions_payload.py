@@ -0,0 +1,44 @@
+"""
+Compares the size and Python-side decoding time of a getPositions result in the default `{id: {x, y}}`
+format and in the compact format (id list plus base64 Float32 coordinates).
+
+    python benchmarks/positions_payload.py [node_count]
+"""
+import json
+import sys
+import time
+
+import numpy as np
+
+from dashvis import positions
+
+
+def timed(function, repeat=5):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - start) / repeat
+
+
+if __name__ == '__main__':
+    node_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    rng = np.random.default_rng(0)
+    xy = rng.uniform(-5000, 5000, size=(node_count, 2))
+    node_ids = list(range(node_count))
+
+    # What the browser sends back in each format (JSON numbers as JavaScript prints doubles)
+    default = json.dumps({str(i): {'x': x, 'y': y} for i, (x, y) in zip(node_ids, xy.tolist())},
+                         separators=(',', ':'))
+    compact = json.dumps({'nodeIds': node_ids, 'x': positions.encode_float32(xy[:, 0]),
+                          'y': positions.encode_float32(xy[:, 1])}, separators=(',', ':'))
+
+    def decode_default():
+        result = json.loads(default)
+        return np.array([[result[str(i)]['x'], result[str(i)]['y']] for i in node_ids])
+
+    def decode_compact():
+        return positions.decode_positions(json.loads(compact))
+
+    print('nodes:             {:,}'.format(node_count))
+    print('default format:    {:,} bytes, {:.1f} ms to NumPy'.format(len(default), timed(decode_default) * 1000))
+    print('compact format:    {:,} bytes, {:.1f} ms to NumPy'.format(len(compact), timed(decode_compact) * 1000))
@@ -0,0 +1,29 @@
+"""
+Times dashvis.validation.data_problems on a large `data` payload, with and without edge ids.
+
+    python benchmarks/validation.py [edge_count]
+"""
+import sys
+import time
+
+import numpy as np
+
+from dashvis.validation import data_problems
+
+if __name__ == '__main__':
+    edge_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    node_count = edge_count // 4
+    rng = np.random.default_rng(0)
+    sources = rng.integers(0, node_count, edge_count).tolist()
+    targets = rng.integers(0, node_count, edge_count).tolist()
+    nodes = [{'id': i, 'label': 'Node ' + str(i)} for i in range(node_count)]
+    cases = {
+        'without edge ids': [{'from': s, 'to': t} for s, t in zip(sources, targets)],
+        'with edge ids': [{'id': 'e' + str(i), 'from': s, 'to': t} for i, (s, t) in enumerate(zip(sources, targets))],
+    }
+
+    print('nodes / edges: {:,} / {:,}'.format(node_count, edge_count))
+    for name, edges in cases.items():
+        start = time.perf_counter()
+        problems = data_problems({'nodes': nodes, 'edges': edges})
+        print('{:<18}{:7.0f} ms, {} problems'.format(name, (time.perf_counter() - start) * 1000, len(problems)))
@@ -0,0 +1,1900 @@
+# AUTO GENERATED FILE - DO NOT EDIT
+
+import typing  # noqa: F401
+from typing_extensions import TypedDict, NotRequired, Literal # noqa: F401
+from dash.development.base_component import Component, _explicitize_args
+try:
+    from dash.types import NumberType  # noqa: F401
+except ImportError:
+    # Backwards compatibility for dash<=4.1.0
+    if typing.TYPE_CHECKING:
+        raise
+    NumberType = typing.Union[  # noqa: F401
+        typing.SupportsFloat, typing.SupportsInt, typing.SupportsComplex
+    ]
+
+ComponentSingleType = typing.Union[str, int, float, Component, None]
+ComponentType = typing.Union[
+    ComponentSingleType,
+    typing.Sequence[ComponentSingleType],
+]
+
+
+class DashNetwork(Component):
+    """A DashNetwork component.
+A full implementation of [vis.js](https://visjs.github.io/vis-network/docs/network/)
+Network component for Dash Plotly.
+Useful for displaying dynamic, automatically organised, customizable network views.
+
+Keyword arguments:
+
+- id (string; required):
+    The ID used to identify this component in Dash callbacks.
+
+- DOMtoCanvas (dict; optional):
+    Function call. Pass your values into this property and read off
+    the results from the same property. This function converts DOM
+    coordinates to coordinate on the canvas. Input and output are in
+    the form of {x:Number,y:Number}. The DOM values are relative to
+    the network container.
+
+    `DOMtoCanvas` is a dict with keys:
+
+    - x (number; optional)
+
+    - y (number; optional)
+
+- addEdgeMode (boolean; default False):
+    Write-only property. Pass True value to this property as an output
+    to call the underlying function on the graph. Go into addEdge
+    mode. The explanation from addNodeMode applies here as well.
+    Returns: None.
+
+- addNodeMode (boolean; default False):
+    Write-only property. Pass True value to this property as an output
+    to call the underlying function on the graph. Go into addNode
+    mode. Having edit mode or manipulation enabled is not required. To
+    get out of this mode, call disableEditMode(). The callback
+    functions defined in handlerFunctions still apply. To use these
+    methods without having the manipulation GUI, make sure you set
+    enabled to False. Returns: None.
+
+- afterDrawing (dict; optional):
+    Read-only prop. To use this, make sure that `enableOtherEvents` is
+    set to `True`, or that `enableOtherEvents` is a list that contains
+    this event type. Fired after drawing on the canvas has been
+    completed. Can be used to draw on top of the network.
+
+- animationFinished (dict; optional):
+    Read-only prop. To use this, make sure that `enableOtherEvents` is
+    set to `True`, or that `enableOtherEvents` is a list that contains
+    this event type. Fired when an animation is finished.
+
+- assignedClusters (list; optional):
+    Read-only property. Ids of the cluster nodes made by the last
+    clusterAssignment.
+
+- beforeDrawing (dict; optional):
+    Read-only prop. To use this, make sure that `enableOtherEvents` is
+    set to `True`, or that `enableOtherEvents` is a list that contains
+    this event type.    Fired after the canvas has been cleared,
+    scaled and translated to the viewing position but before all edges
+    and nodes are drawn. Can be used to draw behind the network.
+
+- blurEdge (dict; optional):
+    Read-only prop. To use this, make sure that `enableHciEvents` is
+    set to `True`, or that `enableHciEvents` is a list that contains
+    this event type. Fired if the option interaction:{hover:True} is
+    enabled and the mouse moved away from an edge it was hovering over
+    before.
+
+- blurNode (dict; optional):
+    Read-only prop. To use this, make sure that `enableHciEvents` is
+    set to `True`, or that `enableHciEvents` is a list that contains
+    this event type. Fired if the option interaction:{hover:True} is
+    enabled and the mouse moved away from a node it was hovering over
+    before.
+
+- canvasToDOM (dict; optional):
+    Function call. Pass your values into this property and read off
+    the results from the same property. This function converts canvas
+    coordinates to coordinate on the DOM. Input and output are in the
+    form of {x:Number,y:Number}. The DOM values are relative to the
+    network container.
+
+    `canvasToDOM` is a dict with keys:
+
+    - x (number; optional)
+
+    - y (number; optional)
+
+- click (dict; optional):
+    Read-only prop. To use this, make sure that `enableHciEvents` is
+    set to `True`, or that `enableHciEvents` is a list that contains
+    this event type. Fired when the user clicks the mouse of taps on a
+    touchscreen device. {   nodes: [Array of selected nodeIds],
+    edges: [Array of selected edgeIds],   event: [Object] original
+    click event,   pointer: {     DOM: {x:pointer_x, y:pointer_y},
+    canvas: {x:canvas_x, y:canvas_y}   } }  This is the structure
+    common to all events. Specifically for the click event, the
+    following property is added:  { ...   items: [Array of click
+    items], }  Where the click items can be:   {nodeId:NodeId}
+    // node with given id clicked on   {nodeId:NodeId labelId:0}  //
+    label of node with given id clicked on   {edgeId:EdgeId}
+    // edge with given id clicked on   {edge:EdgeId, labelId:0}   //
+    label of edge with given id clicked onThe order of the items array
+    is descending in z-order. Thus, to get the topmost item, get the
+    value at index 0.
+
+- cluster (dict; optional):
+    Function call. Returns nothing.         Clusters the network
+    according to the passed in options.         The options object is
+    explained in full below. The joinCondition function is presented
+    with all nodes.
+
+    `cluster` is a dict with keys:
+
+    - options (optional)
+
+    - stabilize (boolean; optional)
+
+- clusterAssignment (dict; optional):
+    Function call. Clusters nodes according to an assignment computed
+    beforehand, for instance with dashvis.clustering, instead of
+    evaluating a joinCondition in the browser. Pass a dict structured
+    as: {   nodeIds: [Array of nodeIds],   clusters: [Array of cluster
+    ids],  // the cluster of each node in nodeIds, None to leave it
+    out   clusterProperties: {cluster id: Object},  // optional,
+    cluster node properties (label, size...) per cluster
+    clusterNodeProperties: Object,  // optional, properties of every
+    cluster node   clusterEdgeProperties: Object,  // optional
+    idPrefix: String,  // optional, 'cluster:' by default   stabilize:
+    Boolean } All clusters are made in one pass. Cluster nodes get the
+    id idPrefix followed by the cluster id, unless their properties
+    set an id. A new assignment first opens the clusters made by the
+    previous one, and None opens them without clustering again. Nodes
+    which are already clustered and clusters of a single node are
+    skipped.
+
+    `clusterAssignment` is a dict with keys:
+
+    - nodeIds (list; optional)
+
+    - clusters (list; optional)
+
+    - clusterProperties (dict; optional)
+
+    - clusterNodeProperties (dict; optional)
+
+    - clusterEdgeProperties (dict; optional)
+
+    - idPrefix (string; optional)
+
+    - stabilize (boolean; optional)
+
+- clusterByConnection (dict; optional):
+    Function call. Returns nothing. This method looks at the provided
+    node and makes a cluster of it and all it's connected nodes. The
+    behaviour can be customized by proving the options object. All
+    options of this object are explained below. The joinCondition is
+    only presented with the connected nodes.
+
+    `clusterByConnection` is a dict with keys:
+
+    - nodeId (string; optional)
+
+    - options (optional)
+
+    - stabilize (boolean; optional)
+
+- clusterByConnections (dict; optional):
+    Function call. Returns nothing. This method looks at the provided
+    nodes IDs and makes a cluster for all of them. Allows one to
+    supply a bespoke options object for each node ID. Arrays must be
+    parallel and of equal length. The behaviour can be customized by
+    proving the options object. All options of this object are
+    explained below. The joinCondition is only presented with the
+    connected nodes.
+
+    `clusterByConnections` is a dict with keys:
+
+    - nodeIds (list of strings; optional)
+
+    - options (list; optional)
+
+    - stabilize (boolean; optional)
+
+- clusterByHubsize (dict; optional):
+    Function call. Returns nothing. This method checks all nodes in
+    the network and those with a equal or higher amount of edges than
+    specified with the hubsize qualify. If a hubsize is not defined,
+    the hubsize will be determined as the average value plus two
+    standard deviations.  For all qualifying nodes, clusterByHubsize
+    is performed on each of them. The options object is described for
+    clusterByHubsize and does the same here.
+
+    `clusterByHubsize` is a dict with keys:
+
+    - hubsize (number; optional)
+
+    - options (optional)
+
+    - stabilize (boolean; optional)
+
+- clusterHierarchy (dict; optional):
+    A hierarchy of clusters to show depending on the zoom level, as
+    built by dashvis.clustering.cluster_hierarchy: {   levels: [Array
+    of cluster assignments],  // structured as for clusterAssignment
+    scales: [Array of Numbers]  // decreasing, level i + 1 is shown
+    when the scale is below scales[i] } The assignment of the first
+    level clusters the nodes of the graph, and every following one
+    clusters the nodes and clusters shown at the previous level. As
+    the user zooms out past a scale the next level is clustered, and
+    zooming back in opens it again. This happens in the browser,
+    without a callback. Set to None to open all levels.
+
+    `clusterHierarchy` is a dict with keys:
+
+    - levels (list of dicts; optional)
+
+    - scales (list of numbers; optional)
+
+- clusterLevel (number; optional):
+    Read-only property. The level of clusterHierarchy currently shown,
+    0 when no level is clustered.
+
+- clusterNodesByConnection (dict; optional):
+    Function call. Returns nothing. This method looks at the provided
+    node IDs and makes a cluster of all of them and all their
+    connected nodes. The behaviour can be customized by proving the
+    options object. Same options object is applied to all node IDs.
+    All options of this object are explained below. The joinCondition
+    is only presented with the connected nodes.
+
+    `clusterNodesByConnection` is a dict with keys:
+
+    - nodeIds (list of strings; optional)
+
+    - options (optional)
+
+    - stabilize (boolean; optional)
+
+- clusterOutliers (dict; optional):
+    Function call. Returns nothing.  This method will cluster all
+    nodes with 1 edge with their respective connected node.  The
+    options object is explained in full below.
+
+    `clusterOutliers` is a dict with keys:
+
+    - options (optional)
+
+    - stabilize (boolean; optional)
+
+- configChange (dict; optional):
+    Read-only prop. To use this, make sure that `enableOtherEvents` is
+    set to `True`, or that `enableOtherEvents` is a list that contains
+    this event type. Fired when a user changes any option in the
+    configurator. The options object can be used with the setOptions
+    method or stringified using JSON.stringify(). You do not have to
+    manually put the options into the network: this is done
+    automatically. You can use the event to store user options in the
+    database.
+
+- controlNodeDragEnd (dict; optional):
+    Read-only prop. To use this, make sure that `enableHciEvents` is
+    set to `True`, or that `enableHciEvents` is a list that contains
+    this event type. Fired when the control node drag has finished.
+
+- controlNodeDragging (dict; optional):
+    Read-only prop. To use this, make sure that `enableHciEvents` is
+    set to `True`, or that `enableHciEvents` is a list that contains
+    this event type. Fired when dragging control node. Control Edge is
+    edge that is being dragged and contains ids of 'from' and 'to'
+    nodes. If control node is not dragged over another node, 'to'
+    field is undefined. Passes an object with properties structured
+    as: {     nodes: [Array of selected nodeIds],     edges: [Array of
+    selected edgeIds],     event: [Object] original click event,
+    pointer: {         DOM: {x:pointer_x, y:pointer_y},
+    canvas: {x:canvas_x, y:canvas_y}     },     controlEdge:
+    {from:from_node_id, to:to_node_id} }.
+
+- data (dict; default {    nodes: [{id: 1, cid: 1, label: 'Node 1', title: 'This is Node 1', level: 1},        {id: 2, cid: 2, label: 'Node 2', title: 'This is Node 2', level: 2},        {id: 3, label: 'Node 3', title: 'This is Node 3', level: 2},        {id: 4, label: 'Node 4', title: 'This is Node 4', level: 3},        {id: 5, label: 'Node 5', title: 'This is Node 5', level: 3}],    edges: [{from: 1, to: 3},        {from: 1, to: 2},        {from: 2, to: 4},        {from: 2, to: 5}]}):
+    Graph data object describing the graph to be drawn. Pass a dict
+    with two keys - 'nodes' and 'edges', set according to the vis.js
+    documentation. In Dash, this property also replaces vis.js setData
+    function. When this property changes, only the nodes and edges
+    that were added, removed or modified are applied to the graph.
+    Give your edges an 'id' to benefit from this: edges without one
+    are re-created on every update. See
+    https://visjs.github.io/vis-network/docs/network/#data.
+
+    `data` is a dict with keys:
+
+    - nodes (list of dicts; optional)
+
+    - edges (list of dicts; optional)
+
+- dataColumns (dict; optional):
+    Columnar alternative to `data`, which avoids repeating every
+    attribute name in every node and edge. Pass a dict structured as:
+    {   nodes: {id: [1, 2, 3], label: ['a', 'b', 'c'], group: [0, 0,
+    1]},   edges: {from: [1, 1], to: [2, 3]} } Each attribute is a
+    list of values, one per node or edge, or a typed column {dtype:
+    String, data: String} holding the base64 encoded little-endian
+    values of a NumPy array (dtype int8, uint8, int16, uint16, int32,
+    uint32, float32 or float64). Use dashvis.columns.data_columns to
+    build it from NumPy arrays or DataFrames. Null values, and NaN in
+    numeric columns, are left out of the expanded node or edge. When
+    set, it takes precedence over `data` and is applied in the same
+    way, including `dataVersion` updates.
+
+    `dataColumns` is a dict with keys:
+
+    - nodes (dict; optional)
+
+        `nodes` is a dict with strings as keys and values of type list
+
+
+      Or dict with keys:
+
+        - dtype (string; optional)
+
+        - data (string; optional)
+
+    - edges (dict; optional)
+
+        `edges` is a dict with strings as keys and values of type list
+        | dict with keys:
+
+        - dtype (string; optional)
+
+        - data (string; optional)
+
+- dataDelta (dict; optional):
+    Write-only property. An incremental change to the graph data,
+    applied directly to the nodes and edges currently drawn, without
+    resending the whole `data` property. Pass a dict structured as: {
+    version: Number,  // optional, echoed back through
+    dataDeltaVersion once applied   nodes: {add: [Array of nodes],
+    update: [Array of partial nodes], remove: [Array of nodeIds]},
+    edges: {add: [Array of edges], update: [Array of partial edges],
+    remove: [Array of edgeIds]} } Every key is optional. Updates are
+    merged into the existing items, as with the vis.js DataSet.update
+    function. Note that the `data` property is not rewritten to
+    reflect the delta.
+
+    `dataDelta` is a dict with keys:
+
+    - version (number; optional)
+
+    - nodes (dict; optional)
+
+        `nodes` is a dict with keys:
+
+        - add (list of dicts; optional)
+
+        - update (list of dicts; optional)
+
+        - remove (list; optional)
+
+    - edges (dict; optional)
+
+        `edges` is a dict with keys:
+
+        - add (list of dicts; optional)
+
+        - update (list of dicts; optional)
+
+        - remove (list; optional)
+
+- dataDeltaVersion (number; optional):
+    Read-only prop. Version of the last `dataDelta` applied to the
+    graph. If the delta did not carry a version, a counter of applied
+    deltas is reported instead. Listen to this property to know when
+    it is safe to send the next delta.
+
+- dataVersion (number; optional):
+    Read-only prop. Incremented every time a new `data` property has
+    been applied to the graph. Listen to this property rather than
+    `data` to react to graph updates without sending the graph back to
+    the server.
+
+- debug (boolean; default False):
+    If True, the component reports internal statistics through the
+    `debugInfo` property.
+
+- debugInfo (dict; optional):
+    Read-only prop. Only updated when `debug` is True. Internal
+    statistics of the component, structured as: {   functionCache: {
+    hits: Number,       // function strings found already compiled
+    misses: Number,     // function strings compiled     evictions:
+    Number,  // compiled functions dropped to keep the cache bounded
+    size: Number,       // compiled functions currently cached
+    maxSize: Number   } } Function strings passed through `options`,
+    the clustering properties and `on`/`off`/`once` are compiled once
+    and reused for as long as the same source text keeps coming back.
+
+- deleteSelected (boolean; default False):
+    Write-only property. Pass True value to this property as an output
+    to call the underlying function on the graph. Delete selected.
+    Having edit mode or manipulation enabled is not required. Returns:
+    None.
+
+- deselectEdge (dict; optional):
+    Read-only prop. To use this, make sure that `enableHciEvents` is
+    set to `True`, or that `enableHciEvents` is a list that contains
+    this event type. Fired when an edge (or edges) has (or have) been
+    deselected by the user. The previous selection is the list of
+    nodes and edges that were selected before the last user event.
+
+- deselectNode (dict; optional):
+    Read-only prop. To use this, make sure that `enableHciEvents` is
+    set to `True`, or that `enableHciEvents` is a list that contains
+    this event type. Fired when a node (or nodes) has (or have) been
+    deselected by the user. The previous selection is the list of
+    nodes and edges that were selected before the last user event.
+    Passes an object with properties structured as: {   nodes: [Array
+    of selected nodeIds],   edges: [Array of selected edgeIds],
+    event: [Object] original click event,   pointer: {     DOM:
+    {x:pointer_x, y:pointer_y},     canvas: {x:canvas_x, y:canvas_y}
+    }   },   previousSelection: {     nodes: [Array of previously
+    selected nodeIds],     edges: [Array of previously selected
+    edgeIds]   } }.
+
+- destroy (boolean; default False):
+    Write-only property. Pass True value to this property as an output
+    to call the underlying function on the graph. Remove the network
+    from the DOM and remove all Hammer bindings and references.
+    Returns: None.
+
+- disableEditMode (boolean; default False):
+    Write-only property. Pass True value to this property as an output
+    to call the underlying function on the graph. Programmatically
+    disable the edit mode. Similar effect to pressing the close icon
+    (small cross in the corner of the toolbar). Returns: None.
+
+- doubleClick (dict; optional):
+    Read-only prop. To use this, make sure that `enableHciEvents` is
+    set to `True`, or that `enableHciEvents` is a list that contains
+    this event type. Fired when the user double clicks the mouse or
+    double taps on a touchscreen device. Since a double click is in
+    fact 2 clicks, 2 click events are fired, followed by a double
+    click event. If you do not want to use the click events if a
+    double click event is fired, just check the time between click
+    events before processing them.
+
+- dragEnd (dict; optional):
+    Read-only prop. To use this, make sure that `enableHciEvents` is
+    set to `True`, or that `enableHciEvents` is a list that contains
+    this event type. Fired when the drag has finished.
+
+- dragStart (dict; optional):
+    Read-only prop. To use this, make sure that `enableHciEvents` is
+    set to `True`, or that `enableHciEvents` is a list that contains
+    this event type. Fired when starting a drag.
+
+- dragging (dict; optional):
+    Read-only prop. To use this, make sure that `enableHciEvents` is
+    set to `True`, or that `enableHciEvents` is a list that contains
+    this event type. Fired when dragging node(s) or the view.
+
+- echoData (boolean; default False):
+    If True, the whole `data` property is sent back to Dash every time
+    new data has been applied to the graph, which triggers any
+    callback listening to `data` a second time. Defaults to False, in
+    which case only the small `dataVersion` property is updated.
+
+- editEdgeMode (boolean; default False):
+    Write-only property. Pass True value to this property as an output
+    to call the underlying function on the graph. Go into editEdge
+    mode. The explanation from addNodeMode applies here as well.
+    Returns: None.
+
+- editNode (boolean; default False):
+    Write-only property. Pass True value to this property as an output
+    to call the underlying function on the graph. Edit the selected
+    node. The explanation from addNodeMode applies here as well.
+    Returns: None.
+
+- enableEditMode (boolean; default False):
+    Write-only property. Pass True value to this property as an output
+    to call the underlying function on the graph. Programmatically
+    enable the edit mode. Similar effect to pressing the edit button.
+    Returns: None.
+
+- enableHciEvents (list of strings | boolean; default False):
+    Either a boolean indicating if all event callbacks, triggered by
+    human interaction, selection, dragging etc., should be enabled, or
+    a list of strings indicating which ones should be used. If it's a
+    list, you will need to specify one of the following events:
+    `click`, `doubleClick`, `oncontext`, `hold`, 'release', 'select',
+    'selectNode', 'selectEdge', 'deselectNode', 'deselectEdge',
+    'dragStart', 'dragging', 'dragEnd', 'controlNodeDragging',
+    'controlNodeDragEnd', 'hoverNode', 'blurNode', 'hoverEdge',
+    'blurEdge', 'zoom', 'showPopup', 'hidePopup'. See
+    https://visjs.github.io/vis-network/docs/network/#events for more
+    details.
+
+- enableOtherEvents (list of strings | boolean; default False):
+    Either a boolean indicating if all event callbacks triggered the
+    canvas, rendering, view and configuration modules should be
+    enabled, or a list of strings indicating which ones should be
+    used. If it's a list, you will need to specify one of the
+    following events: `resize`, `initRedraw`, `beforeDrawing`,
+    `afterDrawing`, `animationFinished`, `configChange`. See
+    https://visjs.github.io/vis-network/docs/network/#events for more
+    details.
+
+- enablePhysicsEvents (list of strings | boolean; default False):
+    Either a boolean indicating if all event callbacks triggered the
+    physics simulation should be enabled, or a list of strings
+    indicating which ones should be used. If it's a list, you will
+    need to specify one of the following events: `startStabilizing`,
+    `stabilizationProgress`, `stabilizationIterationsDone`,
+    `stabilized`. See
+    https://visjs.github.io/vis-network/docs/network/#events for more
+    details.
+
+- eventBatch (list of dicts; optional):
+    Read-only prop. Only used when `eventBatching` is enabled. The
+    events fired during the last batching window, in the order they
+    were fired: [   {seq: Number, event: 'click', params: {...}},
+    {seq: Number, event: 'select', params: {...}},   ... ] seq
+    increases by one for every event over the lifetime of the
+    component, so gaps reveal missed batches. `eventFields` and
+    `eventRateLimits` are applied before events are added to a batch.
+
+    `eventBatch` is a list of dicts with keys:
+
+    - seq (number; optional)
+
+    - event (string; optional)
+
+    - params (boolean | number | string | dict | list; optional)
+
+- eventBatching (boolean | number; default False):
+    Collects events into the single `eventBatch` property instead of
+    updating one property per event. Pass True to send all events
+    fired within one animation frame together, or a number to collect
+    events over a window of that many milliseconds. Defaults to False,
+    where every event updates its own property. Must be set when the
+    component is created.
+
+- eventFields (dict with strings as keys and values of type list of strings; optional):
+    Restricts the keys sent to Dash with each event. Pass a dict keyed
+    by event name, where each value is the list of keys of the event
+    object to keep, for example: {   click: ['nodes', 'edges'],
+    dragEnd: ['nodes'] } Everything else (such as `pointer` and
+    `event`) is dropped in the browser before the event is sent.
+    Events not listed are sent in full. Must be set when the component
+    is created.
+
+- eventRateLimits (dict; optional):
+    Limits how often individual events are sent to Dash. Pass a dict
+    keyed by event name, where each value is either {throttleMs:
+    Number} or {debounceMs: Number}, for example: {   dragging:
+    {throttleMs: 100},   zoom: {debounceMs: 250} } throttleMs sends at
+    most one event per interval, debounceMs sends an event only once
+    the interval has passed without another event. In both cases the
+    last event of a burst is always delivered. Events not listed are
+    sent as they fire. Must be set when the component is created.
+
+    `eventRateLimits` is a dict with strings as keys and values of
+    type dict with keys:
+
+    - throttleMs (number; optional)
+
+    - debounceMs (number; optional)
+
+- expandOnDoubleClick (boolean; default False):
+    If True, double-clicking nodes sends an expandRequest for them, to
+    be answered with a dataDelta holding their neighbours (see
+    dashvis.expansion.Expansion). Nodes are expanded once until `data`
+    changes, and cluster nodes are not expanded. Independent of
+    `enableHciEvents`.
+
+- expandRequest (dict; optional):
+    Read-only prop. Only used when `expandOnDoubleClick` is enabled.
+    Sent when the user double-clicks nodes which were not expanded
+    yet: {   nodeIds: [Array of nodeIds],  // nodes to expand
+    expanded: [Array of nodeIds],  // nodes whose expansion was
+    applied, in order   requestId: Number  // increasing, to be
+    returned as the version of the dataDelta } Nodes count as expanded
+    once a dataDelta whose version is the requestId has been applied.
+    Until then they are sent again with the next request, so a
+    response which is lost or superseded does not leave them
+    unexpanded.
+
+    `expandRequest` is a dict with keys:
+
+    - nodeIds (list; optional)
+
+    - expanded (list; optional)
+
+    - requestId (number; optional)
+
+- findNode (dict; optional):
+    Function call. Returns array of node ids showing in which clusters
+    the desired node id exists in (if any).  Nodes can be in clusters.
+    Clusters can also be in clusters.  This function returns and array
+    of nodeIds showing where the node is. If any nodeId in the chain,
+    especially the first passed in as a parameter, is not present in
+    the current nodes list, an empty array is returned.  Example:
+    cluster 'A' contains cluster 'B', cluster 'B' contains cluster
+    'C', cluster 'C' contains node 'fred'.
+    network.clustering.findNode('fred') will return
+    ['A','B','C','fred'].
+
+    `findNode` is a dict with keys:
+
+    - nodeId (string | number; optional)
+
+    - result (list of strings; optional)
+
+- fit (dict; optional)
+
+    `fit` is a dict with keys:
+
+    - options (optional)
+
+- focus (dict; optional):
+    Function call. You can focus on a node with this function. What
+    that means is the view will lock onto that node, if it is moving,
+    the view will also move accordingly. If the view is dragged by the
+    user, the focus is broken. You can supply options to customize the
+    effect: {   scale: Number,   offset: {x:Number, y:Number}
+    locked: boolean   animation: { // -------------------> can be a
+    boolean too!     duration: Number     easingFunction: String   } }
+    All options except for locked are explained in the moveTo()
+    description below. Locked denotes whether or not the view remains
+    locked to the node once the zoom-in animation is finished. Default
+    value is True. The options object is optional in the focus method.
+
+    `focus` is a dict with keys:
+
+    - nodeId (string; optional)
+
+    - options (optional)
+
+- getBaseEdges (dict; optional):
+    Function call. For the given clusteredEdgeId, this method will
+    return all the original base edge id's provided in data.edges. For
+    a non-clustered (i.e. 'base') edge, clusteredEdgeId is returned.
+    Only the base edge id's are returned. All clustered edges id's
+    under clusteredEdgeId are skipped, but scanned recursively to
+    return their base id's.
+
+    `getBaseEdges` is a dict with keys:
+
+    - clusteredEdgeId (string; optional)
+
+    - result (list of strings; optional)
+
+- getBoundingBox (dict; optional):
+    Function call. Returns a bounding box for the node including label
+    in the format: {   top: Number,   left: Number,   right: Number,
+    bottom: Number } These values are in canvas space.
+
+    `getBoundingBox` is a dict with keys:
+
+    - nodeId (string; optional)
+
+    - result (dict; optional)
+
+- getClusteredEdges (dict; optional):
+    Function call. Similar to findNode in that it returns all the edge
+    ids that were created from the provided edge during clustering.
+    Check the result property for results of this function call.
+
+    `getClusteredEdges` is a dict with keys:
+
+    - baseEdgeId (string; optional)
+
+    - result (list of strings; optional)
+
+- getConnectedEdges (dict; optional):
+    Function call. Returns an array of edgeIds of the edges connected
+    to this node.
+
+    `getConnectedEdges` is a dict with keys:
+
+    - nodeId (string; optional)
+
+    - result (list of strings; optional)
+
+- getConnectedNodes (dict; optional):
+    Function call. Returns an array of nodeIds of all the nodes that
+    are directly connected to this node or edge.  For a node id,
+    returns an array with the id's of the connected nodes. If optional
+    parameter direction is set to string 'from', only parent nodes are
+    returned. If direction is set to 'to', only child nodes are
+    returned. Any other value or undefined returns both parent and
+    child nodes.  For an edge id, returns an array: [fromId, toId].
+    Parameter direction is ignored for edges.
+
+    `getConnectedNodes` is a dict with keys:
+
+    - nodeId (string; optional)
+
+    - direction (string; optional)
+
+    - result (list of numbers; optional)
+
+- getEdgeAt (dict; optional):
+    Function call. Returns an edgeId or undefined. The DOM positions
+    are expected to be in pixels from the top left corner of the
+    canvas.
+
+    `getEdgeAt` is a dict with keys:
+
+    - position (dict; optional)
+
+        `position` is a dict with keys:
+
+        - x (number; optional)
+
+        - y (number; optional)
+
+    - result (list of strings; optional)
+
+- getNodeAt (dict; optional):
+    Function call. Returns a nodeId or undefined. The DOM positions
+    are expected to be in pixels from the top left corner of the
+    canvas.
+
+    `getNodeAt` is a dict with keys:
+
+    - position (dict; optional)
+
+        `position` is a dict with keys:
+
+        - x (number; optional)
+
+        - y (number; optional)
+
+    - result (list of strings; optional)
+
+- getNodesInCluster (dict; optional):
+    Function call. Returns an array of all nodeIds of the nodes that
+    would be released if you open the cluster.
+
+    `getNodesInCluster` is a dict with keys:
+
+    - clusteredNodeId (string; optional)
+
+    - result (list of strings; optional)
+
+- getOptionsFromConfigurator (dict; optional):
+    Function call. If you use the configurator, you can call this
+    method to get an options object that contains all differences from
+    the default options caused by users interacting with the
+    configurator.
+
+- getPosition (dict; optional):
+    Function call. Returns the x y positions in canvas space of a
+    specific node. network.getPosition('a123'); >   { x: 5, y: 12 }
+    If no id is provided, the method will throw a TypeError If an id
+    is provided that does not correspond to a node in the network, the
+    method will throw a ReferenceError.
+
+    `getPosition` is a dict with keys:
+
+    - nodeId (string; optional)
+
+    - result (dict; optional)
+
+- getPositions (dict; optional):
+    Function call. Returns the x y positions in canvas space of the
+    nodes or node with the supplied nodeIds or nodeId as an object: //
+    All nodes in the network. network.getPositions(); >   {
+    a123: { x: 5, y: 12 },         b456: { x: 3, y: 4 },         c789:
+    { x: 7, y: 10 }     }   // Specific nodes.
+    network.getPositions(['a123', 'b456']); >   {         a123: { x:
+    5, y: 12 },         b456: { x: 3, y: 4 },     }   // A single
+    node. network.getPositions('a123'); >   {         a123: { x: 5, y:
+    12 }     }   Alternative inputs are a string containing a nodeId
+    or nothing. When a string is supplied, the position of the node
+    corresponding to the id is returned in the same format. When
+    nothing is supplied, the positions of all nodes are returned.
+    Note: If a non-existent id is supplied, the method will return an
+    empty object.  For large graphs, set format to 'compact' to
+    receive {nodeIds: [...], x: String, y: String} instead, where x
+    and y are base64 strings of little-endian Float32 values in the
+    order of nodeIds. This is several times smaller than the default
+    object, and dashvis.positions.decode_positions turns it into NumPy
+    arrays.
+
+    `getPositions` is a dict with keys:
+
+    - nodeIds (list; optional)
+
+    - format (a value equal to: 'object', 'compact'; optional)
+
+    - result (dict; optional)
+
+- getScale (number; optional):
+    Read-only property. Returns the current scale of the network. 1.0
+    is comparable to 100%, 0 is zoomed out infinitely.
+
+- getSeed (string | number; optional):
+    Read-only prop. If you like the layout of your network and would
+    like it to start in the same way next time, ask for the seed using
+    this method and put it in the layout.randomSeed option.
+
+- getSelectedEdges (list of string | numbers; optional):
+    Read-only property. Returns an array of selected edge ids like so:
+    [edgeId1, edgeId2, ..].
+
+- getSelectedNodes (list of string | numbers; optional):
+    Read-only property. Returns an array of selected node ids like so:
+    [nodeId1, nodeId2, ..].
+
+- getSelection (dict; optional):
+    Read-only property. Returns an object with selected nodes and
+    edges ids like this: {   nodes: [Array of selected nodeIds],
+    edges: [Array of selected edgeIds] }.
+
+- getViewPosition (dict; optional):
+    Read-only property. Returns the current central focus point of the
+    view in the form: { x: {Number}, y: {Number} }.
+
+    `getViewPosition` is a dict with keys:
+
+    - x (number; optional)
+
+    - y (number; optional)
+
+- hidePopup (number; optional):
+    Read-only prop. To use this, make sure that `enableHciEvents` is
+    set to `True`, or that `enableHciEvents` is a list that contains
+    this event type. Fired when the popup (tooltip) is hidden. Returns
+    none.
+
+- hold (dict; optional):
+    Read-only prop. To use this, make sure that `enableHciEvents` is
+    set to `True`, or that `enableHciEvents` is a list that contains
+    this event type.    Fired when the user clicks and holds the mouse
+    or taps and holds on a touchscreen device.    A click event is
+    also fired in this case.
+
+- hoverEdge (dict; optional):
+    Read-only prop. To use this, make sure that `enableHciEvents` is
+    set to `True`, or that `enableHciEvents` is a list that contains
+    this event type. Fired if the option interaction:{hover:True} is
+    enabled and the mouse hovers over an edge.
+
+- hoverNode (dict; optional):
+    Read-only prop. To use this, make sure that `enableHciEvents` is
+    set to `True`, or that `enableHciEvents` is a list that contains
+    this event type. Fired if the option interaction:{hover:True} is
+    enabled and the mouse hovers over a node.
+
+- initRedraw (dict; optional):
+    Read-only prop. To use this, make sure that `enableOtherEvents` is
+    set to `True`, or that `enableOtherEvents` is a list that contains
+    this event type. Fired before the redrawing begins. The simulation
+    step has completed at this point. Can be used to move custom
+    elements before starting drawing the new frame.
+
+- isCluster (dict; optional):
+    Function call. Returns True if the node whose ID has been supplied
+    is a cluster.
+
+    `isCluster` is a dict with keys:
+
+    - nodeId (string; optional)
+
+    - result (boolean; optional)
+
+- methodCalls (list of dicts; optional):
+    Function call. Calls a sequence of network methods in one go, in
+    the given order. Pass a list of calls structured as: [   {method:
+    'selectNodes', args: [['a', 'b']]},   {method: 'focus', args:
+    ['a', {scale: 1.5}]},   {method: 'getPositions', args: [['a',
+    'b']]} ] `method` is the name of any vis.js Network method also
+    available as a property of this component, and `args` are its
+    positional arguments. Clustering options may contain function
+    strings, as in the clustering properties. The results of all calls
+    are reported together in `methodResults`.
+
+    `methodCalls` is a list of dicts with keys:
+
+    - method (string; required)
+
+    - args (list; optional)
+
+- methodResults (list of dicts; optional):
+    Read-only property. One entry per call of the last `methodCalls`,
+    in the same order, structured as {method: String, result: any} or,
+    if the call failed, {method: String, error: String}. A failing
+    call does not prevent the following calls from running.
+
+    `methodResults` is a list of dicts with keys:
+
+    - method (string; optional)
+
+    - result (boolean | number | string | dict | list; optional)
+
+    - error (string; optional)
+
+- moveNode (dict; optional):
+    Function call. You can use this to programmatically move a node.
+    The supplied x and y positions have to be in canvas space!.
+
+    `moveNode` is a dict with keys:
+
+    - nodeId (string; optional)
+
+    - x (number; optional)
+
+    - y (number; optional)
+
+- moveNodes (dict; optional):
+    Function call. Moves many nodes at once. The supplied x and y
+    positions have to be in canvas space: {   nodeIds: ['a', 'b',
+    'c'],   x: [10, 20, 30],   y: [0, -5, 5] } Instead of lists, x and
+    y may be base64 strings of little-endian Float32 values, as built
+    by dashvis.positions.move_nodes, which is much smaller to send for
+    thousands of nodes. All nodes are updated with a single DataSet
+    update and redrawn once; ids not in the network are skipped. The
+    positions are stored in the nodes DataSet, so they are kept when
+    data changes unless a node sets x and y. Once applied, the
+    property is replaced by {result: Number} holding the number of
+    nodes moved.
+
+    `moveNodes` is a dict with keys:
+
+    - nodeIds (list; optional)
+
+    - x (list of numbers | string; optional)
+
+    - y (list of numbers | string; optional)
+
+    - result (number; optional)
+
+- moveTo (dict; optional):
+    Function call. You can animate or move the camera using the moveTo
+    method. Options are: {   position: {x:Number, y:Number},   scale:
+    Number,   offset: {x:Number, y:Number}   animation: { //
+    -------------------> can be a boolean too!     duration: Number
+    easingFunction: String   } } The position (in canvas units!) is
+    the position of the central focus point of the camera. The scale
+    is the target zoomlevel. Default value is 1.0. The offset (in DOM
+    units) is how many pixels from the center the view is focussed.
+    Default value is {x:0,y:0}. For animation you can either use a
+    Boolean to use it with the default options or disable it or you
+    can define the duration (in milliseconds) and easing function
+    manually. Available are: linear, easeInQuad, easeOutQuad,
+    easeInOutQuad, easeInCubic, easeOutCubic, easeInOutCubic,
+    easeInQuart, easeOutQuart, easeInOutQuart, easeInQuint,
+    easeOutQuint, easeInOutQuint. You will have to define at least a
+    scale, position or offset. Otherwise, there is nothing to move to.
+
+    `moveTo` is a dict with keys:
+
+    - options (optional)
+
+- off (dict; optional):
+    Write-only property. Pass True value to this property as an output
+    to call the underlying function on the graph. Remove an event
+    listener. The function you supply has to be the exact same as the
+    one you used in the on function. If no function is supplied, all
+    listeners will be removed. Look at the event section of the
+    documentation for more information. Returns: None.
+
+    `off` is a dict with keys:
+
+    - event_name (string; optional)
+
+    - callback (string; optional)
+
+- on (dict; optional):
+    Write-only property. Pass True value to this property as an output
+    to call the underlying function on the graph. Set an event
+    listener. Depending on the type of event you get different
+    parameters for the callback function. Look at the event section of
+    the documentation for more information. callback must contain a
+    valid javascript function Returns: None.
+
+    `on` is a dict with keys:
+
+    - event_name (string; optional)
+
+    - callback (string; optional)
+
+- once (dict; optional):
+    Write-only property. Pass True value to this property as an output
+    to call the underlying function on the graph. Set an event
+    listener only once. After it has taken place, the event listener
+    will be removed. Depending on the type of event you get different
+    parameters for the callback function. Look at the event section of
+    the documentation for more information. Returns: None.
+
+    `once` is a dict with keys:
+
+    - event_name (string; optional)
+
+    - callback (string; optional)
+
+- oncontext (dict; optional):
+    Read-only prop. To use this, make sure that `enableHciEvents` is
+    set to `True`, or that `enableHciEvents` is a list that contains
+    this event type.    Fired when the user click on the canvas with
+    the right mouse button.    The right mouse button does not select
+    by default.    You can use the method getNodeAt to select the node
+    if you want.
+
+- openCluster (dict; optional):
+    Function call. Opens the cluster, releases the contained nodes and
+    edges, removing the cluster node and cluster edges. The options
+    object is optional and currently supports one option,
+    releaseFunction, which is a function that can be used to manually
+    position the nodes after the cluster is opened. function
+    releaseFunction (clusterPosition, containedNodesPositions) {
+    var newPositions = {};     // clusterPosition = {x:clusterX,
+    y:clusterY};     // containedNodesPositions =
+    {nodeId:{x:nodeX,y:nodeY}, nodeId2....}     newPositions[nodeId] =
+    {x:newPosX, y:newPosY};     return newPositions; } The
+    containedNodesPositions contain the positions of the nodes in the
+    cluster at the moment they were clustered. This function is
+    expected to return the newPositions, which can be the
+    containedNodesPositions (altered) or a new object. This has to be
+    an object with keys equal to the nodeIds that exist in the
+    containedNodesPositions and an {x:x,y:y} position object.  Set
+    'stabilize' to True to re-draw the network immediately and avoid
+    user-visible stabilization.  For all nodeIds not listed in this
+    returned object, we will position them at the location of the
+    cluster. This is also the default behaviour when no
+    releaseFunction is defined.
+
+    `openCluster` is a dict with keys:
+
+    - nodeId (string; optional)
+
+    - options (dict; optional)
+
+    - stabilize (boolean; optional)
+
+- options (dict; optional):
+    A graph configuration object. Pass a dict set according to your
+    preferences / usecase as per the vis.js documentation. In Dash,
+    this property also replaces vis.js setOptions function. See
+    https://visjs.github.io/vis-network/docs/network/#options.
+
+- optionsChanged (list of strings; optional):
+    Read-only prop. The options which changed with the last update of
+    `options`, as a list of dotted paths such as 'interaction.hover'.
+    Only these options are passed on to vis.js. Note that removing an
+    option from `options` does not reset it to its default value.
+
+- redraw (boolean; default False):
+    Write-only property. Pass True value to this property as an output
+    to call the underlying function on the graph. Redraw the network.
+    Returns: None.
+
+- release (dict; optional):
+    Read-only prop. To use this, make sure that `enableHciEvents` is
+    set to `True`, or that `enableHciEvents` is a list that contains
+    this event type. Fired after drawing on the canvas has been
+    completed. Can be used to draw on top of the network.
+
+- releaseNode (boolean; optional):
+    Function call. Programmatically release the focussed node.
+
+- resize (dict; optional):
+    Read-only prop. To use this, make sure that `enableOtherEvents` is
+    set to `True`, or that `enableOtherEvents` is a list that contains
+    this event type. Fired when the size of the canvas has been
+    resized, either by a redraw call when the container div has
+    changed in size, a setSize() call with new values or a
+    setOptions() with new width and/or height values. Passes an object
+    with properties structured as: {   width: Number     // the new
+    width  of the canvas   height: Number    // the new height of the
+    canvas   oldWidth: Number  // the old width  of the canvas
+    oldHeight: Number // the old height of the canvas }.
+
+- select (dict; optional):
+    Read-only prop. To use this, make sure that `enableHciEvents` is
+    set to `True`, or that `enableHciEvents` is a list that contains
+    this event type. Contains a list of selected nodes and edges.
+    Struct is updated when a click, double click, context click, hold
+    and release is performed on the graph.
+
+- selectEdge (dict; optional):
+    Read-only prop. To use this, make sure that `enableHciEvents` is
+    set to `True`, or that `enableHciEvents` is a list that contains
+    this event type. Fired when an edge has been selected by the user.
+
+- selectEdges (dict; optional):
+    Function call. Selects the edges corresponding to the id's in the
+    input array. This method unselects all other objects before
+    selecting its own objects. Does not fire events.
+
+    `selectEdges` is a dict with keys:
+
+    - edgeIds (list; optional)
+
+- selectNode (dict; optional):
+    Read-only prop. To use this, make sure that `enableHciEvents` is
+    set to `True`, or that `enableHciEvents` is a list that contains
+    this event type. Fired when a node has been selected by the user.
+
+- selectNodes (dict; optional):
+    Function call. Selects the nodes corresponding to the id's in the
+    input array. If highlightEdges is True or undefined, the
+    neighbouring edges will also be selected. This method unselects
+    all other objects before selecting its own objects. Does not fire
+    events.
+
+    `selectNodes` is a dict with keys:
+
+    - nodeIds (list; optional)
+
+    - highlightEdges (boolean; optional)
+
+- setSelection (dict; optional):
+    Function call. Sets the selection, wich must be an object like
+    this: {   nodes: [Array of nodeIds],   edges: [Array of edgeIds] }
+    You can also pass only nodes or edges in selection object.
+    Available options are: {   unselectAll: Boolean,   highlightEdges:
+    Boolean }.
+
+    `setSelection` is a dict with keys:
+
+    - selection (dict; optional)
+
+        `selection` is a dict with keys:
+
+        - nodes (list of strings; optional)
+
+        - edges (list of strings; optional)
+
+    - options (dict; optional)
+
+        `options` is a dict with keys:
+
+        - unselectAll (boolean; optional)
+
+        - highlightEdges (boolean; optional)
+
+- setSize (dict; optional):
+    Write-only property. Pass True value to this property as an output
+    to call the underlying function on the graph. Set the size of the
+    canvas. This is automatically done on a window resize. Returns:
+    None.
+
+    `setSize` is a dict with keys:
+
+    - width (string; optional)
+
+    - height (string; optional)
+
+- showPopup (number; optional):
+    Read-only prop. To use this, make sure that `enableHciEvents` is
+    set to `True`, or that `enableHciEvents` is a list that contains
+    this event type. Fired when the popup (tooltip) is shown. Returns
+    id of item corresponding to popup.
+
+- stabilizationIterationsDone (boolean | number | string | dict | list; optional):
+    Read-only prop. To use this, make sure that `enablePhysicsEvents`
+    is set to `True`, or that `enablePhysicsEvents` is a list that
+    contains this event type. Fired when the 'hidden' stabilization
+    finishes. This does not necessarily mean the network is
+    stabilized; it could also mean that the amount of iterations
+    defined in the options has been reached.
+
+- stabilizationProgress (dict; optional):
+    Read-only prop. To use this, make sure that `enablePhysicsEvents`
+    is set to `True`, or that `enablePhysicsEvents` is a list that
+    contains this event type. Fired when a multiple of the
+    updateInterval number of iterations is reached. This only occurs
+    in the 'hidden' stabilization. Passes an object with properties
+    structured as: {   iterations: Number // iterations so far,
+    total: Number      // total iterations in options }.
+
+- stabilize (number; optional):
+    Function call. You can manually call stabilize at any time. All
+    the stabilization options above are used. You can optionally
+    supply the number of iterations it should do.
+
+- stabilized (dict; optional):
+    Read-only prop. To use this, make sure that `enablePhysicsEvents`
+    is set to `True`, or that `enablePhysicsEvents` is a list that
+    contains this event type. Fired when the network has stabilized or
+    when the stopSimulation() has been called. The amount of
+    iterations it took could be used to tweak the maximum amount of
+    iterations needed to stabilize the network. Passes an object with
+    properties structured as: {   iterations: Number // iterations it
+    took }.
+
+- startSimulation (boolean; optional):
+    Function call. Start the physics simulation. This is normally done
+    whenever needed and is only really useful if you stop the
+    simulation yourself and wish to continue it afterwards.
+
+- startStabilizing (boolean | number | string | dict | list; optional):
+    Read-only prop. To use this, make sure that `enablePhysicsEvents`
+    is set to `True`, or that `enablePhysicsEvents` is a list that
+    contains this event type. Fired when stabilization starts. This is
+    also the case when you drag a node and the physics simulation
+    restarts to stabilize again. Stabilization does not necessarily
+    imply 'without showing'.
+
+- stopSimulation (boolean; optional):
+    Function call. Returns a bounding box for the node including label
+    in the format: {   top: Number,   left: Number,   right: Number,
+    bottom: Number } These values are in canvas space.
+
+- storePositions (boolean; optional):
+    Write-only property. Pass True value to this property as an output
+    to call the underlying function on the graph. When using the
+    vis.DataSet to load your nodes into the network, this method will
+    put the X and Y positions of all nodes into that dataset. If
+    you're loading your nodes from a database and have this
+    dynamically coupled with the DataSet, you can use this to
+    stabilize your network once, then save the positions in that
+    database through the DataSet so the next time you load the nodes,
+    stabilization will be near instantaneous.  If the nodes are still
+    moving and you're using dynamic smooth edges (which is on by
+    default), you can use the option stabilization.onlyDynamicEdges in
+    the physics module to improve initialization time.  This method
+    does not support clustering. At the moment it is not possible to
+    cache positions when using clusters since they cannot be correctly
+    initialized from just the positions.  moveNode(nodeId, Number x,
+    Number y)  getBoundingBox(String nodeId)  getConnectedNodes(String
+    nodeId or edgeId, [String direction])  getConnectedEdges(String
+    nodeId) Returns: None.
+
+- unselectAll (boolean; optional):
+    Function call. Unselect all objects. Does not fire events.
+
+- updateClusteredNode (dict; optional):
+    Function call. Returns nothing. Visible edges between clustered
+    nodes are not the same edge as the ones provided in data.edges
+    passed on network creation With each layer of clustering, copies
+    of the edges between clusters are created and the previous edges
+    are hidden, until the cluster is opened. This method takes an
+    edgeId (ie. a base edgeId from data.edges) and applies the options
+    to it and any edges that were created from it while clustering.
+    Example: network.clustering.updateEdge(originalEdge.id, {color :
+    '#aa0000'}); This would turn the base edge and any subsequent
+    edges red, so when opening clusters the edges will all be the same
+    color.
+
+    `updateClusteredNode` is a dict with keys:
+
+    - clusteredNodeId (string; optional)
+
+    - options (dict; optional)
+
+- updateEdge (dict; optional):
+    Function call. Returns nothing. Visible edges between clustered
+    nodes are not the same edge as the ones provided in data.edges
+    passed on network creation With each layer of clustering, copies
+    of the edges between clusters are created and the previous edges
+    are hidden, until the cluster is opened. This method takes an
+    edgeId (ie. a base edgeId from data.edges) and applies the options
+    to it and any edges that were created from it while clustering.
+    Example: network.clustering.updateEdge(originalEdge.id, {color :
+    '#aa0000'}); This would turn the base edge and any subsequent
+    edges red, so when opening clusters the edges will all be the same
+    color.
+
+    `updateEdge` is a dict with keys:
+
+    - startEdgeId (string; optional)
+
+    - options (dict; optional)
+
+- validateData (boolean; default True):
+    Python-side flag, unused by the component itself. Graphs passed to
+    `data` or `dataColumns` with at least 10000 nodes and edges are
+    checked for duplicate ids, invalid id types and edges pointing at
+    missing nodes when the component is serialised, raising a
+    ValueError listing the problems (see dashvis.validation). Set to
+    False to skip this check.
+
+- zoom (dict; optional):
+    Read-only prop. To use this, make sure that `enableHciEvents` is
+    set to `True`, or that `enableHciEvents` is a list that contains
+    this event type. Fired when the user zooms in or out. The
+    properties tell you which direction the zoom is in. The scale is a
+    number greater than 0, which is the same that you get with
+    network.getScale(). When fired by clicking the zoom in or zoom out
+    navigation buttons, the pointer property of the object passed will
+    be None. Passes an object with properties structured as: {
+    direction: '+'/'-',   scale: Number,   pointer: {x:pointer_x,
+    y:pointer_y} }."""
+    _children_props: typing.List[str] = []
+    _base_nodes = ['children']
+    _namespace = 'dashvis'
+    _type = 'DashNetwork'
+    Data = TypedDict(
+        "Data",
+            {
+            "nodes": NotRequired[typing.Sequence[dict]],
+            "edges": NotRequired[typing.Sequence[dict]]
+        }
+    )
+
+    DataColumnsNodes = TypedDict(
+        "DataColumnsNodes",
+            {
+            "dtype": NotRequired[str],
+            "data": NotRequired[str]
+        }
+    )
+
+    DataColumnsEdges = TypedDict(
+        "DataColumnsEdges",
+            {
+            "dtype": NotRequired[str],
+            "data": NotRequired[str]
+        }
+    )
+
+    DataColumns = TypedDict(
+        "DataColumns",
+            {
+            "nodes": NotRequired[typing.Dict[typing.Union[str, float, int], typing.Union[typing.Sequence, "DataColumnsNodes"]]],
+            "edges": NotRequired[typing.Dict[typing.Union[str, float, int], typing.Union[typing.Sequence, "DataColumnsEdges"]]]
+        }
+    )
+
+    DataDeltaNodes = TypedDict(
+        "DataDeltaNodes",
+            {
+            "add": NotRequired[typing.Sequence[dict]],
+            "update": NotRequired[typing.Sequence[dict]],
+            "remove": NotRequired[typing.Sequence]
+        }
+    )
+
+    DataDeltaEdges = TypedDict(
+        "DataDeltaEdges",
+            {
+            "add": NotRequired[typing.Sequence[dict]],
+            "update": NotRequired[typing.Sequence[dict]],
+            "remove": NotRequired[typing.Sequence]
+        }
+    )
+
+    DataDelta = TypedDict(
+        "DataDelta",
+            {
+            "version": NotRequired[NumberType],
+            "nodes": NotRequired["DataDeltaNodes"],
+            "edges": NotRequired["DataDeltaEdges"]
+        }
+    )
+
+    ExpandRequest = TypedDict(
+        "ExpandRequest",
+            {
+            "nodeIds": NotRequired[typing.Sequence],
+            "expanded": NotRequired[typing.Sequence],
+            "requestId": NotRequired[NumberType]
+        }
+    )
+
+    EventBatch = TypedDict(
+        "EventBatch",
+            {
+            "seq": NotRequired[NumberType],
+            "event": NotRequired[str],
+            "params": NotRequired[typing.Any]
+        }
+    )
+
+    EventRateLimits = TypedDict(
+        "EventRateLimits",
+            {
+            "throttleMs": NotRequired[NumberType],
+            "debounceMs": NotRequired[NumberType]
+        }
+    )
+
+    On = TypedDict(
+        "On",
+            {
+            "event_name": NotRequired[str],
+            "callback": NotRequired[str]
+        }
+    )
+
+    Off = TypedDict(
+        "Off",
+            {
+            "event_name": NotRequired[str],
+            "callback": NotRequired[str]
+        }
+    )
+
+    Once = TypedDict(
+        "Once",
+            {
+            "event_name": NotRequired[str],
+            "callback": NotRequired[str]
+        }
+    )
+
+    CanvasToDOM = TypedDict(
+        "CanvasToDOM",
+            {
+            "x": NotRequired[NumberType],
+            "y": NotRequired[NumberType]
+        }
+    )
+
+    DOMtoCanvas = TypedDict(
+        "DOMtoCanvas",
+            {
+            "x": NotRequired[NumberType],
+            "y": NotRequired[NumberType]
+        }
+    )
+
+    SetSize = TypedDict(
+        "SetSize",
+            {
+            "width": NotRequired[str],
+            "height": NotRequired[str]
+        }
+    )
+
+    Cluster = TypedDict(
+        "Cluster",
+            {
+            "options": NotRequired[typing.Any],
+            "stabilize": NotRequired[bool]
+        }
+    )
+
+    ClusterByConnection = TypedDict(
+        "ClusterByConnection",
+            {
+            "nodeId": NotRequired[str],
+            "options": NotRequired[typing.Any],
+            "stabilize": NotRequired[bool]
+        }
+    )
+
+    ClusterNodesByConnection = TypedDict(
+        "ClusterNodesByConnection",
+            {
+            "nodeIds": NotRequired[typing.Sequence[str]],
+            "options": NotRequired[typing.Any],
+            "stabilize": NotRequired[bool]
+        }
+    )
+
+    ClusterByConnections = TypedDict(
+        "ClusterByConnections",
+            {
+            "nodeIds": NotRequired[typing.Sequence[str]],
+            "options": NotRequired[typing.Sequence[typing.Any]],
+            "stabilize": NotRequired[bool]
+        }
+    )
+
+    ClusterByHubsize = TypedDict(
+        "ClusterByHubsize",
+            {
+            "hubsize": NotRequired[NumberType],
+            "options": NotRequired[typing.Any],
+            "stabilize": NotRequired[bool]
+        }
+    )
+
+    ClusterOutliers = TypedDict(
+        "ClusterOutliers",
+            {
+            "options": NotRequired[typing.Any],
+            "stabilize": NotRequired[bool]
+        }
+    )
+
+    ClusterAssignment = TypedDict(
+        "ClusterAssignment",
+            {
+            "nodeIds": NotRequired[typing.Sequence],
+            "clusters": NotRequired[typing.Sequence],
+            "clusterProperties": NotRequired[dict],
+            "clusterNodeProperties": NotRequired[dict],
+            "clusterEdgeProperties": NotRequired[dict],
+            "idPrefix": NotRequired[str],
+            "stabilize": NotRequired[bool]
+        }
+    )
+
+    ClusterHierarchy = TypedDict(
+        "ClusterHierarchy",
+            {
+            "levels": NotRequired[typing.Sequence[dict]],
+            "scales": NotRequired[typing.Sequence[NumberType]]
+        }
+    )
+
+    FindNode = TypedDict(
+        "FindNode",
+            {
+            "nodeId": NotRequired[typing.Union[str, NumberType]],
+            "result": NotRequired[typing.Sequence[str]]
+        }
+    )
+
+    GetClusteredEdges = TypedDict(
+        "GetClusteredEdges",
+            {
+            "baseEdgeId": NotRequired[str],
+            "result": NotRequired[typing.Sequence[str]]
+        }
+    )
+
+    GetBaseEdges = TypedDict(
+        "GetBaseEdges",
+            {
+            "clusteredEdgeId": NotRequired[str],
+            "result": NotRequired[typing.Sequence[str]]
+        }
+    )
+
+    UpdateEdge = TypedDict(
+        "UpdateEdge",
+            {
+            "startEdgeId": NotRequired[str],
+            "options": NotRequired[dict]
+        }
+    )
+
+    UpdateClusteredNode = TypedDict(
+        "UpdateClusteredNode",
+            {
+            "clusteredNodeId": NotRequired[str],
+            "options": NotRequired[dict]
+        }
+    )
+
+    IsCluster = TypedDict(
+        "IsCluster",
+            {
+            "nodeId": NotRequired[str],
+            "result": NotRequired[bool]
+        }
+    )
+
+    GetNodesInCluster = TypedDict(
+        "GetNodesInCluster",
+            {
+            "clusteredNodeId": NotRequired[str],
+            "result": NotRequired[typing.Sequence[str]]
+        }
+    )
+
+    OpenCluster = TypedDict(
+        "OpenCluster",
+            {
+            "nodeId": NotRequired[str],
+            "options": NotRequired[dict],
+            "stabilize": NotRequired[bool]
+        }
+    )
+
+    GetPositions = TypedDict(
+        "GetPositions",
+            {
+            "nodeIds": NotRequired[typing.Sequence],
+            "format": NotRequired[Literal["object", "compact"]],
+            "result": NotRequired[dict]
+        }
+    )
+
+    GetPosition = TypedDict(
+        "GetPosition",
+            {
+            "nodeId": NotRequired[str],
+            "result": NotRequired[dict]
+        }
+    )
+
+    MoveNode = TypedDict(
+        "MoveNode",
+            {
+            "nodeId": NotRequired[str],
+            "x": NotRequired[NumberType],
+            "y": NotRequired[NumberType]
+        }
+    )
+
+    MoveNodes = TypedDict(
+        "MoveNodes",
+            {
+            "nodeIds": NotRequired[typing.Sequence],
+            "x": NotRequired[typing.Union[typing.Sequence[NumberType], str]],
+            "y": NotRequired[typing.Union[typing.Sequence[NumberType], str]],
+            "result": NotRequired[NumberType]
+        }
+    )
+
+    GetBoundingBox = TypedDict(
+        "GetBoundingBox",
+            {
+            "nodeId": NotRequired[str],
+            "result": NotRequired[dict]
+        }
+    )
+
+    GetConnectedNodes = TypedDict(
+        "GetConnectedNodes",
+            {
+            "nodeId": NotRequired[str],
+            "direction": NotRequired[str],
+            "result": NotRequired[typing.Sequence[NumberType]]
+        }
+    )
+
+    GetConnectedEdges = TypedDict(
+        "GetConnectedEdges",
+            {
+            "nodeId": NotRequired[str],
+            "result": NotRequired[typing.Sequence[str]]
+        }
+    )
+
+    GetNodeAtPosition = TypedDict(
+        "GetNodeAtPosition",
+            {
+            "x": NotRequired[NumberType],
+            "y": NotRequired[NumberType]
+        }
+    )
+
+    GetNodeAt = TypedDict(
+        "GetNodeAt",
+            {
+            "position": NotRequired["GetNodeAtPosition"],
+            "result": NotRequired[typing.Sequence[str]]
+        }
+    )
+
+    GetEdgeAtPosition = TypedDict(
+        "GetEdgeAtPosition",
+            {
+            "x": NotRequired[NumberType],
+            "y": NotRequired[NumberType]
+        }
+    )
+
+    GetEdgeAt = TypedDict(
+        "GetEdgeAt",
+            {
+            "position": NotRequired["GetEdgeAtPosition"],
+            "result": NotRequired[typing.Sequence[str]]
+        }
+    )
+
+    SelectNodes = TypedDict(
+        "SelectNodes",
+            {
+            "nodeIds": NotRequired[typing.Sequence],
+            "highlightEdges": NotRequired[bool]
+        }
+    )
+
+    SelectEdges = TypedDict(
+        "SelectEdges",
+            {
+            "edgeIds": NotRequired[typing.Sequence]
+        }
+    )
+
+    SetSelectionSelection = TypedDict(
+        "SetSelectionSelection",
+            {
+            "nodes": NotRequired[typing.Sequence[str]],
+            "edges": NotRequired[typing.Sequence[str]]
+        }
+    )
+
+    SetSelectionOptions = TypedDict(
+        "SetSelectionOptions",
+            {
+            "unselectAll": NotRequired[bool],
+            "highlightEdges": NotRequired[bool]
+        }
+    )
+
+    SetSelection = TypedDict(
+        "SetSelection",
+            {
+            "selection": NotRequired["SetSelectionSelection"],
+            "options": NotRequired["SetSelectionOptions"]
+        }
+    )
+
+    GetViewPosition = TypedDict(
+        "GetViewPosition",
+            {
+            "x": NotRequired[NumberType],
+            "y": NotRequired[NumberType]
+        }
+    )
+
+    Focus = TypedDict(
+        "Focus",
+            {
+            "nodeId": NotRequired[str],
+            "options": NotRequired[typing.Any]
+        }
+    )
+
+    MoveTo = TypedDict(
+        "MoveTo",
+            {
+            "options": NotRequired[typing.Any]
+        }
+    )
+
+    Fit = TypedDict(
+        "Fit",
+            {
+            "options": NotRequired[typing.Any]
+        }
+    )
+
+    MethodCalls = TypedDict(
+        "MethodCalls",
+            {
+            "method": str,
+            "args": NotRequired[typing.Sequence]
+        }
+    )
+
+    MethodResults = TypedDict(
+        "MethodResults",
+            {
+            "method": NotRequired[str],
+            "result": NotRequired[typing.Any],
+            "error": NotRequired[str]
+        }
+    )
+
+
+    def __init__(
+        self,
+        id: typing.Optional[typing.Union[str, dict]] = None,
+        data: typing.Optional["Data"] = None,
+        dataColumns: typing.Optional["DataColumns"] = None,
+        validateData: typing.Optional[bool] = None,
+        echoData: typing.Optional[bool] = None,
+        dataVersion: typing.Optional[NumberType] = None,
+        dataDelta: typing.Optional["DataDelta"] = None,
+        dataDeltaVersion: typing.Optional[NumberType] = None,
+        expandOnDoubleClick: typing.Optional[bool] = None,
+        expandRequest: typing.Optional["ExpandRequest"] = None,
+        options: typing.Optional[dict] = None,
+        optionsChanged: typing.Optional[typing.Sequence[str]] = None,
+        style: typing.Optional[typing.Any] = None,
+        enableHciEvents: typing.Optional[typing.Union[typing.Sequence[str], bool]] = None,
+        click: typing.Optional[dict] = None,
+        doubleClick: typing.Optional[dict] = None,
+        oncontext: typing.Optional[dict] = None,
+        hold: typing.Optional[dict] = None,
+        release: typing.Optional[dict] = None,
+        select: typing.Optional[dict] = None,
+        selectNode: typing.Optional[dict] = None,
+        selectEdge: typing.Optional[dict] = None,
+        deselectNode: typing.Optional[dict] = None,
+        deselectEdge: typing.Optional[dict] = None,
+        dragStart: typing.Optional[dict] = None,
+        dragging: typing.Optional[dict] = None,
+        dragEnd: typing.Optional[dict] = None,
+        controlNodeDragging: typing.Optional[dict] = None,
+        controlNodeDragEnd: typing.Optional[dict] = None,
+        hoverNode: typing.Optional[dict] = None,
+        blurNode: typing.Optional[dict] = None,
+        hoverEdge: typing.Optional[dict] = None,
+        blurEdge: typing.Optional[dict] = None,
+        zoom: typing.Optional[dict] = None,
+        showPopup: typing.Optional[NumberType] = None,
+        hidePopup: typing.Optional[NumberType] = None,
+        eventBatching: typing.Optional[typing.Union[bool, NumberType]] = None,
+        eventBatch: typing.Optional[typing.Sequence["EventBatch"]] = None,
+        eventFields: typing.Optional[typing.Dict[typing.Union[str, float, int], typing.Sequence[str]]] = None,
+        eventRateLimits: typing.Optional[typing.Dict[typing.Union[str, float, int], "EventRateLimits"]] = None,
+        enablePhysicsEvents: typing.Optional[typing.Union[typing.Sequence[str], bool]] = None,
+        startStabilizing: typing.Optional[typing.Any] = None,
+        stabilizationProgress: typing.Optional[dict] = None,
+        stabilizationIterationsDone: typing.Optional[typing.Any] = None,
+        stabilized: typing.Optional[dict] = None,
+        enableOtherEvents: typing.Optional[typing.Union[typing.Sequence[str], bool]] = None,
+        resize: typing.Optional[dict] = None,
+        initRedraw: typing.Optional[dict] = None,
+        beforeDrawing: typing.Optional[dict] = None,
+        afterDrawing: typing.Optional[dict] = None,
+        animationFinished: typing.Optional[dict] = None,
+        configChange: typing.Optional[dict] = None,
+        destroy: typing.Optional[bool] = None,
+        on: typing.Optional["On"] = None,
+        off: typing.Optional["Off"] = None,
+        once: typing.Optional["Once"] = None,
+        canvasToDOM: typing.Optional["CanvasToDOM"] = None,
+        DOMtoCanvas: typing.Optional["DOMtoCanvas"] = None,
+        redraw: typing.Optional[bool] = None,
+        setSize: typing.Optional["SetSize"] = None,
+        cluster: typing.Optional["Cluster"] = None,
+        clusterByConnection: typing.Optional["ClusterByConnection"] = None,
+        clusterNodesByConnection: typing.Optional["ClusterNodesByConnection"] = None,
+        clusterByConnections: typing.Optional["ClusterByConnections"] = None,
+        clusterByHubsize: typing.Optional["ClusterByHubsize"] = None,
+        clusterOutliers: typing.Optional["ClusterOutliers"] = None,
+        clusterAssignment: typing.Optional["ClusterAssignment"] = None,
+        assignedClusters: typing.Optional[typing.Sequence] = None,
+        clusterHierarchy: typing.Optional["ClusterHierarchy"] = None,
+        clusterLevel: typing.Optional[NumberType] = None,
+        findNode: typing.Optional["FindNode"] = None,
+        getClusteredEdges: typing.Optional["GetClusteredEdges"] = None,
+        getBaseEdges: typing.Optional["GetBaseEdges"] = None,
+        updateEdge: typing.Optional["UpdateEdge"] = None,
+        updateClusteredNode: typing.Optional["UpdateClusteredNode"] = None,
+        isCluster: typing.Optional["IsCluster"] = None,
+        getNodesInCluster: typing.Optional["GetNodesInCluster"] = None,
+        openCluster: typing.Optional["OpenCluster"] = None,
+        getSeed: typing.Optional[typing.Union[str, NumberType]] = None,
+        enableEditMode: typing.Optional[bool] = None,
+        disableEditMode: typing.Optional[bool] = None,
+        addNodeMode: typing.Optional[bool] = None,
+        editNode: typing.Optional[bool] = None,
+        addEdgeMode: typing.Optional[bool] = None,
+        editEdgeMode: typing.Optional[bool] = None,
+        deleteSelected: typing.Optional[bool] = None,
+        getPositions: typing.Optional["GetPositions"] = None,
+        getPosition: typing.Optional["GetPosition"] = None,
+        storePositions: typing.Optional[bool] = None,
+        moveNode: typing.Optional["MoveNode"] = None,
+        moveNodes: typing.Optional["MoveNodes"] = None,
+        getBoundingBox: typing.Optional["GetBoundingBox"] = None,
+        getConnectedNodes: typing.Optional["GetConnectedNodes"] = None,
+        getConnectedEdges: typing.Optional["GetConnectedEdges"] = None,
+        startSimulation: typing.Optional[bool] = None,
+        stopSimulation: typing.Optional[bool] = None,
+        stabilize: typing.Optional[NumberType] = None,
+        getSelection: typing.Optional[dict] = None,
+        getSelectedNodes: typing.Optional[typing.Sequence[typing.Union[str, NumberType]]] = None,
+        getSelectedEdges: typing.Optional[typing.Sequence[typing.Union[str, NumberType]]] = None,
+        getNodeAt: typing.Optional["GetNodeAt"] = None,
+        getEdgeAt: typing.Optional["GetEdgeAt"] = None,
+        selectNodes: typing.Optional["SelectNodes"] = None,
+        selectEdges: typing.Optional["SelectEdges"] = None,
+        setSelection: typing.Optional["SetSelection"] = None,
+        unselectAll: typing.Optional[bool] = None,
+        getScale: typing.Optional[NumberType] = None,
+        getViewPosition: typing.Optional["GetViewPosition"] = None,
+        focus: typing.Optional["Focus"] = None,
+        moveTo: typing.Optional["MoveTo"] = None,
+        fit: typing.Optional["Fit"] = None,
+        releaseNode: typing.Optional[bool] = None,
+        methodCalls: typing.Optional[typing.Sequence["MethodCalls"]] = None,
+        methodResults: typing.Optional[typing.Sequence["MethodResults"]] = None,
+        getOptionsFromConfigurator: typing.Optional[dict] = None,
+        debug: typing.Optional[bool] = None,
+        debugInfo: typing.Optional[dict] = None,
+        **kwargs
+    ):
+        self._prop_names = ['id', 'DOMtoCanvas', 'addEdgeMode', 'addNodeMode', 'afterDrawing', 'animationFinished', 'assignedClusters', 'beforeDrawing', 'blurEdge', 'blurNode', 'canvasToDOM', 'click', 'cluster', 'clusterAssignment', 'clusterByConnection', 'clusterByConnections', 'clusterByHubsize', 'clusterHierarchy', 'clusterLevel', 'clusterNodesByConnection', 'clusterOutliers', 'configChange', 'controlNodeDragEnd', 'controlNodeDragging', 'data', 'dataColumns', 'dataDelta', 'dataDeltaVersion', 'dataVersion', 'debug', 'debugInfo', 'deleteSelected', 'deselectEdge', 'deselectNode', 'destroy', 'disableEditMode', 'doubleClick', 'dragEnd', 'dragStart', 'dragging', 'echoData', 'editEdgeMode', 'editNode', 'enableEditMode', 'enableHciEvents', 'enableOtherEvents', 'enablePhysicsEvents', 'eventBatch', 'eventBatching', 'eventFields', 'eventRateLimits', 'expandOnDoubleClick', 'expandRequest', 'findNode', 'fit', 'focus', 'getBaseEdges', 'getBoundingBox', 'getClusteredEdges', 'getConnectedEdges', 'getConnectedNodes', 'getEdgeAt', 'getNodeAt', 'getNodesInCluster', 'getOptionsFromConfigurator', 'getPosition', 'getPositions', 'getScale', 'getSeed', 'getSelectedEdges', 'getSelectedNodes', 'getSelection', 'getViewPosition', 'hidePopup', 'hold', 'hoverEdge', 'hoverNode', 'initRedraw', 'isCluster', 'methodCalls', 'methodResults', 'moveNode', 'moveNodes', 'moveTo', 'off', 'on', 'once', 'oncontext', 'openCluster', 'options', 'optionsChanged', 'redraw', 'release', 'releaseNode', 'resize', 'select', 'selectEdge', 'selectEdges', 'selectNode', 'selectNodes', 'setSelection', 'setSize', 'showPopup', 'stabilizationIterationsDone', 'stabilizationProgress', 'stabilize', 'stabilized', 'startSimulation', 'startStabilizing', 'stopSimulation', 'storePositions', 'style', 'unselectAll', 'updateClusteredNode', 'updateEdge', 'validateData', 'zoom']
+        self._valid_wildcard_attributes =            []
+        self.available_properties = ['id', 'DOMtoCanvas', 'addEdgeMode', 'addNodeMode', 'afterDrawing', 'animationFinished', 'assignedClusters', 'beforeDrawing', 'blurEdge', 'blurNode', 'canvasToDOM', 'click', 'cluster', 'clusterAssignment', 'clusterByConnection', 'clusterByConnections', 'clusterByHubsize', 'clusterHierarchy', 'clusterLevel', 'clusterNodesByConnection', 'clusterOutliers', 'configChange', 'controlNodeDragEnd', 'controlNodeDragging', 'data', 'dataColumns', 'dataDelta', 'dataDeltaVersion', 'dataVersion', 'debug', 'debugInfo', 'deleteSelected', 'deselectEdge', 'deselectNode', 'destroy', 'disableEditMode', 'doubleClick', 'dragEnd', 'dragStart', 'dragging', 'echoData', 'editEdgeMode', 'editNode', 'enableEditMode', 'enableHciEvents', 'enableOtherEvents', 'enablePhysicsEvents', 'eventBatch', 'eventBatching', 'eventFields', 'eventRateLimits', 'expandOnDoubleClick', 'expandRequest', 'findNode', 'fit', 'focus', 'getBaseEdges', 'getBoundingBox', 'getClusteredEdges', 'getConnectedEdges', 'getConnectedNodes', 'getEdgeAt', 'getNodeAt', 'getNodesInCluster', 'getOptionsFromConfigurator', 'getPosition', 'getPositions', 'getScale', 'getSeed', 'getSelectedEdges', 'getSelectedNodes', 'getSelection', 'getViewPosition', 'hidePopup', 'hold', 'hoverEdge', 'hoverNode', 'initRedraw', 'isCluster', 'methodCalls', 'methodResults', 'moveNode', 'moveNodes', 'moveTo', 'off', 'on', 'once', 'oncontext', 'openCluster', 'options', 'optionsChanged', 'redraw', 'release', 'releaseNode', 'resize', 'select', 'selectEdge', 'selectEdges', 'selectNode', 'selectNodes', 'setSelection', 'setSize', 'showPopup', 'stabilizationIterationsDone', 'stabilizationProgress', 'stabilize', 'stabilized', 'startSimulation', 'startStabilizing', 'stopSimulation', 'storePositions', 'style', 'unselectAll', 'updateClusteredNode', 'updateEdge', 'validateData', 'zoom']
+        self.available_wildcard_properties =            []
+        _explicit_args = kwargs.pop('_explicit_args')
+        _locals = locals()
+        _locals.update(kwargs)  # For wildcard attrs and excess named props
+        args = {k: _locals[k] for k in _explicit_args}
+
+        for k in ['id']:
+            if k not in args:
+                raise TypeError(
+                    'Required argument `' + k + '` was not specified.')
+
+        super(DashNetwork, self).__init__(**args)
+
+setattr(DashNetwork, "__init__", _explicitize_args(DashNetwork.__init__))
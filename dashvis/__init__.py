@@ -9,6 +9,8 @@ import dash as _dash
 # noinspection PyUnresolvedReferences
 from ._imports_ import *
 from ._imports_ import __all__
+from .graph_data import GraphData
+from . import validation as _validation
 
 if not hasattr(_dash, '__plotly_dash') and not hasattr(_dash, 'development'):
     print('Dash was not successfully imported. '
@@ -87,3 +89,6 @@ _css_dist = []
 for _component in __all__:
     setattr(locals()[_component], '_js_dist', _js_dist)
     setattr(locals()[_component], '_css_dist', _css_dist)
+
+# Check large graphs for duplicate ids and dangling edges before they reach the browser
+_validation.install(DashNetwork)
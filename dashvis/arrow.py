@@ -0,0 +1,100 @@
+"""
+Apache Arrow ingestion for DashNetwork graphs.
+
+Edge and node tables are filtered and sampled on the Arrow side, and their columns are handed to
+GraphData as NumPy views without copying where the Arrow layout allows it (single chunk, no nulls,
+numeric type). Requires pyarrow, which is imported on first use.
+
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+    from dashvis.arrow import from_arrow
+
+    graph = from_arrow(pq.read_table('edges.parquet'), source='src', target='dst',
+                       edge_filter=pc.field('weight') > 0.5, sample=100000, seed=0)
+    network = DashNetwork(id='network', dataColumns=graph.to_columns())
+"""
+import numpy as np
+
+from .graph_data import GraphData
+
+__all__ = ['from_arrow', 'to_numpy']
+
+
+def to_numpy(column):
+    """
+    Returns an Arrow array or chunked array as a NumPy array. Single-chunk numeric columns without
+    nulls are returned as a read-only view of the Arrow buffer; other columns are converted, nulls
+    becoming NaN (numbers) or None (other types).
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if isinstance(column, pa.ChunkedArray):
+        column = column.chunk(0) if column.num_chunks == 1 else column.combine_chunks()
+    if pa.types.is_dictionary(column.type):
+        column = pc.dictionary_decode(column)
+    numeric = pa.types.is_integer(column.type) or pa.types.is_floating(column.type)
+    if numeric and column.null_count == 0:
+        return column.to_numpy(zero_copy_only=True)
+    return column.to_numpy(zero_copy_only=False)
+
+
+def _sample(table, sample, seed):
+    # `sample` is a number of rows (an integer) or a fraction of the rows (a float), so that 1 keeps one
+    # row and 1.0 all of them
+    if isinstance(sample, (float, np.floating)):
+        if not 0 < sample <= 1:
+            raise ValueError('A sample fraction must be in (0, 1], not {!r}; give a number of edges as an '
+                             'integer'.format(sample))
+        count = int(round(sample * table.num_rows))
+    elif isinstance(sample, (int, np.integer)) and not isinstance(sample, bool) and sample >= 0:
+        count = int(sample)
+    else:
+        raise ValueError('sample must be a number of edges or a fraction in (0, 1], not {!r}'.format(sample))
+    if count >= table.num_rows:
+        return table
+    rows = np.random.default_rng(seed).choice(table.num_rows, size=count, replace=False)
+    rows.sort()
+    return table.take(rows)
+
+
+def from_arrow(edges, nodes=None, source='from', target='to', node_id='id', edge_filter=None, node_filter=None,
+               sample=None, seed=None, edge_columns=None, node_columns=None):
+    """
+    Builds a GraphData from `edges` and optionally `nodes`, given as pyarrow Tables.
+
+    `edge_filter` and `node_filter` are pyarrow.compute expressions applied with Table.filter. Edges
+    whose endpoints are not in the (filtered) node table are dropped. `sample` keeps a random subset
+    of the remaining edges, either a number of edges (an integer) or a fraction in (0, 1] (a float),
+    drawn with `seed`.
+    Without a node table, nodes are the distinct edge endpoints.
+    `edge_columns` and `node_columns` select the attribute columns to keep, by default all of them.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    if edge_filter is not None:
+        edges = edges.filter(edge_filter)
+    if nodes is not None:
+        if node_filter is not None:
+            nodes = nodes.filter(node_filter)
+        node_ids = nodes[node_id]
+        edges = edges.filter(pc.and_(pc.is_in(edges[source], value_set=node_ids.combine_chunks()),
+                                     pc.is_in(edges[target], value_set=node_ids.combine_chunks())))
+    if sample is not None:
+        edges = _sample(edges, sample, seed)
+
+    if edge_columns is None:
+        edge_columns = [name for name in edges.column_names if name not in (source, target)]
+    edge_data = {name: to_numpy(edges[name]) for name in [source, target] + list(edge_columns)}
+
+    if nodes is None:
+        endpoints = pa.chunked_array(edges[source].chunks + edges[target].chunks,
+                                     type=edges.schema.field(source).type)
+        node_data = {node_id: to_numpy(pc.unique(endpoints))}
+    else:
+        if node_columns is None:
+            node_columns = [name for name in nodes.column_names if name != node_id]
+        node_data = {name: to_numpy(nodes[name]) for name in [node_id] + list(node_columns)}
+
+    return GraphData(node_data, edge_data, node_id=node_id, source=source, target=target)
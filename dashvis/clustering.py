@@ -0,0 +1,247 @@
+"""
+Server-side clustering for DashNetwork graphs.
+
+The functions below label every node with a cluster using vectorised operations over the edge
+arrays, and cluster_assignment turns the labels into a value for the DashNetwork `clusterAssignment`
+property, which makes all the clusters in one pass in the browser. No joinCondition is evaluated
+on the client.
+
+    from dashvis import clustering
+
+    labels = clustering.label_propagation(data, seed=0)
+    network = DashNetwork(id='network', data=data, clusterAssignment=clustering.cluster_assignment(data, labels))
+
+`graph` arguments are either a DashNetwork `data` dict or a GraphData. Labels are integer arrays with
+one entry per node, -1 marking nodes left out of every cluster.
+"""
+import numpy as np
+
+from . import layout as _layout
+from .graph_data import GraphData, _factorize, _missing
+
+__all__ = ['attribute_clusters', 'cluster_assignment', 'cluster_hierarchy', 'component_clusters', 'hub_clusters',
+           'label_propagation']
+
+
+def _edge_index(graph):
+    if isinstance(graph, GraphData):
+        return graph.edge_index()
+    return _layout.edge_index(graph)
+
+
+def _undirected(sources, targets):
+    # Every edge in both directions, as (heads, tails)
+    return np.concatenate([sources, targets]), np.concatenate([targets, sources])
+
+
+def _relabel(labels, min_size=1):
+    """Renumbers labels 0..k-1 in order of first node, dropping clusters smaller than `min_size`."""
+    labels = np.asarray(labels, dtype=np.int64)
+    clustered = labels >= 0
+    if not clustered.any():
+        return np.full(len(labels), -1, dtype=np.int64)
+    _, first, inverse, counts = np.unique(labels[clustered], return_index=True, return_inverse=True,
+                                          return_counts=True)
+    order = np.argsort(first)
+    kept = counts[order] >= min_size
+    rank = np.full(len(first), -1, dtype=np.int64)
+    rank[order[kept]] = np.arange(kept.sum())
+    result = np.full(len(labels), -1, dtype=np.int64)
+    result[clustered] = rank[inverse.reshape(-1)]
+    return result
+
+
+def component_clusters(graph, min_size=2):
+    """Labels the connected components of at least `min_size` nodes."""
+    ids, sources, targets = _edge_index(graph)
+    return _relabel(_layout.connected_components(len(ids), sources, targets), min_size)
+
+
+def hub_clusters(graph, hubsize=None):
+    """
+    Labels one cluster per hub, a node with at least `hubsize` edges, holding the hub and its
+    neighbours which are not hubs themselves. Neighbours of several hubs join the one with the most
+    edges. As in vis.js clusterByHubsize, `hubsize` defaults to the mean degree plus twice its
+    standard deviation.
+    """
+    ids, sources, targets = _edge_index(graph)
+    return _relabel(_hub_labels(len(ids), sources, targets, hubsize))
+
+
+def _hub_labels(node_count, sources, targets, hubsize=None):
+    heads, tails = _undirected(sources, targets)
+    degree = np.bincount(heads, minlength=node_count)
+    if hubsize is None:
+        hubsize = degree.mean() + 2 * degree.std() if node_count else 0
+    hub = degree >= max(hubsize, 1)
+
+    labels = np.full(node_count, -1, dtype=np.int64)
+    labels[hub] = np.flatnonzero(hub)
+    spokes = hub[heads] & ~hub[tails]
+    heads, tails = heads[spokes], tails[spokes]
+    # For every neighbour, the first of its hubs ordered by decreasing degree
+    order = np.lexsort((-degree[heads], tails))
+    neighbours, first = np.unique(tails[order], return_index=True)
+    labels[neighbours] = heads[order][first]
+    return labels
+
+
+def attribute_clusters(graph, attribute, min_size=2):
+    """Labels one cluster per distinct value of the node `attribute`, nodes without it being left out."""
+    if isinstance(graph, GraphData):
+        values = graph.nodes[attribute]
+    else:
+        values = np.array([node.get(attribute) for node in graph.get('nodes', [])], dtype=object)
+    labels = np.full(len(values), -1, dtype=np.int64)
+    missing = _missing(values)
+    present = np.ones(len(values), dtype=bool) if missing is None else ~missing
+    if present.any():
+        labels[present] = np.asarray(_factorize(values[present])[1]).reshape(-1)
+    return _relabel(labels, min_size)
+
+
+def _run_starts(values):
+    # Indices where a run of equal values starts in a sorted array
+    starts = np.empty(len(values), dtype=bool)
+    starts[:1] = True
+    np.not_equal(values[1:], values[:-1], out=starts[1:])
+    return starts
+
+
+def label_propagation(graph, max_iterations=30, tolerance=1e-3, min_size=2, seed=None):
+    """
+    Detects communities by label propagation: in every round, each node takes the label most frequent
+    among its neighbours, keeping its own label on ties and breaking other ties with a random priority
+    of labels (drawn with `seed`) shared by all nodes, which avoids the oscillations of synchronous updates.
+    Stops once fewer than a `tolerance` fraction of the nodes change label, or after `max_iterations`
+    rounds.
+    """
+    ids, sources, targets = _edge_index(graph)
+    return _relabel(_propagated_labels(len(ids), sources, targets, max_iterations, tolerance, seed), min_size)
+
+
+def _propagated_labels(node_count, sources, targets, max_iterations=30, tolerance=1e-3, seed=None):
+    heads, tails = _undirected(sources, targets)
+    rng = np.random.default_rng(seed)
+    labels = np.arange(node_count, dtype=np.int64)
+    if len(heads) == 0:
+        return labels
+
+    for _ in range(max_iterations):
+        # Count every (node, neighbour label) pair through a single sorted integer key
+        keys = np.sort(heads * node_count + labels[tails])
+        starts = np.flatnonzero(_run_starts(keys))
+        counts = np.diff(np.append(starts, len(keys)))
+        nodes, candidates = np.divmod(keys[starts], node_count)
+
+        # Best scoring candidate of every node. The own label wins ties, other ties go to the label with the
+        # highest priority, drawn for every round but shared by all nodes so that neighbours agree
+        priority = rng.random(node_count)
+        score = counts + 0.5 * (candidates == labels[nodes]) + 0.25 * priority[candidates]
+        node_starts = _run_starts(nodes)
+        best_score = np.maximum.reduceat(score, np.flatnonzero(node_starts))
+        winners = score == best_score[np.cumsum(node_starts) - 1]
+        best = labels.copy()
+        best[nodes[winners]] = candidates[winners]
+
+        changed = np.count_nonzero(best != labels)
+        labels = best
+        if changed <= tolerance * node_count:
+            break
+    return labels
+
+
+def cluster_assignment(graph, labels, label='{size} nodes', properties=None, cluster_node_properties=None,
+                       cluster_edge_properties=None, min_size=2, stabilize=False):
+    """
+    Builds a value for the DashNetwork `clusterAssignment` property from node `labels`.
+
+    Clusters of fewer than `min_size` nodes are left out. Every cluster node gets a label formatted
+    from `label` with its `cluster` number and `size`, and the further properties given for its cluster
+    number in the `properties` dict. `cluster_node_properties` and `cluster_edge_properties` apply to
+    every cluster. The cluster node ids are 'cluster:' followed by the cluster number.
+    """
+    ids = _edge_index(graph)[0]
+    labels = np.asarray(labels, dtype=np.int64)
+    sizes = np.bincount(labels[labels >= 0], minlength=1)
+    clustered = np.flatnonzero((labels >= 0) & (sizes[np.maximum(labels, 0)] >= min_size))
+    cluster_properties = {}
+    for cluster in np.unique(labels[clustered]).tolist():
+        size = int(sizes[cluster])
+        cluster_properties[cluster] = dict({'label': label.format(cluster=cluster, size=size)},
+                                           **(properties or {}).get(cluster, {}))
+    return {
+        'nodeIds': [ids[i] for i in clustered.tolist()],
+        'clusters': labels[clustered].tolist(),
+        'clusterProperties': cluster_properties,
+        'clusterNodeProperties': cluster_node_properties or {},
+        'clusterEdgeProperties': cluster_edge_properties or {},
+        'stabilize': stabilize,
+    }
+
+
+def cluster_hierarchy(graph, max_levels=3, scales=None, method='label_propagation', min_reduction=0.2, min_nodes=10,
+                      label='{size} nodes', cluster_node_properties=None, cluster_edge_properties=None, seed=None):
+    """
+    Builds a value for the DashNetwork `clusterHierarchy` property by coarsening the graph repeatedly.
+
+    Every level clusters the nodes of the level below with `method` ('label_propagation' or 'hubs'),
+    then contracts the clusters into single nodes joined by the edges between them. Coarsening stops
+    after `max_levels` levels, once a level would remove less than a `min_reduction` fraction of the
+    nodes, or before a level would leave fewer than `min_nodes` nodes to show. Cluster `label`s are
+    formatted with their `cluster` number, `level` and `size`, the number of graph nodes they hold,
+    which is also set as their vis.js `value`.
+
+    `scales` gives the zoom scale below which each level is shown, in decreasing order. It defaults
+    to halving from 0.5, so the first level is clustered below 50% zoom, the second below 25% and so on.
+    """
+    if method not in ('label_propagation', 'hubs'):
+        raise ValueError('Unknown clustering method {!r}'.format(method))
+    ids, sources, targets = _edge_index(graph)
+    current_ids = list(ids)
+    # Number of graph nodes held by every node of the current level
+    weights = np.ones(len(ids), dtype=np.int64)
+    levels = []
+
+    for level in range(1, max_levels + 1):
+        node_count = len(current_ids)
+        if method == 'hubs':
+            labels = _hub_labels(node_count, sources, targets)
+        else:
+            labels = _propagated_labels(node_count, sources, targets, seed=seed)
+        labels = _relabel(labels, min_size=2)
+        clustered = labels >= 0
+        cluster_count = int(labels.max()) + 1 if clustered.any() else 0
+        unclustered = np.flatnonzero(~clustered)
+        next_count = cluster_count + len(unclustered)
+        if cluster_count == 0 or next_count > (1 - min_reduction) * node_count or next_count < min_nodes:
+            break
+
+        sizes = np.bincount(labels[clustered], weights=weights[clustered], minlength=cluster_count).astype(np.int64)
+        prefix = 'cluster:{}:'.format(level)
+        levels.append({
+            'nodeIds': [current_ids[i] for i in np.flatnonzero(clustered).tolist()],
+            'clusters': labels[clustered].tolist(),
+            'idPrefix': prefix,
+            'clusterProperties': {cluster: {'label': label.format(cluster=cluster, level=level, size=size),
+                                            'value': size}
+                                  for cluster, size in enumerate(sizes.tolist())},
+            'clusterNodeProperties': cluster_node_properties or {},
+            'clusterEdgeProperties': cluster_edge_properties or {},
+        })
+
+        # Contract the clusters: they come first in the next level, followed by the unclustered nodes
+        position = np.empty(node_count, dtype=np.int64)
+        position[clustered] = labels[clustered]
+        position[unclustered] = cluster_count + np.arange(len(unclustered))
+        low = np.minimum(position[sources], position[targets])
+        high = np.maximum(position[sources], position[targets])
+        pairs = np.unique(low[low != high] * next_count + high[low != high])
+        sources, targets = np.divmod(pairs, next_count)
+        current_ids = [prefix + str(cluster) for cluster in range(cluster_count)] + \
+            [current_ids[i] for i in unclustered.tolist()]
+        weights = np.concatenate([sizes, weights[unclustered]])
+
+    if scales is None:
+        scales = [0.5 ** level for level in range(1, len(levels) + 1)]
+    return {'levels': levels, 'scales': [float(scale) for scale in scales][:len(levels)]}
@@ -0,0 +1,97 @@
+"""
+Columnar graph payloads for the DashNetwork `dataColumns` property.
+
+Each node and edge attribute is sent once as a column instead of as a key repeated in every record,
+and numeric columns are packed as base64 typed arrays, which the component expands in the browser.
+
+    from dashvis.columns import data_columns
+
+    network = DashNetwork(id='network', dataColumns=data_columns(
+        nodes={'id': ids, 'label': labels, 'group': groups},  # NumPy arrays, lists or a DataFrame
+        edges={'from': sources, 'to': targets},
+    ))
+"""
+import base64
+
+import numpy as np
+
+__all__ = ['data_columns', 'encode_column']
+
+# Integers beyond this cannot be represented exactly by JavaScript numbers
+_MAX_SAFE_INTEGER = 2 ** 53 - 1
+
+
+def _typed(array, dtype):
+    data = np.ascontiguousarray(array, dtype=np.dtype(dtype).newbyteorder('<')).tobytes()
+    return {'dtype': dtype, 'data': base64.b64encode(data).decode('ascii')}
+
+
+def _integer_dtype(array):
+    # Narrowest dtype the component can decode which holds every value exactly
+    if array.dtype.itemsize <= 4:
+        return array.dtype.name
+    if len(array) == 0:
+        return 'int32'
+    low, high = array.min(), array.max()
+    if low >= np.iinfo(np.int32).min and high <= np.iinfo(np.int32).max:
+        return 'int32'
+    if low >= 0 and high <= np.iinfo(np.uint32).max:
+        return 'uint32'
+    if low >= -_MAX_SAFE_INTEGER and high <= _MAX_SAFE_INTEGER:
+        return 'float64'
+    return None
+
+
+def encode_column(values):
+    """
+    Encodes one column of `values` (a NumPy array, pandas Series or list) for `dataColumns`.
+
+    Integer and float columns become typed columns, integers being narrowed to 32 bits when they fit.
+    Other columns become lists, with None and NaN replaced by None so that the attribute is left out
+    of the matching records.
+    """
+    array = np.asarray(values)
+    kind = array.dtype.kind
+    if kind in 'iu':
+        dtype = _integer_dtype(array)
+        if dtype is not None:
+            return _typed(array, dtype)
+        return array.tolist()
+    if kind == 'f':
+        return _typed(array, 'float64' if array.dtype.itemsize > 4 else 'float32')
+    if kind == 'M':
+        return np.datetime_as_string(array).tolist()
+    if kind == 'O':
+        if hasattr(values, 'isna'):
+            # pandas, including the nullable dtypes whose pd.NA cannot be compared
+            missing = np.asarray(values.isna())
+        else:
+            missing = np.equal(array, None) | np.not_equal(array, array)
+        if missing.any():
+            array = array.copy()
+            array[missing] = None
+    return array.tolist()
+
+
+def _encode_columns(columns, name):
+    if columns is None:
+        return {}
+    encoded = {}
+    length = None
+    for key, values in columns.items():
+        column_length = len(values)
+        if length is not None and column_length != length:
+            raise ValueError('{} column {!r} has {} values, expected {}'.format(name, key, column_length, length))
+        length = column_length
+        encoded[str(key)] = encode_column(values)
+    return encoded
+
+
+def data_columns(nodes=None, edges=None):
+    """
+    Builds a value for the DashNetwork `dataColumns` property.
+
+    `nodes` and `edges` map attribute names (id, label, group, from, to...) to columns of equal length,
+    given as a dict of arrays / lists or as a pandas DataFrame.
+    """
+    return {'nodes': _encode_columns(nodes, 'Node'), 'edges': _encode_columns(edges, 'Edge')}
@@ -0,0 +1,331 @@
+"""
+Graph data sources answering paged, filtered and neighbourhood queries with DashNetwork payloads.
+
+Callbacks query a source for the part of the graph to show instead of holding the whole graph, and every
+query returns a value for the DashNetwork `data` property. Adapters are provided for graphs held in
+memory (MemorySource), NetworkX graphs (NetworkXSource), pandas DataFrames (DataFrameSource) and SQLite
+databases (SQLiteSource), and other stores can be plugged in by subclassing DataSource.
+
+    from dashvis.data_sources import SQLiteSource
+
+    source = SQLiteSource('graph.db', nodes_table='people', edges_table='knows')
+
+    @app.callback(Output('network', 'data'), Input('page', 'value'), Input('team', 'value'))
+    def show_page(page, team):
+        return source.page(page, size=500, where={'team': team})
+
+Filters (`where`) map node attributes to a value, or to a list, tuple or set of accepted values.
+Nodes and edges are returned as records keyed by id, from and to; missing attributes are left out.
+"""
+import json
+import math
+import sqlite3
+from abc import ABC, abstractmethod
+from itertools import islice
+
+import numpy as np
+
+from .graph_data import GraphData, _missing
+from .graph_index import DIRECTIONS, GraphIndex
+
+__all__ = ['DataFrameSource', 'DataSource', 'MemorySource', 'NetworkXSource', 'SQLiteSource']
+
+
+def _accepted(value):
+    # Filter values as a collection of accepted values
+    return value if isinstance(value, (list, tuple, set, frozenset)) else [value]
+
+
+def _present(value):
+    return value is not None and not (isinstance(value, float) and math.isnan(value))
+
+
+def _matches(record, where):
+    return all(record.get(key) in _accepted(value) for key, value in where.items())
+
+
+def _check_direction(direction):
+    if direction not in DIRECTIONS:
+        raise ValueError('direction must be one of {}, not {!r}'.format(', '.join(DIRECTIONS), direction))
+
+
+class DataSource(ABC):
+    """
+    Base class of the graph data sources.
+
+    Adapters implement the abstract methods nodes, node_records, count, neighbours and edges_between,
+    and cannot be created without them. The payload queries page, subgraph and neighbourhood are built
+    on these, and adapters may override them with faster versions.
+    """
+
+    @abstractmethod
+    def nodes(self, where=None, offset=0, limit=None):
+        """Returns the records of the nodes matching `where`, skipping `offset` of them and keeping `limit` at most."""
+
+    @abstractmethod
+    def node_records(self, node_ids):
+        """Returns the records of the nodes `node_ids` which exist, in the order given."""
+
+    @abstractmethod
+    def count(self, where=None):
+        """Returns the number of nodes matching `where`."""
+
+    @abstractmethod
+    def neighbours(self, node_ids, direction='both'):
+        """Returns the ids of the nodes joined by an edge to any of `node_ids`, following edges in `direction`."""
+
+    @abstractmethod
+    def edges_between(self, node_ids):
+        """Returns the records of the edges whose ends are both in `node_ids`."""
+
+    def page(self, number=0, size=100, where=None):
+        """
+        Returns page `number` (from 0) of `size` nodes matching `where`, with the edges between them, as
+        a value for the DashNetwork `data` property. Pages follow the order of the nodes in the source.
+        """
+        nodes = self.nodes(where, offset=number * size, limit=size)
+        return {'nodes': nodes, 'edges': self.edges_between([node['id'] for node in nodes])}
+
+    def subgraph(self, node_ids):
+        """Returns the nodes `node_ids` and the edges between them as a value for the DashNetwork `data` property."""
+        nodes = self.node_records(node_ids)
+        return {'nodes': nodes, 'edges': self.edges_between([node['id'] for node in nodes])}
+
+    def neighbourhood_ids(self, node_ids, k=1, direction='both', max_nodes=None):
+        """
+        Returns the ids of the nodes at most `k` edges away from `node_ids`, following edges in
+        `direction`, ordered by distance and cut at `max_nodes`.
+        """
+        found = list(dict.fromkeys(node_ids))
+        seen = set(found)
+        frontier = found
+        for _ in range(k):
+            if not frontier or (max_nodes is not None and len(found) >= max_nodes):
+                break
+            frontier = [node_id for node_id in self.neighbours(frontier, direction) if node_id not in seen]
+            seen.update(frontier)
+            found += frontier
+        return found if max_nodes is None else found[:max_nodes]
+
+    def neighbourhood(self, node_ids, k=1, direction='both', max_nodes=None):
+        """
+        Returns the subgraph induced by the nodes at most `k` edges away from `node_ids` as a value for the
+        DashNetwork `data` property. See neighbourhood_ids.
+        """
+        return self.subgraph(self.neighbourhood_ids(node_ids, k, direction, max_nodes))
+
+
+class MemorySource(DataSource):
+    """
+    Source over a DashNetwork `data` dict, a GraphData or a GraphIndex held in memory. Neighbourhoods
+    are expanded through the GraphIndex, which is built once.
+    """
+
+    def __init__(self, graph):
+        self.index = graph if isinstance(graph, GraphIndex) else GraphIndex(graph)
+
+    def _known(self, node_ids):
+        # The ids of `node_ids` held by the index, as other sources ignore unknown ids too
+        return [node_id for node_id in node_ids if node_id in self.index]
+
+    def _rows(self, where):
+        # Positions of the nodes matching `where`
+        table = self.index.node_table
+        if not where:
+            return np.arange(self.index.node_count)
+        if isinstance(table, list):
+            return np.fromiter((i for i, node in enumerate(table) if _matches(node, where)), dtype=np.int64)
+        selected = np.ones(self.index.node_count, dtype=bool)
+        for key, value in where.items():
+            if key not in table:
+                return np.zeros(0, dtype=np.int64)
+            column = table[key]
+            selected &= np.isin(column, list(_accepted(value)))
+            missing = _missing(column)
+            if missing is not None and None in _accepted(value):
+                selected |= missing
+        return np.flatnonzero(selected)
+
+    def nodes(self, where=None, offset=0, limit=None):
+        rows = self._rows(where)[offset:None if limit is None else offset + limit]
+        return self.index.records(rows, np.zeros(0, dtype=np.int64))[0]
+
+    def node_records(self, node_ids):
+        rows = self.index.positions(self._known(node_ids))
+        return self.index.records(rows, np.zeros(0, dtype=np.int64))[0]
+
+    def count(self, where=None):
+        return len(self._rows(where))
+
+    def neighbours(self, node_ids, direction='both'):
+        known = self._known(node_ids)
+        return self.index.k_hop(known, k=1, direction=direction, include_seeds=False)
+
+    def edges_between(self, node_ids):
+        known = self._known(node_ids)
+        return self.index.records(np.zeros(0, dtype=np.int64), self.index.edge_rows(known))[1]
+
+    def neighbourhood_ids(self, node_ids, k=1, direction='both', max_nodes=None):
+        known = self._known(node_ids)
+        return self.index.k_hop(known, k, direction, max_nodes)
+
+
+class DataFrameSource(MemorySource):
+    """
+    Source over pandas DataFrames of nodes and edges (see GraphData for the arguments). Filters are
+    evaluated on the node columns with vectorised comparisons.
+    """
+
+    def __init__(self, nodes, edges=None, node_id='id', source='from', target='to'):
+        super().__init__(GraphData(nodes, edges, node_id=node_id, source=source, target=target))
+
+
+class NetworkXSource(DataSource):
+    """
+    Source over a NetworkX graph. Node and edge attributes become record properties, and pages follow
+    the insertion order of the nodes. Only edges leaving nodes are followed with direction 'out', only
+    edges entering them with 'in'; undirected graphs treat every edge as both.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+
+    def _record(self, node_id, attributes):
+        return dict({key: value for key, value in attributes.items() if _present(value)}, id=node_id)
+
+    def nodes(self, where=None, offset=0, limit=None):
+        records = (self._record(node_id, attributes) for node_id, attributes in self.graph.nodes(data=True))
+        if where:
+            records = (record for record in records if _matches(record, where))
+        return list(islice(records, offset, None if limit is None else offset + limit))
+
+    def node_records(self, node_ids):
+        nodes = self.graph.nodes
+        return [self._record(node_id, nodes[node_id]) for node_id in node_ids if node_id in nodes]
+
+    def count(self, where=None):
+        return len(self.nodes(where)) if where else self.graph.number_of_nodes()
+
+    def neighbours(self, node_ids, direction='both'):
+        _check_direction(direction)
+        graph = self.graph
+        directed = graph.is_directed()
+        found = {}
+        for node_id in node_ids:
+            if node_id not in graph:
+                continue
+            if not directed:
+                found.update(dict.fromkeys(graph.neighbors(node_id)))
+                continue
+            if direction in ('both', 'out'):
+                found.update(dict.fromkeys(graph.successors(node_id)))
+            if direction in ('both', 'in'):
+                found.update(dict.fromkeys(graph.predecessors(node_id)))
+        return list(found)
+
+    def edges_between(self, node_ids):
+        edges = []
+        for source, target, attributes in self.graph.subgraph(node_ids).edges(data=True):
+            record = {key: value for key, value in attributes.items() if _present(value)}
+            edges.append(dict(record, **{'from': source, 'to': target}))
+        return edges
+
+
+def _quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _json_default(value):
+    # NumPy scalars (ids or filter values taken from arrays) as the Python values json can encode
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError('Object of type {} is not JSON serializable'.format(type(value).__name__))
+
+
+def _json_list(values):
+    # A JSON array for json_each(?)
+    return json.dumps(list(values), default=_json_default)
+
+
+class SQLiteSource(DataSource):
+    """
+    Source over the `nodes_table` and `edges_table` tables of a SQLite database, whose `node_id`,
+    `source` and `target` columns hold the node ids and the edge ends. Other columns become record
+    properties, NULL values being left out.
+
+    Every query opens its own connection to `database` (a path or a URI), so the source can be shared by
+    callbacks running in different threads. Index the edge `source` and `target` columns for fast
+    neighbourhood queries. Pages follow the rowid order of the nodes table, and edges that of the edges
+    table, so both must be rowid tables: views and WITHOUT ROWID tables are not supported.
+    """
+
+    def __init__(self, database, nodes_table='nodes', edges_table='edges', node_id='id', source='from',
+                 target='to', uri=False):
+        self.database = database
+        self.uri = uri
+        self._nodes_table, self._edges_table = _quote(nodes_table), _quote(edges_table)
+        self._node_id, self._source, self._target = _quote(node_id), _quote(source), _quote(target)
+        # Columns renamed to the DashNetwork keys in node and edge records
+        self._node_keys, self._edge_keys = {node_id: 'id'}, {source: 'from', target: 'to'}
+
+    def _query(self, sql, parameters=()):
+        connection = sqlite3.connect(self.database, uri=self.uri)
+        try:
+            cursor = connection.execute(sql, parameters)
+            names = [description[0] for description in cursor.description]
+            return names, cursor.fetchall()
+        finally:
+            connection.close()
+
+    def _records(self, sql, parameters, keys):
+        names, rows = self._query(sql, parameters)
+        names = [keys.get(name, name) for name in names]
+        return [{name: value for name, value in zip(names, row) if value is not None} for row in rows]
+
+    def _where(self, where):
+        # SQL condition and parameters for a filter
+        conditions, parameters = [], []
+        for key, value in (where or {}).items():
+            values = list(_accepted(value))
+            present = [item for item in values if item is not None]
+            condition = '{} IN (SELECT value FROM json_each(?))'.format(_quote(key))
+            if None in values:
+                condition = '({} OR {} IS NULL)'.format(condition, _quote(key))
+            conditions.append(condition)
+            parameters.append(_json_list(present))
+        return ' AND '.join(conditions) or '1', parameters
+
+    def nodes(self, where=None, offset=0, limit=None):
+        condition, parameters = self._where(where)
+        sql = 'SELECT * FROM {} WHERE {} ORDER BY rowid LIMIT ? OFFSET ?'.format(self._nodes_table, condition)
+        return self._records(sql, parameters + [-1 if limit is None else limit, offset], self._node_keys)
+
+    def node_records(self, node_ids):
+        node_ids = list(node_ids)
+        sql = 'SELECT * FROM {} WHERE {} IN (SELECT value FROM json_each(?))'.format(self._nodes_table,
+                                                                                     self._node_id)
+        records = {record['id']: record for record in self._records(sql, [_json_list(node_ids)], self._node_keys)}
+        return [records[node_id] for node_id in node_ids if node_id in records]
+
+    def count(self, where=None):
+        condition, parameters = self._where(where)
+        sql = 'SELECT COUNT(*) FROM {} WHERE {}'.format(self._nodes_table, condition)
+        return self._query(sql, parameters)[1][0][0]
+
+    def neighbours(self, node_ids, direction='both'):
+        _check_direction(direction)
+        selects = []
+        if direction in ('both', 'out'):
+            selects.append('SELECT {} FROM {} WHERE {} IN (SELECT value FROM ids)'.format(
+                self._target, self._edges_table, self._source))
+        if direction in ('both', 'in'):
+            selects.append('SELECT {} FROM {} WHERE {} IN (SELECT value FROM ids)'.format(
+                self._source, self._edges_table, self._target))
+        sql = 'WITH ids AS (SELECT value FROM json_each(?)) ' + ' UNION ALL '.join(selects)
+        return list(dict.fromkeys(row[0] for row in self._query(sql, [_json_list(node_ids)])[1]))
+
+    def edges_between(self, node_ids):
+        sql = ('WITH ids AS (SELECT value FROM json_each(?)) SELECT * FROM {} '
+               'WHERE {} IN (SELECT value FROM ids) AND {} IN (SELECT value FROM ids) ORDER BY rowid').format(
+            self._edges_table, self._source, self._target)
+        return self._records(sql, [_json_list(node_ids)], self._edge_keys)
@@ -0,0 +1,138 @@
+"""
+Expand-on-demand loading of large graphs.
+
+Only a seed set of nodes is sent up front. With `expandOnDoubleClick`, double-clicking a node makes the
+component send an `expandRequest`, which an Expansion answers with a `dataDelta` holding only the nodes
+and edges the browser does not have yet:
+
+    from dashvis.expansion import Expansion
+
+    expansion = Expansion(graph, seeds=['a', 'b'], k=1, max_nodes=200)
+    app.layout = DashNetwork(id='network', data=expansion.initial_data(), expandOnDoubleClick=True)
+
+    @app.callback(Output('network', 'dataDelta'), Input('network', 'expandRequest'))
+    def expand(request):
+        return expansion.expand(request)
+
+Requests carry the ids of the nodes expanded before, so the nodes already in the browser are worked out
+on the server without keeping any per-client state: the seeds plus the neighbourhood of every node
+expanded so far, in order.
+"""
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from .graph_index import GraphIndex
+
+__all__ = ['Expansion']
+
+
+class Expansion:
+    """
+    Neighbourhood expansion of `graph`, a GraphIndex, a DashNetwork `data` dict or a GraphData.
+
+    The browser starts with the `seeds` and the edges between them. Expanding a node adds the nodes at
+    most `k` edges away from it, following edges in `direction`, but no more than `max_nodes` new nodes,
+    the closest first. Every edge between the nodes shown is added along with them.
+
+    Requests list every node expanded in the session, so they grow by one id per expansion. Rebuilding
+    the nodes shown from that list takes one k-hop expansion per id; the masks of the last `cache_size`
+    requests answered are kept (one byte per node each) so that a request following one of them only
+    replays the nodes expanded since.
+    """
+
+    def __init__(self, graph, seeds, k=1, direction='both', max_nodes=None, cache_size=16):
+        self.index = graph if isinstance(graph, GraphIndex) else GraphIndex(graph)
+        self.seeds = list(seeds)
+        self.k = k
+        self.direction = direction
+        self.max_nodes = max_nodes
+        self.cache_size = cache_size
+        # Known masks by the tuple of nodes expanded, least recently used first
+        self._masks = OrderedDict()
+        self._lock = threading.Lock()
+
+    def initial_data(self, columns=False):
+        """Returns the value for the DashNetwork `data` property (or `dataColumns` with `columns`) to start from."""
+        return self.index.subgraph(self.seeds, columns)
+
+    def _positions(self, ids):
+        # Positions of the ids in the index, ignoring the ids it does not hold
+        return self.index.positions([node_id for node_id in ids if node_id in self.index])
+
+    def _expand(self, known, node_ids):
+        # Marks the nodes added by expanding each of `node_ids` in turn as known, returns their positions
+        added = []
+        for row in self._positions(node_ids).tolist():
+            new = self.index.k_hop_rows(np.array([row]), self.k, self.direction, self.max_nodes, known)
+            known[new] = True
+            added.append(new)
+        return np.concatenate(added) if added else np.zeros(0, dtype=np.int64)
+
+    def known_mask(self, expanded=()):
+        """
+        Returns a boolean mask of the nodes shown in the browser once the nodes `expanded` have been
+        expanded, in order, starting from the seeds.
+        """
+        expanded = tuple(expanded)
+        start, known = self._cached(expanded)
+        if known is None:
+            known = np.zeros(self.index.node_count, dtype=bool)
+            known[self._positions(self.seeds)] = True
+        self._expand(known, expanded[start:])
+        return known
+
+    def _cached(self, expanded):
+        # Length and copy of the mask of the longest cached prefix of `expanded`, (0, None) if there is none
+        with self._lock:
+            best = None
+            for key in self._masks:
+                if len(key) <= len(expanded) and (best is None or len(key) > len(best)) \
+                        and expanded[:len(key)] == key:
+                    best = key
+            if best is None:
+                return 0, None
+            self._masks.move_to_end(best)
+            return len(best), self._masks[best].copy()
+
+    def _store(self, expanded, known):
+        with self._lock:
+            self._masks[expanded] = known.copy()
+            self._masks.move_to_end(expanded)
+            while len(self._masks) > self.cache_size:
+                self._masks.popitem(last=False)
+
+    def expand(self, request, known=None):
+        """
+        Returns the `dataDelta` answering an `expandRequest` from the component: the nodes added by
+        expanding the requested nodes and the edges joining them to the nodes shown.
+
+        `known` lists the ids of the nodes the browser holds. By default they are worked out from the
+        seeds and the nodes the request reports as expanded before, which holds as long as the graph is
+        only changed through this expansion. Returns None if `request` is None, so that the callback
+        can return its result directly.
+        """
+        if request is None:
+            return None
+        expanded = tuple(request.get('expanded') or [])
+        node_ids = request.get('nodeIds') or []
+        cached = known is None
+        if cached:
+            known = self.known_mask(expanded)
+        else:
+            mask = np.zeros(self.index.node_count, dtype=bool)
+            mask[self._positions(known)] = True
+            known = mask
+
+        added = self._expand(known, node_ids)
+        if cached and self.cache_size > 0:
+            # The next request will list these nodes as expanded
+            self._store(expanded + tuple(node_ids), known)
+        # Edges from or to an added node whose other end is shown, each once
+        edge_rows = self.index.incident_edge_rows(added, known)
+        nodes, edges = self.index.records(added, edge_rows)
+        delta = {'nodes': {'add': nodes}, 'edges': {'add': edges}}
+        if request.get('requestId') is not None:
+            delta['version'] = request['requestId']
+        return delta
@@ -0,0 +1,284 @@
+"""
+Vectorised builder for DashNetwork graph payloads.
+
+GraphData holds nodes and edges as NumPy columns, validates them and maps attributes onto vis.js
+properties with array operations, then emits the `data` or `dataColumns` property in one pass.
+
+    from dashvis import GraphData
+
+    graph = GraphData(nodes_frame, edges_frame, source='src', target='dst')
+    graph.size_by('degree').group_by('category')
+    network = DashNetwork(id='network', dataColumns=graph.to_columns())
+"""
+import numpy as np
+
+from .columns import data_columns
+
+__all__ = ['GraphData']
+
+
+def _as_array(values):
+    if hasattr(values, 'isna') and not isinstance(values.dtype, np.dtype):
+        # pandas extension dtypes (nullable integers, strings, categories) hold pd.NA, which NumPy cannot compare
+        values = values.astype(object).where(values.notna(), None)
+    array = np.asarray(values)
+    if array.dtype.kind == 'U':
+        # NumPy turns lists mixing strings with numbers into strings, so that id 1 would no longer match 1
+        objects = np.asarray(values, dtype=object)
+        if not all(isinstance(value, str) for value in objects.ravel().tolist()):
+            return objects
+    return array
+
+
+def _as_columns(table, name):
+    # Dicts and DataFrames both map column names to values through items()
+    columns = {str(key): _as_array(values) for key, values in table.items()}
+    lengths = {len(values) for values in columns.values()}
+    if len(lengths) > 1:
+        raise ValueError('{} columns have different lengths: {}'.format(name, sorted(lengths)))
+    return columns
+
+
+def _id_positions(ids):
+    # Position of every id, the last one for duplicated ids
+    return {node_id: i for i, node_id in enumerate(ids)}
+
+
+def _record_endpoints(nodes, edges):
+    """
+    Maps DashNetwork node and edge records onto integer arrays.
+
+    Returns a tuple (ids, sources, targets, rows), where ids is the list of node ids in input order and
+    sources / targets are the node positions of the ends of the edges at `rows` of `edges`: those whose
+    `from` and `to` are both node ids. Other edges are skipped.
+    """
+    ids = [node['id'] for node in nodes]
+    position = _id_positions(ids)
+    sources, targets, rows = [], [], []
+    for row, edge in enumerate(edges):
+        source = position.get(edge.get('from'))
+        target = position.get(edge.get('to'))
+        if source is not None and target is not None:
+            sources.append(source)
+            targets.append(target)
+            rows.append(row)
+    return (ids, np.asarray(sources, dtype=np.int64), np.asarray(targets, dtype=np.int64),
+            np.asarray(rows, dtype=np.int64))
+
+
+def _missing(values):
+    if values.dtype.kind == 'f':
+        return np.isnan(values)
+    if values.dtype.kind == 'O':
+        return np.equal(values, None) | np.not_equal(values, values)
+    return None
+
+
+def _factorize(values):
+    # Returns (categories, codes); pandas is much faster than np.unique on object arrays when available
+    try:
+        import pandas as pd
+    except ImportError:
+        return np.unique(values, return_inverse=True)
+    codes, categories = pd.factorize(values)
+    return np.asarray(categories), codes
+
+
+class GraphData:
+    """
+    Nodes and edges of a graph as columns.
+
+    `nodes` is a DataFrame or a dict of arrays, or an array of node ids. `edges` is a DataFrame, a dict
+    of arrays or an (edge_count, 2) array of endpoints. `node_id`, `source` and `target` name the
+    columns holding the node ids and the edge endpoints, which are renamed to id, from and to.
+    Further columns are passed on to vis.js as node or edge properties.
+
+    Raises ValueError if node ids are not unique or if an edge refers to an unknown node.
+    """
+
+    def __init__(self, nodes, edges=None, node_id='id', source='from', target='to'):
+        if isinstance(nodes, (np.ndarray, list, tuple)):
+            nodes = {node_id: nodes}
+        if edges is None:
+            edges = {source: [], target: []}
+        elif isinstance(edges, (np.ndarray, list, tuple)):
+            edges = _as_array(edges).reshape(-1, 2)
+            edges = {source: edges[:, 0], target: edges[:, 1]}
+
+        nodes = _as_columns(nodes, 'Node')
+        edges = _as_columns(edges, 'Edge')
+        for columns, key in ((nodes, node_id), (edges, source), (edges, target)):
+            if key not in columns:
+                raise ValueError('Missing column {!r}'.format(key))
+        self.nodes = {'id': nodes.pop(node_id), **nodes}
+        self.edges = {'from': edges.pop(source), 'to': edges.pop(target), **edges}
+        self._sources, self._targets = self._endpoints()
+
+    @classmethod
+    def from_arrow(cls, edges, nodes=None, **options):
+        """Builds a GraphData from pyarrow Tables, see dashvis.arrow.from_arrow for the options."""
+        from .arrow import from_arrow
+        return from_arrow(edges, nodes, **options)
+
+    @property
+    def node_count(self):
+        return len(self.nodes['id'])
+
+    @property
+    def edge_count(self):
+        return len(self.edges['from'])
+
+    def _endpoints(self):
+        ids = self.nodes['id']
+        try:
+            if ids.dtype.kind in 'iu' and len(ids) and int(ids.max()) - int(ids.min()) < 4 * len(ids):
+                return self._dense_endpoints(ids)
+            return self._sorted_endpoints(ids)
+        except TypeError:
+            # Object columns mixing ids which cannot be ordered or subtracted, such as numbers and strings
+            return self._mapped_endpoints(ids)
+
+    def _sorted_endpoints(self, ids):
+        # Positions of the edge endpoints in the node columns, through a sorted copy of the ids
+        order = np.argsort(ids, kind='stable')
+        sorted_ids = ids[order]
+        duplicated = sorted_ids[1:][sorted_ids[1:] == sorted_ids[:-1]]
+        if len(duplicated):
+            raise ValueError('Duplicate node ids: {}'.format(np.unique(duplicated)[:10].tolist()))
+
+        positions = []
+        for column in ('from', 'to'):
+            endpoints = self.edges[column]
+            found = np.searchsorted(sorted_ids, endpoints)
+            found = np.minimum(found, max(len(ids) - 1, 0))
+            valid = sorted_ids[found] == endpoints if len(ids) else np.zeros(len(endpoints), dtype=bool)
+            if not valid.all():
+                dangling = np.unique(endpoints[~valid])
+                raise ValueError('Edges refer to {} unknown node ids, for instance {}'.format(
+                    len(dangling), dangling[:10].tolist()))
+            positions.append(order[found])
+        return positions[0], positions[1]
+
+    def _mapped_endpoints(self, ids):
+        # Any hashable ids, looked up one by one in a dict
+        ids = ids.tolist()
+        position = _id_positions(ids)
+        if len(position) != len(ids):
+            duplicated = [node_id for i, node_id in enumerate(ids) if position[node_id] != i]
+            raise ValueError('Duplicate node ids: {}'.format(list(dict.fromkeys(duplicated))[:10]))
+
+        positions = []
+        for column in ('from', 'to'):
+            endpoints = self.edges[column].tolist()
+            found = np.fromiter((position.get(endpoint, -1) for endpoint in endpoints), dtype=np.int64,
+                                count=len(endpoints))
+            if (found < 0).any():
+                dangling = list(dict.fromkeys(endpoint for endpoint, i in zip(endpoints, found) if i < 0))
+                raise ValueError('Edges refer to {} unknown node ids, for instance {}'.format(
+                    len(dangling), dangling[:10]))
+            positions.append(found)
+        return positions[0], positions[1]
+
+    def _dense_endpoints(self, ids):
+        # Integer ids in a compact range: a lookup table from id to position avoids sorting and searching
+        offset = ids.min()
+        table = np.full(int(ids.max() - offset) + 1, -1, dtype=np.int64)
+        table[ids - offset] = np.arange(len(ids))
+        if (table >= 0).sum() != len(ids):
+            counts = np.bincount(ids - offset)
+            raise ValueError('Duplicate node ids: {}'.format((np.flatnonzero(counts > 1)[:10] + offset).tolist()))
+
+        positions = []
+        for column in ('from', 'to'):
+            endpoints = self.edges[column]
+            shifted = endpoints - offset
+            inside = (shifted >= 0) & (shifted < len(table))
+            found = np.full(len(endpoints), -1, dtype=np.int64)
+            found[inside] = table[shifted[inside].astype(np.int64)]
+            if (found < 0).any():
+                dangling = np.unique(endpoints[found < 0])
+                raise ValueError('Edges refer to {} unknown node ids, for instance {}'.format(
+                    len(dangling), dangling[:10].tolist()))
+            positions.append(found)
+        return positions[0], positions[1]
+
+    def edge_index(self):
+        """
+        Returns a tuple (ids, sources, targets) like dashvis.layout.edge_index: the list of node ids and
+        integer arrays of node positions for every edge.
+        """
+        return self.nodes['id'].tolist(), self._sources, self._targets
+
+    def degree(self):
+        """Returns the number of edge ends at every node, in node order."""
+        return (np.bincount(self._sources, minlength=self.node_count)
+                + np.bincount(self._targets, minlength=self.node_count))
+
+    def set_nodes(self, **columns):
+        """Sets node properties, each given as one value per node or as a single value for every node."""
+        for key, values in columns.items():
+            self.nodes[key] = np.broadcast_to(np.asarray(values), (self.node_count,)).copy()
+        return self
+
+    def set_edges(self, **columns):
+        """Sets edge properties, each given as one value per edge or as a single value for every edge."""
+        for key, values in columns.items():
+            self.edges[key] = np.broadcast_to(np.asarray(values), (self.edge_count,)).copy()
+        return self
+
+    def size_by(self, values='degree', min_size=10, max_size=40, log=False):
+        """
+        Sets the node `size` by scaling `values` linearly into [min_size, max_size].
+
+        `values` is 'degree', the name of a node column or one value per node. With `log`, values are
+        scaled by log(1 + value) instead, which suits heavy tailed measures such as degree.
+        """
+        if isinstance(values, str):
+            values = self.degree() if values == 'degree' else self.nodes[values]
+        values = np.asarray(values, dtype=float)
+        if log:
+            values = np.log1p(values)
+        low, high = (values.min(), values.max()) if len(values) else (0, 0)
+        scale = (values - low) / (high - low) if high > low else np.zeros_like(values)
+        self.nodes['size'] = min_size + scale * (max_size - min_size)
+        return self
+
+    def group_by(self, column, mapping=None, default=None):
+        """
+        Sets the node `group` from the node `column`. If a `mapping` dict is given, categories are
+        translated through it and categories missing from it get `default`. Nodes without a value keep
+        the vis.js default group.
+        """
+        values = self.nodes[column]
+        if mapping is not None:
+            missing = _missing(values)
+            present = np.ones(len(values), dtype=bool) if missing is None else ~missing
+            # Translate each distinct category once rather than every node
+            categories, inverse = _factorize(values[present])
+            translated = np.array([mapping.get(category, default) for category in categories.tolist()] + [None],
+                                  dtype=object)
+            codes = np.full(len(values), len(categories))
+            codes[present] = inverse.reshape(-1)
+            values = translated[codes]
+        self.nodes['group'] = values
+        return self
+
+    def to_data(self):
+        """Returns the value for the DashNetwork `data` property. Missing values (None, NaN) are left out."""
+        return {'nodes': self._records(self.nodes), 'edges': self._records(self.edges)}
+
+    def to_columns(self):
+        """Returns the value for the DashNetwork `dataColumns` property, the more compact of the two."""
+        return data_columns(self.nodes, self.edges)
+
+    @staticmethod
+    def _records(columns):
+        keys = list(columns)
+        # tolist converts NumPy scalars to Python values, which the JSON encoder requires
+        records = [dict(zip(keys, row)) for row in zip(*(columns[key].tolist() for key in keys))]
+        for key in keys:
+            missing = _missing(columns[key])
+            if missing is not None:
+                for i in np.flatnonzero(missing).tolist():
+                    del records[i][key]
+        return records
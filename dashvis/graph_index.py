@@ -0,0 +1,212 @@
+"""
+Compressed sparse row (CSR) index of a graph, for extracting neighbourhoods in callbacks.
+
+Building the index sorts the edges once; k-hop expansions and induced subgraphs are then gathered
+from contiguous slices of NumPy arrays, without rebuilding adjacency dicts per request. The index is
+not modified after it is built, so one instance can be created at startup and shared by every callback.
+
+    from dashvis.graph_index import GraphIndex
+
+    index = GraphIndex(graph)
+
+    @app.callback(Output('network', 'data'), Input('search', 'value'))
+    def show_neighbourhood(node_id):
+        return index.subgraph(index.k_hop([node_id], k=2, max_nodes=2000))
+"""
+import numpy as np
+
+from .columns import data_columns
+from .graph_data import GraphData, _record_endpoints
+
+__all__ = ['GraphIndex']
+
+DIRECTIONS = ('both', 'out', 'in')
+
+
+def _csr(node_count, heads, tails, edge_rows):
+    # Rows of the adjacency matrix: the neighbours of node i are tails[indptr[i]:indptr[i + 1]]
+    order = np.argsort(heads, kind='stable')
+    indptr = np.zeros(node_count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(heads, minlength=node_count), out=indptr[1:])
+    return indptr, tails[order], edge_rows[order]
+
+
+def _gather(indptr, rows):
+    # Positions in the CSR arrays of every entry of the given rows, without a Python loop over the rows
+    starts = indptr[rows]
+    counts = indptr[rows + 1] - starts
+    total = int(counts.sum())
+    offsets = np.repeat(starts - np.cumsum(counts) + counts, counts)
+    return offsets + np.arange(total, dtype=np.int64)
+
+
+def _record_columns(records):
+    # Records as columns, None standing for the attributes a record lacks
+    keys = list(dict.fromkeys(key for record in records for key in record))
+    return {key: [record.get(key) for record in records] for key in keys}
+
+
+class GraphIndex:
+    """
+    CSR adjacency of `graph`, a DashNetwork `data` dict or a GraphData.
+
+    Edges of a `data` dict whose `from` or `to` is not a node id are left out of the index. Node ids are
+    looked up through a dict built once, and node and edge records are returned as given in `graph`.
+
+    Raises ValueError if node ids are not unique.
+    """
+
+    def __init__(self, graph):
+        if isinstance(graph, GraphData):
+            self._nodes, self._edges = graph.nodes, graph.edges
+            ids, sources, targets = graph.edge_index()
+            edge_rows = np.arange(len(sources), dtype=np.int64)
+        else:
+            self._nodes, self._edges = graph.get('nodes') or [], graph.get('edges') or []
+            ids, sources, targets, edge_rows = _record_endpoints(self._nodes, self._edges)
+
+        self.ids = ids
+        self._position = {node_id: i for i, node_id in enumerate(ids)}
+        if len(self._position) != len(ids):
+            raise ValueError('Duplicate node ids')
+        self._sources, self._targets = sources, targets
+        self._out = _csr(len(ids), sources, targets, edge_rows)
+        self._in = _csr(len(ids), targets, sources, edge_rows)
+
+    @property
+    def node_count(self):
+        return len(self.ids)
+
+    @property
+    def node_table(self):
+        """The nodes as given: a list of records, or a dict of columns for a GraphData."""
+        return self._nodes
+
+    @property
+    def edge_count(self):
+        return len(self._sources)
+
+    def __contains__(self, node_id):
+        return node_id in self._position
+
+    def positions(self, node_ids):
+        """Returns the positions of `node_ids` in the node list. Raises KeyError for an unknown node id."""
+        try:
+            return np.fromiter((self._position[node_id] for node_id in node_ids), dtype=np.int64)
+        except KeyError as error:
+            raise KeyError('Unknown node id {!r}'.format(error.args[0])) from None
+
+    def _adjacency(self, direction):
+        if direction not in DIRECTIONS:
+            raise ValueError('direction must be one of {}, not {!r}'.format(', '.join(DIRECTIONS), direction))
+        return [self._out, self._in] if direction == 'both' else [self._out if direction == 'out' else self._in]
+
+    def degree(self, node_ids=None, direction='both'):
+        """
+        Returns the number of edges at every node, or at `node_ids`, counting edges leaving the node
+        ('out'), entering it ('in') or both. A self-loop counts twice towards 'both'.
+        """
+        rows = np.arange(self.node_count) if node_ids is None else self.positions(node_ids)
+        return sum(indptr[rows + 1] - indptr[rows] for indptr, _, _ in self._adjacency(direction))
+
+    def neighbours(self, node_id, direction='both'):
+        """Returns the ids of the nodes joined to `node_id` by an edge, without duplicates."""
+        return self.k_hop([node_id], k=1, direction=direction, include_seeds=False)
+
+    def k_hop(self, node_ids, k=1, direction='both', max_nodes=None, include_seeds=True):
+        """
+        Returns the ids of the nodes at most `k` edges away from `node_ids`, following edges in
+        `direction`, ordered by distance. With `max_nodes`, the expansion stops once that many nodes are
+        found, the last hop being cut short. Seeds come first unless `include_seeds` is False.
+        """
+        seeds = self.positions(node_ids)
+        seeds = seeds[np.sort(np.unique(seeds, return_index=True)[1])]
+        positions = self.k_hop_rows(seeds, k, direction, max_nodes)
+        if not include_seeds:
+            positions = positions[len(seeds):]
+        return [self.ids[i] for i in positions.tolist()]
+
+    def k_hop_rows(self, seeds, k=1, direction='both', max_nodes=None, known=None):
+        """
+        Like k_hop, on positions: returns the positions of the nodes reached from the distinct positions
+        `seeds`, seeds first, in breadth first order. Nodes set in `known`, a boolean mask over the nodes,
+        are traversed but neither returned nor counted towards `max_nodes`, so that an expansion can
+        skip the nodes already shown.
+        """
+        adjacency = self._adjacency(direction)
+        seen = np.zeros(self.node_count, dtype=bool)
+        seen[seeds] = True
+        found = [seeds]
+        frontier = seeds
+        count = len(seeds) if known is None else np.count_nonzero(~known[seeds])
+        for _ in range(k):
+            if len(frontier) == 0 or (max_nodes is not None and count >= max_nodes):
+                break
+            reached = np.concatenate([indices[_gather(indptr, frontier)] for indptr, indices, _ in adjacency])
+            # Keep the first occurrence of every new node, in the order reached
+            reached, first = np.unique(reached[~seen[reached]], return_index=True)
+            frontier = reached[np.argsort(first, kind='stable')]
+            seen[frontier] = True
+            found.append(frontier)
+            count += len(frontier) if known is None else np.count_nonzero(~known[frontier])
+
+        positions = np.concatenate(found)
+        if known is not None:
+            positions = positions[~known[positions]]
+        return positions if max_nodes is None else positions[:max_nodes]
+
+    def edge_rows(self, node_ids):
+        """Returns the rows of the edges between nodes of `node_ids`, in the order of the edge list."""
+        rows = self.positions(node_ids)
+        inside = np.zeros(self.node_count, dtype=bool)
+        inside[rows] = True
+        return self._edge_rows(np.unique(rows), inside)
+
+    def incident_edge_rows(self, rows, inside):
+        """
+        Returns the rows of the edges, in either direction, between the nodes at positions `rows` and the
+        nodes set in `inside`, a boolean mask over the nodes. Each edge is returned once, in edge list order.
+        """
+        return self._edge_rows(np.unique(rows), inside, entering=True)
+
+    def _edge_rows(self, rows, inside, entering=False):
+        # Rows of the edges leaving (and with `entering`, entering) the nodes at `rows` whose other end is `inside`
+        found = []
+        for indptr, indices, edge_rows in ([self._out, self._in] if entering else [self._out]):
+            entries = _gather(indptr, rows)
+            found.append(edge_rows[entries[inside[indices[entries]]]])
+        return np.unique(np.concatenate(found))
+
+    def subgraph(self, node_ids, columns=False):
+        """
+        Returns the subgraph induced by `node_ids` (the nodes and every edge between them) as a value for
+        the DashNetwork `data` property, or `dataColumns` with `columns`. Nodes keep the order given.
+        """
+        node_rows, edge_rows = self.positions(node_ids), self.edge_rows(node_ids)
+        if not columns:
+            nodes, edges = self.records(node_rows, edge_rows)
+            return {'nodes': nodes, 'edges': edges}
+        nodes, edges = self._take(self._nodes, node_rows), self._take(self._edges, edge_rows)
+        if isinstance(nodes, dict):
+            return data_columns(nodes, edges)
+        return data_columns(_record_columns(nodes), _record_columns(edges))
+
+    def records(self, node_rows, edge_rows):
+        """Returns the node and edge records at the given positions of the node and edge lists, as two lists."""
+        nodes, edges = self._take(self._nodes, node_rows), self._take(self._edges, edge_rows)
+        if isinstance(nodes, dict):
+            return GraphData._records(nodes), GraphData._records(edges)
+        return nodes, edges
+
+    def k_hop_subgraph(self, node_ids, k=1, direction='both', max_nodes=None, columns=False):
+        """Returns the subgraph induced by the k-hop neighbourhood of `node_ids`, see k_hop and subgraph."""
+        return self.subgraph(self.k_hop(node_ids, k, direction, max_nodes), columns)
+
+    @staticmethod
+    def _take(table, rows):
+        if isinstance(table, dict):
+            return {key: values[rows] for key, values in table.items()}
+        return [table[i] for i in rows.tolist()]
+
+    def __repr__(self):
+        return '<GraphIndex of {} nodes and {} edges>'.format(self.node_count, self.edge_count)
@@ -0,0 +1,512 @@
+"""
+Server-side force-directed layout for DashNetwork graphs.
+
+Computing positions in Python and handing them to the component with physics disabled skips the
+stabilization phase in the browser, which dominates time-to-interactive for large graphs.
+
+    from dashvis import layout
+
+    network = DashNetwork(id='network', data=layout.barnes_hut(data, seed=42))
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .graph_data import _record_endpoints
+
+__all__ = ['barnes_hut', 'compute_positions', 'connected_components', 'edge_index', 'parallel_layout', 'partition',
+           'with_positions']
+
+# Below this many nodes exact pairwise repulsion is both faster and more accurate than the quadtree
+EXACT_REPULSION_MAX_NODES = 1500
+# Number of rows processed at once by the pairwise / tree repulsion, bounds peak memory use
+_CHUNK_SIZE = 2048
+# Parts of parallel_layout up to this many nodes are simulated together with others of the same size
+_BATCH_MAX_SIZE = 64
+
+
+def edge_index(data):
+    """
+    Maps a DashNetwork `data` dict onto integer arrays.
+
+    Returns a tuple (ids, sources, targets), where ids is the list of node ids in input order and
+    sources / targets are integer arrays of node positions for every edge. Edges pointing at unknown
+    nodes and self-loops are dropped, as they carry no layout information.
+    """
+    ids, sources, targets, _ = _record_endpoints(data.get('nodes', []), data.get('edges', []))
+    loops = sources == targets
+    return ids, sources[~loops], targets[~loops]
+
+
+def _exact_repulsion(pos, k2):
+    displacement = np.zeros_like(pos)
+    for start in range(0, len(pos), _CHUNK_SIZE):
+        block = pos[start:start + _CHUNK_SIZE]
+        delta = block[:, None, :] - pos[None, :, :]
+        dist2 = np.einsum('ijk,ijk->ij', delta, delta)
+        # Coincident nodes (including each node with itself) exert no force on each other
+        np.divide(k2, dist2, out=dist2, where=dist2 > 0)
+        displacement[start:start + _CHUNK_SIZE] = np.einsum('ij,ijk->ik', dist2, delta)
+    return displacement
+
+
+class _QuadTree:
+    """
+    Quadtree stored level by level: level l holds one entry per occupied cell, with the cells sorted by
+    their Morton code so that the children of a cell are a contiguous range of the next level.
+    """
+
+    def __init__(self, pos, depth):
+        self.depth = depth
+        low = pos.min(axis=0)
+        self.extent = max(float((pos.max(axis=0) - low).max()), 1e-9)
+        cells = 1 << depth
+        grid = np.minimum(((pos - low) / self.extent * cells).astype(np.int64), cells - 1)
+        codes = _interleave(grid[:, 0], grid[:, 1])
+
+        self.codes, self.mass, self.centre = [], [], []
+        for level in range(depth + 1):
+            level_codes, inverse = np.unique(codes >> (2 * (depth - level)), return_inverse=True)
+            mass = np.bincount(inverse, minlength=len(level_codes)).astype(float)
+            centre = np.stack([np.bincount(inverse, weights=pos[:, axis], minlength=len(level_codes))
+                               for axis in (0, 1)], axis=1) / mass[:, None]
+            self.codes.append(level_codes)
+            self.mass.append(mass)
+            self.centre.append(centre)
+        self.leaf_codes = codes
+        self.leaf = np.searchsorted(self.codes[depth], codes)
+
+        self.child_start, self.child_end = [], []
+        for level in range(depth):
+            parents = self.codes[level + 1] >> 2
+            self.child_start.append(np.searchsorted(parents, self.codes[level], side='left'))
+            self.child_end.append(np.searchsorted(parents, self.codes[level], side='right'))
+
+    def repulsion(self, pos, rows, k2, theta):
+        """Barnes-Hut approximation of the repulsion acting on pos[rows]."""
+        row_pos = pos[rows]
+        row_codes = self.leaf_codes[rows]
+        displacement = np.zeros((len(rows), 2))
+        local = np.repeat(np.arange(len(rows)), len(self.codes[0]))
+        cells = np.tile(np.arange(len(self.codes[0])), len(rows))
+        for level in range(self.depth + 1):
+            if len(local) == 0:
+                break
+            centre = self.centre[level][cells]
+            mass = self.mass[level][cells]
+            # Cells containing the node itself are never summarised; at the leaves the node is taken out
+            own = (row_codes[local] >> (2 * (self.depth - level))) == self.codes[level][cells]
+            if level == self.depth:
+                remaining = mass - own
+                centre[own] = ((centre[own] * mass[own, None] - row_pos[local[own]]) /
+                               np.maximum(remaining[own], 1)[:, None])
+                mass = remaining
+                far = np.ones(len(local), dtype=bool)
+            else:
+                size = self.extent / (1 << level)
+                delta = row_pos[local] - centre
+                far = (size * size < theta * theta * np.einsum('ij,ij->i', delta, delta)) & ~own
+
+            delta = row_pos[local[far]] - centre[far]
+            dist2 = np.einsum('ij,ij->i', delta, delta)
+            strength = np.divide(k2 * mass[far], dist2, out=np.zeros_like(dist2), where=dist2 > 0)
+            displacement += _scatter(local[far], delta * strength[:, None], len(rows))
+
+            if level < self.depth:
+                near = ~far
+                start = self.child_start[level][cells[near]]
+                count = self.child_end[level][cells[near]] - start
+                local = np.repeat(local[near], count)
+                offsets = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+                cells = np.repeat(start, count) + offsets
+        return displacement
+
+
+def _scatter(index, values, size):
+    # Row-wise sum of `values` into `size` rows; much faster than np.add.at
+    return np.stack([np.bincount(index, weights=values[:, axis], minlength=size) for axis in (0, 1)], axis=1)
+
+
+def _interleave(x, y):
+    code = np.zeros_like(x)
+    for bit in range(32):
+        code |= ((x >> bit) & 1) << (2 * bit + 1)
+        code |= ((y >> bit) & 1) << (2 * bit)
+    return code
+
+
+def _tree_repulsion(pos, k2, theta):
+    depth = int(np.clip(np.ceil(np.log2(len(pos)) / 2) + 2, 4, 16))
+    tree = _QuadTree(pos, depth)
+    displacement = np.empty_like(pos)
+    for start in range(0, len(pos), _CHUNK_SIZE):
+        rows = np.arange(start, min(start + _CHUNK_SIZE, len(pos)))
+        displacement[rows] = tree.repulsion(pos, rows, k2, theta)
+    return displacement
+
+
+def compute_positions(node_count, sources, targets, iterations=300, spring_length=100.0, gravity=0.05,
+                      theta=1.0, seed=None, initial_positions=None, fixed=None):
+    """
+    Runs a Fruchterman-Reingold style force simulation and returns a (node_count, 2) array of positions.
+
+    Repulsion between all nodes is computed exactly for small graphs and with a vectorised Barnes-Hut
+    quadtree above EXACT_REPULSION_MAX_NODES nodes, where `theta` trades accuracy for speed (0 is exact).
+    `spring_length` is the ideal distance between connected nodes in canvas units and sets the overall scale
+    of the layout. `initial_positions` may seed some or all nodes (NaN rows are placed at random) and nodes
+    flagged in the boolean `fixed` array never move.
+    """
+    rng = np.random.default_rng(seed)
+    if node_count == 0:
+        return np.zeros((0, 2))
+
+    k = float(spring_length)
+    spread = k * np.sqrt(node_count)
+    pos = rng.uniform(-spread / 2, spread / 2, size=(node_count, 2))
+    if initial_positions is not None:
+        initial_positions = np.asarray(initial_positions, dtype=float)
+        known = ~np.isnan(initial_positions).any(axis=1)
+        pos[known] = initial_positions[known]
+    movable = np.ones(node_count, dtype=bool) if fixed is None else ~np.asarray(fixed, dtype=bool)
+
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    temperature = spread / 10
+    cooling = temperature / (iterations + 1)
+    use_tree = node_count > EXACT_REPULSION_MAX_NODES and theta > 0
+
+    for _ in range(iterations):
+        if use_tree:
+            displacement = _tree_repulsion(pos, k * k, theta)
+        else:
+            displacement = _exact_repulsion(pos, k * k)
+
+        if len(sources):
+            delta = pos[sources] - pos[targets]
+            length = np.sqrt(np.einsum('ij,ij->i', delta, delta))
+            pull = delta * (length / k)[:, None]
+            displacement -= _scatter(sources, pull, node_count)
+            displacement += _scatter(targets, pull, node_count)
+
+        displacement -= gravity * pos
+
+        length = np.sqrt(np.einsum('ij,ij->i', displacement, displacement))
+        scale = np.minimum(length, temperature) / np.maximum(length, 1e-9)
+        pos[movable] += displacement[movable] * scale[movable, None]
+        temperature -= cooling
+
+    return pos
+
+
+def _compute_batch(count, size, sources, targets, iterations=300, spring_length=100.0, gravity=0.05, seed=None):
+    """
+    Runs compute_positions on `count` separate graphs of `size` nodes at once, with exact repulsion. The
+    edges index the stacked nodes, graph i holding nodes i * size to (i + 1) * size - 1. Returns a
+    (count * size, 2) array of positions. One simulation step for all graphs costs about the same Python
+    overhead as for one, which matters when a graph has thousands of tiny components.
+    """
+    rng = np.random.default_rng(seed)
+    k = float(spring_length)
+    spread = k * np.sqrt(size)
+    pos = rng.uniform(-spread / 2, spread / 2, size=(count, size, 2))
+    flat = pos.reshape(-1, 2)
+    temperature = spread / 10
+    cooling = temperature / (iterations + 1)
+
+    for _ in range(iterations):
+        delta = pos[:, :, None, :] - pos[:, None, :, :]
+        dist2 = np.einsum('mijk,mijk->mij', delta, delta)
+        np.divide(k * k, dist2, out=dist2, where=dist2 > 0)
+        displacement = np.einsum('mij,mijk->mik', dist2, delta).reshape(-1, 2)
+
+        if len(sources):
+            edge_delta = flat[sources] - flat[targets]
+            length = np.sqrt(np.einsum('ij,ij->i', edge_delta, edge_delta))
+            pull = edge_delta * (length / k)[:, None]
+            displacement -= _scatter(sources, pull, len(flat))
+            displacement += _scatter(targets, pull, len(flat))
+
+        displacement -= gravity * flat
+        length = np.sqrt(np.einsum('ij,ij->i', displacement, displacement))
+        flat += displacement * (np.minimum(length, temperature) / np.maximum(length, 1e-9))[:, None]
+        temperature -= cooling
+
+    return flat
+
+
+def barnes_hut(data, iterations=300, spring_length=100.0, gravity=0.05, theta=1.0, seed=None,
+               disable_physics=True):
+    """
+    Lays out a DashNetwork `data` dict ({'nodes': [...], 'edges': [...]}) and returns a copy of it with
+    `x` / `y` set on every node.
+
+    Nodes which already carry both `x` and `y` start from that position, and those also marked `fixed`
+    stay where they are. With `disable_physics` (the default) every node gets `physics: False`, so the
+    browser draws the graph as computed instead of stabilizing it again.
+    See compute_positions for the meaning of the remaining arguments.
+    """
+    nodes = data.get('nodes', [])
+    ids, sources, targets = edge_index(data)
+    initial = np.array([[node.get('x', np.nan), node.get('y', np.nan)] for node in nodes], dtype=float)
+    initial = initial.reshape(len(nodes), 2)
+    fixed = np.array([node.get('fixed') is True and not np.isnan(initial[i]).any()
+                      for i, node in enumerate(nodes)], dtype=bool)
+
+    pos = compute_positions(len(ids), sources, targets, iterations=iterations, spring_length=spring_length,
+                            gravity=gravity, theta=theta, seed=seed, initial_positions=initial, fixed=fixed)
+    return with_positions(data, pos, disable_physics=disable_physics)
+
+
+def with_positions(data, pos, disable_physics=True):
+    """Returns a copy of `data` whose nodes carry the coordinates in the (node_count, 2) array `pos`."""
+    nodes = []
+    for node, (x, y) in zip(data.get('nodes', []), pos):
+        node = dict(node, x=float(x), y=float(y))
+        if disable_physics:
+            node['physics'] = False
+        nodes.append(node)
+    return dict(data, nodes=nodes, edges=list(data.get('edges', [])))
+
+
+def connected_components(node_count, sources, targets):
+    """
+    Labels the connected components of an undirected graph given as edge arrays.
+
+    Returns an integer array of length node_count with labels 0..k-1, numbered in order of each
+    component's first node.
+    """
+    labels = np.arange(node_count)
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    while True:
+        # Hook every node onto the smallest label among its neighbours, then compress the label chains
+        lowest = np.minimum(labels[sources], labels[targets])
+        updated = labels.copy()
+        np.minimum.at(updated, labels[sources], lowest)
+        np.minimum.at(updated, labels[targets], lowest)
+        while True:
+            compressed = updated[updated]
+            if np.array_equal(compressed, updated):
+                break
+            updated = compressed
+        if np.array_equal(updated, labels):
+            break
+        labels = updated
+    _, first, inverse = np.unique(labels, return_index=True, return_inverse=True)
+    order = np.argsort(np.argsort(first))
+    return order[inverse]
+
+
+def _bfs_order(members, sources, targets):
+    # Breadth-first order of the nodes in `members` (one connected component), level by level
+    local = {node: i for i, node in enumerate(members)}
+    mapped_sources = np.array([local[node] for node in sources], dtype=np.int64)
+    mapped_targets = np.array([local[node] for node in targets], dtype=np.int64)
+    heads = np.concatenate([mapped_sources, mapped_targets])
+    tails = np.concatenate([mapped_targets, mapped_sources])
+    order = np.argsort(heads, kind='stable')
+    heads, tails = heads[order], tails[order]
+    offsets = np.searchsorted(heads, np.arange(len(members) + 1))
+
+    visited = np.zeros(len(members), dtype=bool)
+    visited[0] = True
+    frontier = np.array([0])
+    levels = [frontier]
+    while len(frontier):
+        count = offsets[frontier + 1] - offsets[frontier]
+        starts = np.repeat(offsets[frontier], count)
+        neighbours = tails[starts + np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)]
+        frontier = np.unique(neighbours[~visited[neighbours]])
+        visited[frontier] = True
+        levels.append(frontier)
+    return np.asarray(members)[np.concatenate(levels)]
+
+
+def _groups(labels, count):
+    # Members of every label 0..count-1 in increasing order, from one stable sort rather than a scan per label
+    if count == 0:
+        return []
+    order = np.argsort(labels, kind='stable')
+    return np.split(order, np.cumsum(np.bincount(labels, minlength=count))[:-1])
+
+
+def partition(node_count, sources, targets, max_partition_size=20000):
+    """
+    Splits a graph into parts that can be laid out independently.
+
+    Every connected component is a part of its own, unless it holds more than `max_partition_size`
+    nodes, in which case it is cut into contiguous breadth-first regions of at most that size.
+    Returns a tuple (parts, components): the part label and the connected component label of every node.
+    """
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    components = connected_components(node_count, sources, targets)
+    parts = components.copy()
+    next_part = components.max() + 1 if node_count else 0
+    sizes = np.bincount(components, minlength=next_part)
+    large = np.flatnonzero(sizes > max_partition_size)
+    if len(large):
+        members = _groups(components, next_part)
+        # Edges grouped by the component of their source, which is also that of their target
+        edges = _groups(components[sources], next_part)
+    for component in large:
+        inside = edges[component]
+        order = _bfs_order(members[component], sources[inside], targets[inside])
+        for chunk_start in range(max_partition_size, len(order), max_partition_size):
+            parts[order[chunk_start:chunk_start + max_partition_size]] = next_part
+            next_part += 1
+    return parts, components
+
+
+def _layout_job(job):
+    # A job runs one or more tasks, each laying out one part or a batch of small parts of the same size
+    results = []
+    for count, size, sources, targets, options in job:
+        if count == 1:
+            results.append(compute_positions(size, sources, targets, **options))
+        else:
+            options = {key: value for key, value in options.items() if key != 'theta'}
+            results.append(_compute_batch(count, size, sources, targets, **options))
+    return results
+
+
+def _layout_tasks(members, part_edges, local_index, sources, targets, options, seeds, max_partition_size):
+    # Returns (tasks, task parts): parts of up to _BATCH_MAX_SIZE nodes are batched by size into tasks of at
+    # most max_partition_size nodes, larger parts get a task of their own
+    tasks, task_parts = [], []
+    sizes = np.array([len(part_members) for part_members in members], dtype=np.int64)
+    for size in np.unique(sizes).tolist():
+        same_size = np.flatnonzero(sizes == size)
+        step = max(max_partition_size // size, 1) if size <= _BATCH_MAX_SIZE else 1
+        for start in range(0, len(same_size), step):
+            parts = same_size[start:start + step].tolist()
+            edges = [part_edges[part] for part in parts]
+            offsets = np.repeat(np.arange(len(parts)) * size, [len(part) for part in edges])
+            edges = np.concatenate(edges)
+            tasks.append((len(parts), size, local_index[sources[edges]] + offsets,
+                          local_index[targets[edges]] + offsets, dict(options, seed=int(seeds[parts[0]]))))
+            task_parts.append(parts)
+    return tasks, task_parts
+
+
+def _pack_jobs(tasks, max_size):
+    # Groups tasks into jobs of about `max_size` nodes, largest first, so that a graph of many small
+    # components does not cost one pool task per component
+    jobs, job, job_size = [], [], 0
+    for task in sorted(range(len(tasks)), key=lambda i: -tasks[i][0] * tasks[i][1]):
+        job.append(task)
+        job_size += tasks[task][0] * tasks[task][1]
+        if job_size >= max_size:
+            jobs.append(job)
+            job, job_size = [], 0
+    return jobs + [job] if job else jobs
+
+
+def _centred(pos):
+    if len(pos) == 0:
+        return pos
+    return pos - (pos.min(axis=0) + pos.max(axis=0)) / 2
+
+
+def _shelf_pack(blocks, margin):
+    # Arranges centred position blocks on rows of roughly equal width, largest first
+    sizes = [block.max(axis=0) - block.min(axis=0) + margin if len(block) else np.zeros(2) for block in blocks]
+    row_width = max(np.sqrt(sum(size[0] * size[1] for size in sizes)), max(size[0] for size in sizes))
+    offsets = [None] * len(blocks)
+    x = y = row_height = 0.0
+    for i in sorted(range(len(blocks)), key=lambda i: -sizes[i][1]):
+        width, height = sizes[i]
+        if x > 0 and x + width > row_width:
+            x, y, row_height = 0.0, y + row_height, 0.0
+        offsets[i] = np.array([x + width / 2, y + height / 2])
+        x += width
+        row_height = max(row_height, height)
+    return offsets
+
+
+def parallel_layout(data, processes=None, max_partition_size=20000, iterations=300, spring_length=100.0,
+                    gravity=0.05, theta=1.0, seed=None, disable_physics=True):
+    """
+    Lays out a DashNetwork `data` dict like barnes_hut, spreading the work over a pool of processes.
+
+    The graph is split with `partition`: connected components are laid out separately, and components
+    larger than `max_partition_size` nodes are cut into breadth-first regions which are laid out
+    separately as well. Regions of the same component are then placed according to a layout of the
+    graph of regions, so that neighbouring regions stay next to each other, and finally all
+    components are packed into rows. `processes` is the pool size (defaults to the number of CPUs);
+    with `processes=1` everything runs in the calling process.
+    """
+    ids, sources, targets = edge_index(data)
+    node_count = len(ids)
+    if node_count == 0:
+        return with_positions(data, np.zeros((0, 2)), disable_physics)
+    parts, components = partition(node_count, sources, targets, max_partition_size)
+    part_count = parts.max() + 1
+
+    # Edges inside a part are laid out with it; edges between parts only position the parts
+    members = _groups(parts, part_count)
+    sizes = [len(part_members) for part_members in members]
+    local_index = np.empty(node_count, dtype=np.int64)
+    local_index[np.concatenate(members) if members else []] = \
+        np.arange(node_count) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+    internal = parts[sources] == parts[targets]
+    internal_edges = np.flatnonzero(internal)
+    part_edges = [internal_edges[group] for group in _groups(parts[sources[internal_edges]], part_count)]
+    options = dict(iterations=iterations, spring_length=spring_length, gravity=gravity, theta=theta)
+    seeds = np.random.SeedSequence(seed).generate_state(max(part_count, 1))
+    tasks, task_parts = _layout_tasks(members, part_edges, local_index, sources, targets, options, seeds,
+                                      max_partition_size)
+    jobs = _pack_jobs(tasks, max_partition_size)
+    job_tasks = [[tasks[task] for task in job] for job in jobs]
+
+    processes = processes or os.cpu_count() or 1
+    if processes == 1 or len(jobs) == 1:
+        finished = list(map(_layout_job, job_tasks))
+    else:
+        # Jobs come largest first, so that one big part does not start last and hold up the whole pool
+        with ProcessPoolExecutor(max_workers=min(processes, len(jobs))) as pool:
+            finished = list(pool.map(_layout_job, job_tasks))
+    results = [None] * part_count
+    for job, positions in zip(jobs, finished):
+        for task, task_pos in zip(job, positions):
+            for part, part_pos in zip(task_parts[task], np.split(task_pos, len(task_parts[task]))):
+                results[part] = part_pos
+
+    pos = np.zeros((node_count, 2))
+    component_count = components.max() + 1 if node_count else 0
+    part_component = components[[part_members[0] for part_members in members]] if members else np.zeros(0, int)
+    component_parts = _groups(part_component, component_count)
+    crossing = None
+    blocks = []
+    for component, parts_of_component in enumerate(component_parts):
+        if len(parts_of_component) == 1:
+            # Members of a part and of its component are both sorted, so the rows already match
+            part = parts_of_component[0]
+            blocks.append((members[part], _centred(results[part])))
+            continue
+        if crossing is None:
+            crossing_edges = np.flatnonzero(~internal)
+            crossing = [crossing_edges[group]
+                        for group in _groups(components[sources[crossing_edges]], component_count)]
+        # Lay out the graph of regions, with regions as large nodes and crossing edges as springs
+        placed = [_centred(results[part]) for part in parts_of_component]
+        region = np.empty(part_count, dtype=np.int64)
+        region[parts_of_component] = np.arange(len(parts_of_component))
+        edges = crossing[component]
+        radius = max(np.abs(block).max() for block in placed)
+        centres = compute_positions(len(parts_of_component), region[parts[sources[edges]]],
+                                    region[parts[targets[edges]]], iterations=iterations,
+                                    spring_length=2 * radius + spring_length, gravity=gravity, theta=0,
+                                    seed=int(seeds[parts_of_component[0]]))
+        component_members = np.sort(np.concatenate([members[part] for part in parts_of_component]))
+        block = np.zeros((len(component_members), 2))
+        for part, part_pos, centre in zip(parts_of_component, placed, centres):
+            block[np.searchsorted(component_members, members[part])] = part_pos + centre
+        blocks.append((component_members, _centred(block)))
+
+    if blocks:
+        offsets = _shelf_pack([block for _, block in blocks], margin=2 * spring_length)
+        for (component_members, block), offset in zip(blocks, offsets):
+            pos[component_members] = block + offset
+    return with_positions(data, pos, disable_physics=disable_physics)
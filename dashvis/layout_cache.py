@@ -0,0 +1,153 @@
+"""
+Persistent cache of node positions, so that repeat views of the same graph skip layout and physics entirely.
+
+Entries are keyed by a fingerprint of the node ids, the edge endpoints, the seed and the layout options,
+and are stored as one small .npz file per graph. The least recently used entries are evicted once the
+cache holds more than `max_entries` graphs.
+
+    from dashvis.layout_cache import LayoutCache
+
+    cache = LayoutCache('/var/cache/dashvis')
+    network = DashNetwork(id='network', data=cache.layout(data, seed=42))
+"""
+import hashlib
+import json
+import os
+import tempfile
+
+import numpy as np
+
+from . import layout as _layout
+from . import positions as _positions
+
+__all__ = ['LayoutCache', 'fingerprint']
+
+
+def _canonical_ids(data):
+    # Node ids as stable strings, in the order used to store positions
+    return sorted(json.dumps(node['id']) for node in data.get('nodes', []))
+
+
+def fingerprint(data, seed=None, **options):
+    """
+    Returns a hex digest identifying the structure of `data` together with the layout `seed` and `options`.
+
+    Only node ids and edge endpoints take part, so labels, colours and other attributes can change without
+    invalidating cached positions, while node order does not matter.
+    """
+    digest = hashlib.sha256()
+    for node_id in _canonical_ids(data):
+        digest.update(node_id.encode('utf-8'))
+        digest.update(b'\0')
+    digest.update(b'\1')
+    edges = sorted(json.dumps([edge.get('from'), edge.get('to')]) for edge in data.get('edges', []))
+    for edge in edges:
+        digest.update(edge.encode('utf-8'))
+        digest.update(b'\0')
+    digest.update(b'\1')
+    digest.update(json.dumps({'seed': seed, 'options': options}, sort_keys=True, default=str).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class LayoutCache:
+    """
+    On-disk LRU cache of node positions.
+
+    `directory` is created if needed and may be shared between processes: entries are written atomically,
+    and recency is tracked through file modification times.
+    """
+
+    SUFFIX = '.npz'
+
+    def __init__(self, directory, max_entries=256):
+        self.directory = directory
+        self.max_entries = max_entries
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    def lookup(self, data, seed=None, disable_physics=True, **options):
+        """
+        Returns a copy of `data` with cached `x` / `y` positions injected, or None on a cache miss.
+        """
+        path = self._path(fingerprint(data, seed=seed, **options))
+        try:
+            with np.load(path) as entry:
+                canonical = entry['positions']
+        except (OSError, KeyError, ValueError):
+            return None
+        if len(canonical) != len(data.get('nodes', [])):
+            return None
+        os.utime(path)
+
+        row = {node_id: i for i, node_id in enumerate(_canonical_ids(data))}
+        pos = canonical[[row[json.dumps(node['id'])] for node in data.get('nodes', [])]]
+        return _layout.with_positions(data, pos, disable_physics=disable_physics)
+
+    def store(self, data, positions, seed=None, **options):
+        """
+        Stores positions for `data`. `positions` is either a (node_count, 2) array in node order, or a
+        result of the DashNetwork getPositions property: the `{id: {'x': ..., 'y': ...}}` mapping, whose keys
+        may be the node ids or their string form, or the compact format. Returns the cache key.
+        """
+        nodes = data.get('nodes', [])
+        if _positions.is_compact(positions):
+            node_ids, xy = _positions.decode_positions(positions)
+            row = {node_id: i for i, node_id in enumerate(node_ids)}
+            positions = xy[[row[node['id']] for node in nodes]]
+        elif isinstance(positions, dict):
+            rows = []
+            for node in nodes:
+                position = positions.get(node['id'], positions.get(str(node['id'])))
+                rows.append([position['x'], position['y']])
+            positions = rows
+        positions = np.asarray(positions, dtype=float).reshape(len(nodes), 2)
+
+        order = np.argsort([json.dumps(node['id']) for node in nodes], kind='stable')
+        key = fingerprint(data, seed=seed, **options)
+        handle, temporary = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(handle, 'wb') as stream:
+                np.savez(stream, positions=positions[order])
+            os.replace(temporary, self._path(key))
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        self._evict()
+        return key
+
+    def layout(self, data, seed=None, layout_function=_layout.barnes_hut, disable_physics=True, **options):
+        """
+        Returns `data` with positions, taken from the cache when available and otherwise computed with
+        `layout_function` (called with `seed` and `options`) and stored for next time.
+        """
+        name = layout_function.__name__
+        cached = self.lookup(data, seed=seed, disable_physics=disable_physics, layout=name, **options)
+        if cached is not None:
+            return cached
+        result = layout_function(data, seed=seed, disable_physics=disable_physics, **options)
+        self.store(result, [[node['x'], node['y']] for node in result['nodes']], seed=seed, layout=name, **options)
+        return result
+
+    def _evict(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith(self.SUFFIX):
+                path = os.path.join(self.directory, name)
+                try:
+                    entries.append((os.stat(path).st_mtime, path))
+                except OSError:
+                    continue
+        entries.sort()
+        for _, path in entries[:max(len(entries) - self.max_entries, 0)]:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+    def clear(self):
+        """Removes every entry from the cache."""
+        for name in os.listdir(self.directory):
+            if name.endswith(self.SUFFIX):
+                os.unlink(os.path.join(self.directory, name))
@@ -0,0 +1,158 @@
+"""
+Pre-flight validation of DashNetwork graph payloads.
+
+Duplicate node ids and edges pointing at missing nodes are otherwise only discovered in the browser,
+where the DataSet throws or the edge silently disappears. The checks use set and NumPy operations and
+take well under a second on a million edges.
+
+DashNetwork components whose `data` holds at least AUTO_VALIDATE_MIN_ITEMS nodes and edges are validated
+automatically when they are serialised, unless created with `validateData=False`. Callback outputs are
+not serialised through the component, so validate them explicitly:
+
+    from dashvis.validation import validate_data
+
+    return validate_data(data)
+"""
+import base64
+import collections
+import numbers
+
+import numpy as np
+
+__all__ = ['AUTO_VALIDATE_MIN_ITEMS', 'data_problems', 'install', 'validate_data']
+
+# Graphs with fewer nodes and edges than this are not validated automatically
+AUTO_VALIDATE_MIN_ITEMS = 10000
+# Number of offending values quoted in each problem description
+_EXAMPLES = 5
+
+
+def _examples(values):
+    values = sorted(values, key=repr)
+    return ', '.join(repr(value) for value in values[:_EXAMPLES]) + (', ...' if len(values) > _EXAMPLES else '')
+
+
+def _column(columns, key):
+    column = columns.get(key, [])
+    if isinstance(column, dict):
+        # Typed column of dataColumns
+        data = base64.b64decode(column['data'])
+        return np.frombuffer(data, dtype=np.dtype(column['dtype']).newbyteorder('<')).tolist()
+    return column
+
+
+def _invalid_types(values):
+    # Names of the types of `values` which are not valid ids. Checking the distinct types rather than every
+    # value keeps this loop in C
+    return {kind.__name__ for kind in set(map(type, values))
+            if not issubclass(kind, (str, numbers.Real)) or issubclass(kind, (bool, np.bool_))}
+
+
+def _id_problems(ids, name):
+    # Returns (problems, set of ids), the set being None if some ids have an invalid type
+    invalid = _invalid_types(ids)
+    if invalid:
+        return ['{} ids must be strings or numbers, found {}'.format(name, ', '.join(sorted(invalid)))], None
+    unique = set(ids)
+    if len(unique) != len(ids):
+        duplicates = [node_id for node_id, count in collections.Counter(ids).items() if count > 1]
+        return ['{} duplicate {} ids: {}'.format(len(duplicates), name.lower(), _examples(duplicates))], unique
+    return [], unique
+
+
+def data_problems(data=None, data_columns=None):
+    """
+    Returns a list describing the problems found in a `data` or `dataColumns` property value, empty if
+    the graph is valid: node ids which are missing, not strings or numbers or not unique, edge ids which
+    are not unique, and edges whose `from` or `to` is not a node id.
+    """
+    if data_columns is not None:
+        nodes, edges = data_columns.get('nodes') or {}, data_columns.get('edges') or {}
+        node_ids = _column(nodes, 'id')
+        edge_ids = [edge_id for edge_id in _column(edges, 'id') if edge_id is not None]
+        sources, targets = _column(edges, 'from'), _column(edges, 'to')
+    else:
+        nodes, edges = (data or {}).get('nodes') or [], (data or {}).get('edges') or []
+        node_ids = [node.get('id') for node in nodes]
+        edge_ids = [edge['id'] for edge in edges if edge.get('id') is not None]
+        sources = [edge.get('from') for edge in edges]
+        targets = [edge.get('to') for edge in edges]
+
+    problems = []
+    missing = sum(node_id is None for node_id in node_ids)
+    if missing:
+        problems.append('{} nodes have no id'.format(missing))
+        node_ids = [node_id for node_id in node_ids if node_id is not None]
+    node_problems, known = _id_problems(node_ids, 'Node')
+    problems += node_problems + _id_problems(edge_ids, 'Edge')[0]
+
+    for key, endpoints in (('from', sources), ('to', targets)):
+        # Missing endpoints (None) are reported as dangling below, other invalid types here, as they may not
+        # even be hashable
+        invalid = _invalid_types(endpoints) - {'NoneType'}
+        if invalid:
+            bad = [endpoint for endpoint in endpoints
+                   if endpoint is not None and type(endpoint).__name__ in invalid]
+            problems.append('{} edges have a {!r} which is not a string or number: {}'.format(
+                len(bad), key, _examples(bad)))
+            endpoints = [endpoint for endpoint in endpoints
+                         if endpoint is None or type(endpoint).__name__ not in invalid]
+        # issuperset looks every endpoint up without building a set of them
+        if known is None or known.issuperset(endpoints):
+            continue
+        dangling = set(endpoints).difference(known)
+        count = sum(1 for endpoint in endpoints if endpoint in dangling)
+        problems.append('{} edges have a {!r} which is not a node id: {}'.format(count, key, _examples(dangling)))
+    return problems
+
+
+def validate_data(data=None, data_columns=None):
+    """
+    Returns the `data` (or `data_columns`) value unchanged if it is valid, and otherwise raises a
+    ValueError listing every problem found. See data_problems.
+    """
+    problems = data_problems(data, data_columns)
+    if problems:
+        raise ValueError('Invalid DashNetwork graph data:\n  ' + '\n  '.join(problems))
+    return data if data_columns is None else data_columns
+
+
+def _length(part):
+    if isinstance(part, dict):
+        # dataColumns: the length of any column, typed columns holding base64 encoded values of their dtype
+        column = next(iter(part.values()), [])
+        if isinstance(column, dict):
+            data = column['data']
+            size = len(data) * 3 // 4 - (len(data) - len(data.rstrip('=')))
+            return size // np.dtype(column['dtype']).itemsize
+        return len(column)
+    return len(part)
+
+
+def _item_count(data):
+    if not isinstance(data, dict):
+        return 0
+    return _length(data.get('nodes') or []) + _length(data.get('edges') or [])
+
+
+def install(component_class):
+    """
+    Makes `component_class` validate large `data` / `dataColumns` values when it is serialised.
+    Each value is validated once per component, so serving the same layout again costs nothing.
+    """
+    serialise = component_class.to_plotly_json
+
+    def to_plotly_json(self):
+        if getattr(self, 'validateData', True) is not False:
+            for prop, keyword in (('data', 'data'), ('dataColumns', 'data_columns')):
+                value = getattr(self, prop, None)
+                validated = self.__dict__.setdefault('_validated_values', {})
+                if validated.get(prop) is value or _item_count(value) < AUTO_VALIDATE_MIN_ITEMS:
+                    continue
+                validate_data(**{keyword: value})
+                validated[prop] = value
+        return serialise(self)
+
+    to_plotly_json.__doc__ = serialise.__doc__
+    component_class.to_plotly_json = to_plotly_json
+    return component_class
@@ -35,7 +35,8 @@ setup(
     include_package_data=True,
     license=package['license'],
     readme="README.md",
-    install_requires=[],
+    install_requires=['numpy'],
+    extras_require={'arrow': ['pyarrow']},
     classifiers=[
         # see https://pypi.org/classifiers/
         'Development Status :: 1 - Planning',
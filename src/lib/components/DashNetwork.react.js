@@ -2,8 +2,22 @@ import React, {Component} from 'react';
 import {Network} from "vis-network";
 import {DataSet} from "vis-data";
 import PropTypes from "prop-types";
+import {applyDelta, syncDataSet} from "../utils/dataDiff";
+import {rateLimit} from "../utils/rateLimit";
+import {createEventBatcher} from "../utils/eventBatcher";
+import FunctionCache from "../utils/functionCache";
+import {isEqual} from "../utils/isEqual";
+import {cloneOptions, diffOptions, pickPaths} from "../utils/optionsDiff";
+import {changedNetworkState} from "../utils/networkState";
+import {runMethodCalls} from "../utils/methodCalls";
+import {compactPositions, moveNodes} from "../utils/positions";
+import {expandDataColumns} from "../utils/columns";
+import {applyClusterAssignment, openClusters} from "../utils/clusterAssignment";
+import ClusterHierarchy from "../utils/clusterHierarchy";
+import ExpansionTracker from "../utils/expansion";
+
+const FUNCTION_CACHE_SIZE = 256;
 
-const isEqual = (...objects) => objects.every(obj => JSON.stringify(obj) === JSON.stringify(objects[0]));
 
 export const ClusteringOptions = PropTypes.shape({
     joinCondition: PropTypes.string,
@@ -65,6 +79,16 @@ function withoutProperties(obj, props) {
     return rest
 }
 
+function pickProperties(obj, props) {
+    const picked = {};
+    for (let i = 0; i < props.length; i++) {
+        if (Object.prototype.hasOwnProperty.call(obj, props[i])) {
+            picked[props[i]] = obj[props[i]];
+        }
+    }
+    return picked
+}
+
 /**
  * A full implementation of [vis.js](https://visjs.github.io/vis-network/docs/network/)
  * Network component for Dash Plotly.
@@ -78,6 +102,17 @@ export default class DashNetwork extends Component {
         this.edges = new DataSet()
         this.net = 0
         this.active_functions = {}
+        this.dataVersion = 0
+        this.dataDeltaVersion = 0
+        this.event_limiters = []
+        this.event_batcher = null
+        this.function_cache = new FunctionCache(FUNCTION_CACHE_SIZE)
+        this.reported_function_cache_stats = null
+        this.assigned_clusters = []
+        this.cluster_hierarchy = null
+        this.cluster_hierarchy_timer = null
+        this.expansion = new ExpansionTracker()
+        this.expand_request_id = 0
         this.state = {canvasToDOM: null, DOMtoCanvas: null}
     }
 
@@ -216,19 +251,64 @@ export default class DashNetwork extends Component {
         ]
 
         const gd = document.getElementById(id);
-        this.nodes.add(data.nodes)
-        this.edges.add(data.edges)
+        const initial_data = this.props.dataColumns ? expandDataColumns(this.props.dataColumns) : data;
+        this.nodes.add(initial_data.nodes)
+        this.edges.add(initial_data.edges)
 
+        this.applied_options = cloneOptions(options)
         this.net = new Network(gd, {nodes: this.nodes, edges: this.edges}, this.prepareOptions(options))
+        if (this.props.dataDelta) {
+            this.applyDataDelta(this.props.dataDelta, setProps);
+        }
+        if (this.props.clusterAssignment) {
+            try {
+                this.assigned_clusters = applyClusterAssignment(this.net, this.props.clusterAssignment);
+            } catch (exception) {
+                console.log("Error: failed to apply the cluster assignment");
+                console.log(exception);
+            }
+        }
+        // Follow the zoom level to show the matching level of a cluster hierarchy, without a server round-trip
+        this.net.on('zoom', () => this.scheduleClusterHierarchyUpdate());
+        this.net.on('animationFinished', () => this.scheduleClusterHierarchyUpdate());
+        this.net.on('stabilized', () => this.scheduleClusterHierarchyUpdate());
+        if (this.props.clusterHierarchy) {
+            this.cluster_hierarchy = new ClusterHierarchy(this.net, this.props.clusterHierarchy);
+            this.scheduleClusterHierarchyUpdate();
+        }
+        this.net.on('doubleClick', params => this.requestExpansion(params.nodes));
+
+        if (setProps) {
+            this.event_batcher = createEventBatcher(this.props.eventBatching, function (events) {
+                setProps({eventBatch: events});
+            });
+        }
+
         this.registerGroupCallbacks(enableHciEvents, hci_events, this.props, setProps);
         this.registerGroupCallbacks(enablePhysicsEvents, physics_events, this.props, setProps);
         this.registerGroupCallbacks(enableOtherEvents, other_events, this.props, setProps);
 
         // Set some static props from the network
         setProps( { getSeed: this.net.getSeed() } );
+        if (this.props.clusterAssignment) {
+            setProps( { assignedClusters: this.assigned_clusters } );
+        }
+        this.reportDebugInfo(setProps);
     }
 
     componentWillUnmount(){
+        if (this.cluster_hierarchy_timer !== null) {
+            clearTimeout(this.cluster_hierarchy_timer);
+            this.cluster_hierarchy_timer = null;
+        }
+        // Drop any event still waiting to be delivered by a throttled or debounced listener
+        this.event_limiters.forEach(limiter => limiter.cancel());
+        this.event_limiters = [];
+        if (this.event_batcher) {
+            this.event_batcher.cancel();
+            this.event_batcher = null;
+        }
+
         // Unload the network
         this.net.destroy();
         this.net = null;
@@ -251,8 +331,20 @@ export default class DashNetwork extends Component {
     }
 
     registerCallbacks(group_events, props, setProps) {
+        const rate_limits = props.eventRateLimits || {};
+        const event_fields = props.eventFields || {};
         for (let i = 0; i < group_events.length; i++) {
             let event_name = group_events[i];
+            const batcher = this.event_batcher;
+            const deliver = rateLimit(function (name, params) {
+                if (batcher) {
+                    batcher.push(name, params);
+                } else {
+                    setProps({[name]: params});
+                }
+            }, rate_limits[event_name]);
+            this.event_limiters.push(deliver);
+
             this.net.addEventListener(event_name, function (params) {
                 // deselectNode and deselectEdge have circular references which need to be removed first
                 // before serialization can proceed
@@ -279,22 +371,80 @@ export default class DashNetwork extends Component {
                         } 
                     }
 
+                    if (Array.isArray(event_fields[event_name]) && typeof params === 'object' && params !== null) {
+                        params = pickProperties(params, event_fields[event_name]);
+                    }
+
                     const cur_event = event_name;
                     if (props[cur_event] !== params && JSON.stringify(params) === "{}") {
                         params[cur_event + " ID"] = Math.floor(Math.random() * 100);
                     }
-                    setProps({[cur_event]: params});
+                    deliver(cur_event, params);
                 }
             });
         }
     }
 
     convertStringToFunction(function_string) {
+        return this.function_cache.get(function_string, function (source) {
+            try {
+                return new Function('return ' + source)();
+            } catch (exception) {
+                console.log("Error: failed to parse input function string");
+                return null;
+            }
+        });
+    }
+
+    reportDebugInfo(setProps) {
+        if (this.props.debug !== true || !setProps) {
+            return;
+        }
+        const function_cache_stats = this.function_cache.stats();
+        if (!isEqual(function_cache_stats, this.reported_function_cache_stats)) {
+            this.reported_function_cache_stats = function_cache_stats;
+            setProps({debugInfo: {functionCache: function_cache_stats}});
+        }
+    }
+
+    scheduleClusterHierarchyUpdate() {
+        // Clustering from within a vis.js event handler would redraw in the middle of it, so wait for the handler to
+        // return. Zoom events come in bursts, only the last scale matters.
+        if (this.cluster_hierarchy === null || this.cluster_hierarchy_timer !== null) {
+            return;
+        }
+        this.cluster_hierarchy_timer = setTimeout(() => {
+            this.cluster_hierarchy_timer = null;
+            this.updateClusterHierarchy();
+        }, 0);
+    }
+
+    updateClusterHierarchy() {
+        const {setProps} = this.props;
+        try {
+            if (this.cluster_hierarchy !== null && this.cluster_hierarchy.update(this.net.getScale()) && setProps) {
+                setProps({ clusterLevel: this.cluster_hierarchy.level });
+            }
+        } catch (exception) {
+            console.log("Error: failed to update the cluster hierarchy");
+            console.log(exception);
+        }
+    }
+
+    requestExpansion(node_ids) {
+        const {setProps} = this.props;
+        if (this.props.expandOnDoubleClick !== true || !setProps) {
+            return;
+        }
         try {
-            return new Function('return ' + function_string)();
+            const request = this.expansion.request(node_ids, id => this.net.isCluster(id), this.expand_request_id + 1);
+            if (request !== null) {
+                this.expand_request_id = request.requestId;
+                setProps({ expandRequest: request });
+            }
         } catch (exception) {
-            console.log("Error: failed to parse input function string");
-            return null;
+            console.log("Error: failed to request the expansion");
+            console.log(exception);
         }
     }
 
@@ -316,6 +466,20 @@ export default class DashNetwork extends Component {
         }
     }
 
+    applyDataDelta(delta, setProps) {
+        try {
+            applyDelta(this.nodes, delta.nodes);
+            applyDelta(this.edges, delta.edges);
+            this.dataDeltaVersion = (typeof delta.version === 'number') ? delta.version : this.dataDeltaVersion + 1;
+            // Nodes of an expandRequest only count as expanded once the delta answering it is shown
+            this.expansion.applied(delta.version);
+            setProps( { dataDeltaVersion: this.dataDeltaVersion } );
+        } catch (exception) {
+            console.log("Error: failed to apply data delta");
+            console.log(exception);
+        }
+    }
+
     post_clustering_stabilize() {
         const fit_value_backup = JSON.parse(JSON.stringify(this.net.physics.options.stabilization.fit));
         this.net.setOptions({ physics: { stabilization: { fit: false } } });
@@ -327,30 +491,42 @@ export default class DashNetwork extends Component {
 
         const {setProps} = this.props;
 
-        if (this.props.data !== nextProps.data) {
-            const new_id_nodes = this.props.data.nodes.map(function (x) {
-                return x.id
-            })
-            const remove_aim_nodes = this.nodes.getIds().filter(function (x) {
-                return new_id_nodes.indexOf(x) === -1
-            })
-            this.nodes.remove(remove_aim_nodes)
-            this.nodes.update(this.props.data.nodes)
+        if (this.props.data !== nextProps.data || this.props.dataColumns !== nextProps.dataColumns) {
+            try {
+                const data = this.props.dataColumns ? expandDataColumns(this.props.dataColumns) : this.props.data;
+                syncDataSet(this.nodes, data.nodes)
+                syncDataSet(this.edges, data.edges)
+                // New data replaces the nodes added by expansions, so every node can be expanded again
+                this.expansion.reset()
+            } catch (exception) {
+                console.log("Error: failed to apply the graph data");
+                console.log(exception);
+            }
 
-            const new_id_edges = this.props.data.edges.map(function (x) {
-                return x.id
-            })
-            const remove_aim_edges = this.edges.getIds().filter(function (x) {
-                return new_id_edges.indexOf(x) === -1
-            })
-            this.edges.remove(remove_aim_edges)
-            this.edges.update(this.props.data.edges)
+            this.dataVersion += 1
+            if (this.props.echoData === true && this.props.dataColumns) {
+                setProps({ dataColumns: this.props.dataColumns, dataVersion: this.dataVersion })
+            } else if (this.props.echoData === true) {
+                setProps({ data: this.props.data, dataVersion: this.dataVersion })
+            } else {
+                setProps({ dataVersion: this.dataVersion })
+            }
+        }
 
-            setProps({ data: this.props.data })
+        // Handle incremental data updates
+        if (this.props.dataDelta !== nextProps.dataDelta && this.props.dataDelta !== null) {
+            this.applyDataDelta(this.props.dataDelta, setProps);
         }
 
         if (this.props.options !== nextProps.options) {
-            this.net.setOptions(this.prepareOptions(nextProps.options));
+            // Only pass the parts of the options which changed, so vis.js does not re-apply unchanged physics,
+            // layout etc.
+            const changed_paths = diffOptions(this.applied_options, this.props.options);
+            if (changed_paths.length > 0) {
+                this.applied_options = cloneOptions(this.props.options);
+                this.net.setOptions(pickPaths(this.prepareOptions(this.props.options), changed_paths));
+            }
+            setProps({ optionsChanged: changed_paths.map(path => path.join('.')) })
         }
 
         // Handle destroy action
@@ -511,6 +687,44 @@ export default class DashNetwork extends Component {
             }
         }
 
+        // Handle precomputed cluster assignments
+        if (nextProps.clusterAssignment !== this.props.clusterAssignment){
+            try {
+                // A new assignment replaces the clusters made by the previous one
+                openClusters(this.net, this.assigned_clusters);
+                this.assigned_clusters = [];
+                if (this.props.clusterAssignment !== null) {
+                    this.assigned_clusters = applyClusterAssignment(this.net, this.props.clusterAssignment);
+                    if (this.props.clusterAssignment.stabilize === true) {
+                        this.post_clustering_stabilize();
+                    }
+                }
+                setProps( { assignedClusters: this.assigned_clusters } );
+            } catch (exception) {
+                console.log("Error: failed to apply the cluster assignment");
+                console.log(exception);
+            }
+        }
+
+        // Handle cluster hierarchies
+        if (nextProps.clusterHierarchy !== this.props.clusterHierarchy){
+            try {
+                // Open the levels of the previous hierarchy before following the new one
+                if (this.cluster_hierarchy !== null) {
+                    this.cluster_hierarchy.show(0);
+                    this.cluster_hierarchy = null;
+                }
+                if (this.props.clusterHierarchy !== null) {
+                    this.cluster_hierarchy = new ClusterHierarchy(this.net, this.props.clusterHierarchy);
+                    this.cluster_hierarchy.update(this.net.getScale());
+                }
+                setProps( { clusterLevel: this.cluster_hierarchy === null ? 0 : this.cluster_hierarchy.level } );
+            } catch (exception) {
+                console.log("Error: failed to apply the cluster hierarchy");
+                console.log(exception);
+            }
+        }
+
         // Handle find node
         if (nextProps.findNode !== this.props.findNode){
             try {
@@ -633,10 +847,17 @@ export default class DashNetwork extends Component {
         if (nextProps.getPositions !== this.props.getPositions){
             if(this.props.getPositions !== null) {
                 try {
-                    const positions = this.net.getPositions(this.props.getPositions.nodeIds);
+                    const node_ids = this.props.getPositions.nodeIds;
+                    let positions = this.net.getPositions(node_ids);
+                    if (this.props.getPositions.format === 'compact') {
+                        const ids = node_ids === undefined || node_ids === null ? this.nodes.getIds()
+                            : [].concat(node_ids);
+                        positions = compactPositions(positions, ids);
+                    }
                     setProps({
                         getPositions: {
-                            nodeIds: this.props.getPositions.nodeIds,
+                            nodeIds: node_ids,
+                            format: this.props.getPositions.format,
                             result: positions
                         }
                     });
@@ -682,6 +903,21 @@ export default class DashNetwork extends Component {
             }
         }
 
+        // Handle moveNodes function call
+        if (nextProps.moveNodes !== this.props.moveNodes){
+            // Skip the {result} value set once the nodes have been moved
+            if(this.props.moveNodes !== null && this.props.moveNodes.nodeIds !== undefined) {
+                try {
+                    const moved = moveNodes(this.nodes, this.props.moveNodes.nodeIds,
+                        this.props.moveNodes.x, this.props.moveNodes.y);
+                    setProps({ moveNodes: { result: moved } });
+                } catch (exception) {
+                    console.log("Error: failed to move nodes");
+                    console.log(exception);
+                }
+            }
+        }
+
         // Handle getBoundingBox function call
         if (nextProps.getBoundingBox !== this.props.getBoundingBox){
             try {
@@ -754,21 +990,6 @@ export default class DashNetwork extends Component {
             }
         }
 
-        // Update getSelection
-        if (this.net.getSelection() !== this.props.getSelection) {
-            setProps({getSelection: this.net.getSelection()});
-        }
-
-        // Update getSelectedNodes
-        if (this.net.getSelectedNodes() !== this.props.getSelectedNodes) {
-            setProps({getSelectedNodes: this.net.getSelectedNodes()});
-        }
-
-        // Update getSelectedEdges
-        if (this.net.getSelectedEdges() !== this.props.getSelectedEdges) {
-            setProps({getSelectedEdges: this.net.getSelectedEdges()});
-        }
-
         // Handle getNodeAt function call
         if (nextProps.getNodeAt !== this.props.getNodeAt){
             try {
@@ -837,16 +1058,6 @@ export default class DashNetwork extends Component {
             this.net.unselectAll()
         }
 
-        // Update getScale
-        if (this.net.getScale() !== this.props.getScale) {
-            setProps({getScale: this.net.getScale()});
-        }
-
-        // Update getViewPosition
-        if (this.net.getViewPosition() !== this.props.getViewPosition) {
-            setProps({getViewPosition: this.net.getViewPosition()});
-        }
-
         // Handle focus function call
         if (nextProps.focus !== this.props.focus){
             try {
@@ -885,11 +1096,22 @@ export default class DashNetwork extends Component {
             this.net.releaseNode()
         }
 
-        // Update getOptionsFromConfigurator
-        if (this.net.getOptionsFromConfigurator() !== this.props.getOptionsFromConfigurator) {
-            setProps({getOptionsFromConfigurator: this.net.getOptionsFromConfigurator()});
+        // Handle batched method calls
+        if (this.props.methodCalls !== nextProps.methodCalls && this.props.methodCalls !== null) {
+            const results = runMethodCalls(this.net, this.props.methodCalls,
+                options => this.createClusterOptions(options));
+            setProps({ methodResults: results });
         }
 
+        // Update getSelection, getSelectedNodes, getSelectedEdges, getScale, getViewPosition and
+        // getOptionsFromConfigurator, in a single setProps call and only if their content changed
+        const changed_state = changedNetworkState(this.net, this.props);
+        if (changed_state !== null) {
+            setProps(changed_state);
+        }
+
+        this.reportDebugInfo(setProps);
+
     }
 
 
@@ -914,6 +1136,8 @@ DashNetwork.propTypes = {
      * Graph data object describing the graph to be drawn.
      * Pass a dict with two keys - 'nodes' and 'edges', set according to the vis.js documentation.
      * In Dash, this property also replaces vis.js setData function.
+     * When this property changes, only the nodes and edges that were added, removed or modified are applied to the
+     * graph. Give your edges an 'id' to benefit from this: edges without one are re-created on every update.
      * See https://visjs.github.io/vis-network/docs/network/#data
      */
     data: PropTypes.exact({
@@ -921,6 +1145,108 @@ DashNetwork.propTypes = {
         edges: PropTypes.arrayOf(PropTypes.object)
     }),
 
+    /**
+     * Columnar alternative to `data`, which avoids repeating every attribute name in every node and edge.
+     * Pass a dict structured as:
+     * {
+     *   nodes: {id: [1, 2, 3], label: ['a', 'b', 'c'], group: [0, 0, 1]},
+     *   edges: {from: [1, 1], to: [2, 3]}
+     * }
+     * Each attribute is a list of values, one per node or edge, or a typed column {dtype: String, data: String}
+     * holding the base64 encoded little-endian values of a NumPy array (dtype int8, uint8, int16, uint16, int32,
+     * uint32, float32 or float64). Use dashvis.columns.data_columns to build it from NumPy arrays or DataFrames.
+     * Null values, and NaN in numeric columns, are left out of the expanded node or edge.
+     * When set, it takes precedence over `data` and is applied in the same way, including `dataVersion` updates.
+     */
+    dataColumns: PropTypes.exact({
+        nodes: PropTypes.objectOf(PropTypes.oneOfType([
+            PropTypes.array,
+            PropTypes.exact({dtype: PropTypes.string, data: PropTypes.string}),
+        ])),
+        edges: PropTypes.objectOf(PropTypes.oneOfType([
+            PropTypes.array,
+            PropTypes.exact({dtype: PropTypes.string, data: PropTypes.string}),
+        ])),
+    }),
+
+    /**
+     * Python-side flag, unused by the component itself. Graphs passed to `data` or `dataColumns` with at least
+     * 10000 nodes and edges are checked for duplicate ids, invalid id types and edges pointing at missing nodes
+     * when the component is serialised, raising a ValueError listing the problems (see dashvis.validation).
+     * Set to false to skip this check.
+     */
+    validateData: PropTypes.bool,
+
+    /**
+     * If true, the whole `data` property is sent back to Dash every time new data has been applied to the graph,
+     * which triggers any callback listening to `data` a second time.
+     * Defaults to false, in which case only the small `dataVersion` property is updated.
+     */
+    echoData: PropTypes.bool,
+
+    /**
+     * Read-only prop.
+     * Incremented every time a new `data` property has been applied to the graph.
+     * Listen to this property rather than `data` to react to graph updates without sending the graph back to the server.
+     */
+    dataVersion: PropTypes.number,
+
+    /**
+     * Write-only property. An incremental change to the graph data, applied directly to the nodes and edges
+     * currently drawn, without resending the whole `data` property. Pass a dict structured as:
+     * {
+     *   version: Number,  // optional, echoed back through dataDeltaVersion once applied
+     *   nodes: {add: [Array of nodes], update: [Array of partial nodes], remove: [Array of nodeIds]},
+     *   edges: {add: [Array of edges], update: [Array of partial edges], remove: [Array of edgeIds]}
+     * }
+     * Every key is optional. Updates are merged into the existing items, as with the vis.js DataSet.update function.
+     * Note that the `data` property is not rewritten to reflect the delta.
+     */
+    dataDelta: PropTypes.shape({
+        version: PropTypes.number,
+        nodes: PropTypes.shape({
+            add: PropTypes.arrayOf(PropTypes.object),
+            update: PropTypes.arrayOf(PropTypes.object),
+            remove: PropTypes.array,
+        }),
+        edges: PropTypes.shape({
+            add: PropTypes.arrayOf(PropTypes.object),
+            update: PropTypes.arrayOf(PropTypes.object),
+            remove: PropTypes.array,
+        }),
+    }),
+
+    /**
+     * Read-only prop.
+     * Version of the last `dataDelta` applied to the graph. If the delta did not carry a version, a counter of
+     * applied deltas is reported instead. Listen to this property to know when it is safe to send the next delta.
+     */
+    dataDeltaVersion: PropTypes.number,
+
+    /**
+     * If true, double-clicking nodes sends an expandRequest for them, to be answered with a dataDelta holding
+     * their neighbours (see dashvis.expansion.Expansion). Nodes are expanded once until `data` changes, and
+     * cluster nodes are not expanded. Independent of `enableHciEvents`.
+     */
+    expandOnDoubleClick: PropTypes.bool,
+
+    /**
+     * Read-only prop. Only used when `expandOnDoubleClick` is enabled.
+     * Sent when the user double-clicks nodes which were not expanded yet:
+     * {
+     *   nodeIds: [Array of nodeIds],  // nodes to expand
+     *   expanded: [Array of nodeIds],  // nodes whose expansion was applied, in order
+     *   requestId: Number  // increasing, to be returned as the version of the dataDelta
+     * }
+     * Nodes count as expanded once a dataDelta whose version is the requestId has been applied. Until then they are
+     * sent again with the next request, so a response which is lost or superseded does not leave them unexpanded.
+     */
+    expandRequest: PropTypes.exact({
+        nodeIds: PropTypes.array,
+        expanded: PropTypes.array,
+        requestId: PropTypes.number,
+    }),
+
     /**
      * A graph configuration object.
      * Pass a dict set according to your preferences / usecase as per the vis.js documentation.
@@ -929,6 +1255,14 @@ DashNetwork.propTypes = {
      */
     options: PropTypes.object,
 
+    /**
+     * Read-only prop.
+     * The options which changed with the last update of `options`, as a list of dotted paths such as
+     * 'interaction.hover'. Only these options are passed on to vis.js.
+     * Note that removing an option from `options` does not reset it to its default value.
+     */
+    optionsChanged: PropTypes.arrayOf(PropTypes.string),
+
     /**
      * Defines CSS styles which will override styles previously set.
      */
@@ -1143,6 +1477,61 @@ DashNetwork.propTypes = {
      */
     hidePopup: PropTypes.number,
 
+    /**
+     * Collects events into the single `eventBatch` property instead of updating one property per event.
+     * Pass true to send all events fired within one animation frame together, or a number to collect events over a
+     * window of that many milliseconds. Defaults to false, where every event updates its own property.
+     * Must be set when the component is created.
+     */
+    eventBatching: PropTypes.oneOfType([PropTypes.bool, PropTypes.number]),
+
+    /**
+     * Read-only prop. Only used when `eventBatching` is enabled.
+     * The events fired during the last batching window, in the order they were fired:
+     * [
+     *   {seq: Number, event: 'click', params: {...}},
+     *   {seq: Number, event: 'select', params: {...}},
+     *   ...
+     * ]
+     * seq increases by one for every event over the lifetime of the component, so gaps reveal missed batches.
+     * `eventFields` and `eventRateLimits` are applied before events are added to a batch.
+     */
+    eventBatch: PropTypes.arrayOf(PropTypes.shape({
+        seq: PropTypes.number,
+        event: PropTypes.string,
+        params: PropTypes.any,
+    })),
+
+    /**
+     * Restricts the keys sent to Dash with each event. Pass a dict keyed by event name, where each value is the list
+     * of keys of the event object to keep, for example:
+     * {
+     *   click: ['nodes', 'edges'],
+     *   dragEnd: ['nodes']
+     * }
+     * Everything else (such as `pointer` and `event`) is dropped in the browser before the event is sent.
+     * Events not listed are sent in full. Must be set when the component is created.
+     */
+    eventFields: PropTypes.objectOf(PropTypes.arrayOf(PropTypes.string)),
+
+    /**
+     * Limits how often individual events are sent to Dash. Pass a dict keyed by event name, where each value is
+     * either {throttleMs: Number} or {debounceMs: Number}, for example:
+     * {
+     *   dragging: {throttleMs: 100},
+     *   zoom: {debounceMs: 250}
+     * }
+     * throttleMs sends at most one event per interval, debounceMs sends an event only once the interval has passed
+     * without another event. In both cases the last event of a burst is always delivered.
+     * Events not listed are sent as they fire. Must be set when the component is created.
+     */
+    eventRateLimits: PropTypes.objectOf(
+        PropTypes.shape({
+            throttleMs: PropTypes.number,
+            debounceMs: PropTypes.number,
+        })
+    ),
+
     /**
      * Either a boolean indicating if all event callbacks triggered the physics simulation should be enabled,
      * or a list of strings
@@ -1415,6 +1804,54 @@ DashNetwork.propTypes = {
         stabilize: PropTypes.bool,
     }),
 
+    /** Function call.
+     * Clusters nodes according to an assignment computed beforehand, for instance with dashvis.clustering, instead
+     * of evaluating a joinCondition in the browser. Pass a dict structured as:
+     * {
+     *   nodeIds: [Array of nodeIds],
+     *   clusters: [Array of cluster ids],  // the cluster of each node in nodeIds, null to leave it out
+     *   clusterProperties: {cluster id: Object},  // optional, cluster node properties (label, size...) per cluster
+     *   clusterNodeProperties: Object,  // optional, properties of every cluster node
+     *   clusterEdgeProperties: Object,  // optional
+     *   idPrefix: String,  // optional, 'cluster:' by default
+     *   stabilize: Boolean
+     * }
+     * All clusters are made in one pass. Cluster nodes get the id idPrefix followed by the cluster id, unless their
+     * properties set an id. A new assignment first opens the clusters made by the previous one, and null opens them
+     * without clustering again. Nodes which are already clustered and clusters of a single node are skipped. */
+    clusterAssignment: PropTypes.exact({
+        nodeIds: PropTypes.array,
+        clusters: PropTypes.array,
+        clusterProperties: PropTypes.object,
+        clusterNodeProperties: PropTypes.object,
+        clusterEdgeProperties: PropTypes.object,
+        idPrefix: PropTypes.string,
+        stabilize: PropTypes.bool,
+    }),
+
+    /** Read-only property.
+     * Ids of the cluster nodes made by the last clusterAssignment. */
+    assignedClusters: PropTypes.array,
+
+    /**
+     * A hierarchy of clusters to show depending on the zoom level, as built by dashvis.clustering.cluster_hierarchy:
+     * {
+     *   levels: [Array of cluster assignments],  // structured as for clusterAssignment
+     *   scales: [Array of Numbers]  // decreasing, level i + 1 is shown when the scale is below scales[i]
+     * }
+     * The assignment of the first level clusters the nodes of the graph, and every following one clusters the nodes
+     * and clusters shown at the previous level. As the user zooms out past a scale the next level is clustered, and
+     * zooming back in opens it again. This happens in the browser, without a callback. Set to null to open all levels.
+     */
+    clusterHierarchy: PropTypes.exact({
+        levels: PropTypes.arrayOf(PropTypes.object),
+        scales: PropTypes.arrayOf(PropTypes.number),
+    }),
+
+    /** Read-only property.
+     * The level of clusterHierarchy currently shown, 0 when no level is clustered. */
+    clusterLevel: PropTypes.number,
+
     /** Function call. Returns array of node ids showing in which clusters the desired node id exists in (if any).
      *  Nodes can be in clusters. Clusters can also be in clusters.
      *  This function returns and array of nodeIds showing where the node is.
@@ -1591,9 +2028,14 @@ DashNetwork.propTypes = {
      *
      *
      * Alternative inputs are a string containing a nodeId or nothing. When a string is supplied, the position of the node corresponding to the id is returned in the same format. When nothing is supplied, the positions of all nodes are returned.
-     * Note: If a non-existent id is supplied, the method will return an empty object. */
+     * Note: If a non-existent id is supplied, the method will return an empty object.
+     *
+     * For large graphs, set format to 'compact' to receive {nodeIds: [...], x: String, y: String} instead, where x and
+     * y are base64 strings of little-endian Float32 values in the order of nodeIds. This is several times smaller than
+     * the default object, and dashvis.positions.decode_positions turns it into NumPy arrays. */
     getPositions: PropTypes.shape({
         nodeIds: PropTypes.array,
+        format: PropTypes.oneOf(['object', 'compact']),
         result: PropTypes.object,
     }),
 
@@ -1631,6 +2073,25 @@ DashNetwork.propTypes = {
         y: PropTypes.number,
     }),
 
+    /** Function call.
+     * Moves many nodes at once. The supplied x and y positions have to be in canvas space:
+     * {
+     *   nodeIds: ['a', 'b', 'c'],
+     *   x: [10, 20, 30],
+     *   y: [0, -5, 5]
+     * }
+     * Instead of lists, x and y may be base64 strings of little-endian Float32 values, as built by
+     * dashvis.positions.move_nodes, which is much smaller to send for thousands of nodes.
+     * All nodes are updated with a single DataSet update and redrawn once; ids not in the network are skipped.
+     * The positions are stored in the nodes DataSet, so they are kept when data changes unless a node sets x and y.
+     * Once applied, the property is replaced by {result: Number} holding the number of nodes moved. */
+    moveNodes: PropTypes.shape({
+        nodeIds: PropTypes.array,
+        x: PropTypes.oneOfType([PropTypes.arrayOf(PropTypes.number), PropTypes.string]),
+        y: PropTypes.oneOfType([PropTypes.arrayOf(PropTypes.number), PropTypes.string]),
+        result: PropTypes.number,
+    }),
+
     /** Function call.
      * Returns a bounding box for the node including label in the format:
      * {
@@ -1841,6 +2302,34 @@ DashNetwork.propTypes = {
      */
     releaseNode: PropTypes.bool,
 
+    /** Batched method calls */
+    /** Function call.
+     * Calls a sequence of network methods in one go, in the given order. Pass a list of calls structured as:
+     * [
+     *   {method: 'selectNodes', args: [['a', 'b']]},
+     *   {method: 'focus', args: ['a', {scale: 1.5}]},
+     *   {method: 'getPositions', args: [['a', 'b']]}
+     * ]
+     * `method` is the name of any vis.js Network method also available as a property of this component, and `args`
+     * are its positional arguments. Clustering options may contain function strings, as in the clustering properties.
+     * The results of all calls are reported together in `methodResults`.
+     */
+    methodCalls: PropTypes.arrayOf(PropTypes.exact({
+        method: PropTypes.string.isRequired,
+        args: PropTypes.array,
+    })),
+
+    /** Read-only property.
+     * One entry per call of the last `methodCalls`, in the same order, structured as
+     * {method: String, result: any} or, if the call failed, {method: String, error: String}.
+     * A failing call does not prevent the following calls from running.
+     */
+    methodResults: PropTypes.arrayOf(PropTypes.shape({
+        method: PropTypes.string,
+        result: PropTypes.any,
+        error: PropTypes.string,
+    })),
+
     /** Methods to use with the configurator module. */
     /** Function call.
      * If you use the configurator, you can call this method to get an options object that contains all differences
@@ -1848,6 +2337,28 @@ DashNetwork.propTypes = {
      */
     getOptionsFromConfigurator: PropTypes.object,
 
+    /**
+     * If true, the component reports internal statistics through the `debugInfo` property.
+     */
+    debug: PropTypes.bool,
+
+    /**
+     * Read-only prop. Only updated when `debug` is true.
+     * Internal statistics of the component, structured as:
+     * {
+     *   functionCache: {
+     *     hits: Number,       // function strings found already compiled
+     *     misses: Number,     // function strings compiled
+     *     evictions: Number,  // compiled functions dropped to keep the cache bounded
+     *     size: Number,       // compiled functions currently cached
+     *     maxSize: Number
+     *   }
+     * }
+     * Function strings passed through `options`, the clustering properties and `on`/`off`/`once` are compiled once
+     * and reused for as long as the same source text keeps coming back.
+     */
+    debugInfo: PropTypes.object,
+
     /**
      * Dash-assigned callback that should be called to report property changes
      * to Dash, to make them available for callbacks.
@@ -1868,9 +2379,18 @@ DashNetwork.defaultProps = {
             {from: 2, to: 5}]
     },
     options: {},
+    dataColumns: null,
+    validateData: true,
+    echoData: false,
+    dataDelta: null,
+    expandOnDoubleClick: false,
     enableHciEvents: false,
     enablePhysicsEvents: false,
     enableOtherEvents: false,
+    debug: false,
+    eventBatching: false,
+    eventFields: {},
+    eventRateLimits: {},
     enableEditMode: false,
     disableEditMode: false,
     addNodeMode: false,
@@ -1883,6 +2403,8 @@ DashNetwork.defaultProps = {
     canvasToDOM: null,
     DOMtoCanvas: null,
     cluster: null,
+    clusterAssignment: null,
+    clusterHierarchy: null,
     clusterByConnection: null,
     clusterNodesByConnection: null,
     clusterByConnections: null,
@@ -1893,9 +2415,11 @@ DashNetwork.defaultProps = {
     getConnectedEdges: null,
     getConnectedNodes: null,
     moveNode: null,
+    moveNodes: null,
     startSimulation: null,
     stopSimulation: null,
     stabilize: null,
+    methodCalls: null,
     resize: {},
     initRedraw: {},
     beforeDrawing: {},
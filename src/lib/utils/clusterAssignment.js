@@ -0,0 +1,135 @@
+/**
+ * Application of cluster assignments computed on the server (see dashvis.clustering).
+ *
+ * Network.cluster evaluates a joinCondition over every node for each cluster made. Here the members of every
+ * cluster are known up front, so all clusters are built from a single pass over the assignment, and the network
+ * data is refreshed once at the end, as vis.js does itself in clusterByHubsize and clusterOutliers.
+ *
+ * That relies on parts of vis-network which are not public (PRIVATE_CLUSTERING_API), which is why package.json pins
+ * its version. Should they go away, clusters are made with the public Network.cluster instead, one joinCondition
+ * pass and data refresh per cluster.
+ */
+
+/**
+ * The private vis-network members used here: Network.clustering._cluster(childNodes, childEdges, options, refresh),
+ * Network.clustering.clusteredEdges and Network.body.emitter, which refreshes the data on '_dataChanged'.
+ */
+export const PRIVATE_CLUSTERING_API = ['clustering._cluster', 'clustering.clusteredEdges', 'body.emitter.emit'];
+
+/**
+ * Returns true if `net` has the private members of PRIVATE_CLUSTERING_API.
+ */
+export function hasPrivateClusteringApi(net) {
+    const clustering = net.clustering;
+    const emitter = net.body && net.body.emitter;
+    return clustering !== undefined && typeof clustering._cluster === 'function'
+        && typeof clustering.clusteredEdges === 'object' && clustering.clusteredEdges !== null
+        && emitter !== undefined && typeof emitter.emit === 'function';
+}
+
+/**
+ * Groups a cluster assignment {nodeIds: [...], clusters: [...]} by cluster.
+ * Returns a Map from cluster id to the list of its node ids, in order of first appearance.
+ */
+export function groupAssignment(assignment) {
+    const groups = new Map();
+    const node_ids = assignment.nodeIds || [];
+    const clusters = assignment.clusters || [];
+    if (node_ids.length !== clusters.length) {
+        throw new Error('clusterAssignment expects as many clusters as node ids');
+    }
+    for (let i = 0; i < node_ids.length; i++) {
+        const cluster = clusters[i];
+        if (cluster === null || cluster === undefined) {
+            continue;
+        }
+        if (!groups.has(cluster)) {
+            groups.set(cluster, []);
+        }
+        groups.get(cluster).push(node_ids[i]);
+    }
+    return groups;
+}
+
+/**
+ * Opens the clusters `clusterNodeIds` which still exist, refreshing the network data once.
+ */
+export function openClusters(net, clusterNodeIds) {
+    const refresh_once = hasPrivateClusteringApi(net);
+    for (let i = 0; i < clusterNodeIds.length; i++) {
+        if (net.isCluster(clusterNodeIds[i])) {
+            net.openCluster(clusterNodeIds[i], undefined, !refresh_once);
+        }
+    }
+    if (refresh_once) {
+        net.body.emitter.emit('_dataChanged');
+    }
+}
+
+/**
+ * Clusters the nodes of `net` according to `assignment`:
+ * {
+ *   nodeIds: [...], clusters: [...],           // parallel arrays, the cluster of every clustered node
+ *   clusterProperties: {cluster: {...}},       // optional, cluster node properties per cluster
+ *   clusterNodeProperties: {...},              // optional, properties shared by every cluster node
+ *   clusterEdgeProperties: {...}               // optional
+ * }
+ * Cluster nodes get the id `idPrefix` (an optional key of the assignment, 'cluster:' by default) followed by the
+ * cluster, unless their properties set one.
+ * Nodes missing from the network or already in a cluster are skipped, as are clusters left with a single node
+ * (unless allowSingleNodeCluster is set). Returns the ids of the cluster nodes made.
+ */
+export function applyClusterAssignment(net, assignment) {
+    const groups = groupAssignment(assignment);
+    const properties = assignment.clusterProperties || {};
+    const clustering = net.clustering;
+    const id_prefix = assignment.idPrefix === undefined ? 'cluster:' : assignment.idPrefix;
+    const made = [];
+    const nodePropertiesOf = cluster => Object.assign({id: id_prefix + cluster},
+        assignment.clusterNodeProperties, properties[cluster]);
+
+    if (!hasPrivateClusteringApi(net)) {
+        for (const [cluster, members] of groups) {
+            const member_ids = new Set(members);
+            const cluster_node_properties = nodePropertiesOf(cluster);
+            net.cluster({
+                joinCondition: node => member_ids.has(node.id),
+                clusterNodeProperties: cluster_node_properties,
+                clusterEdgeProperties: Object.assign({}, assignment.clusterEdgeProperties),
+            });
+            if (net.isCluster(cluster_node_properties.id)) {
+                made.push(cluster_node_properties.id);
+            }
+        }
+        return made;
+    }
+
+    for (const [cluster, members] of groups) {
+        const child_nodes = {};
+        const child_edges = {};
+        for (let i = 0; i < members.length; i++) {
+            const node = net.body.nodes[members[i]];
+            if (node === undefined) {
+                continue;
+            }
+            child_nodes[members[i]] = node;
+            for (let j = 0; j < node.edges.length; j++) {
+                const edge = node.edges[j];
+                if (clustering.clusteredEdges[edge.id] === undefined) {
+                    child_edges[edge.id] = edge;
+                }
+            }
+        }
+
+        const cluster_node_properties = nodePropertiesOf(cluster);
+        clustering._cluster(child_nodes, child_edges, {
+            clusterNodeProperties: cluster_node_properties,
+            clusterEdgeProperties: Object.assign({}, assignment.clusterEdgeProperties),
+        }, false);
+        if (net.body.nodes[cluster_node_properties.id] !== undefined) {
+            made.push(cluster_node_properties.id);
+        }
+    }
+    net.body.emitter.emit('_dataChanged');
+    return made;
+}
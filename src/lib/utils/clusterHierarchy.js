@@ -0,0 +1,54 @@
+/**
+ * Zoom-driven display of a precomputed cluster hierarchy (see dashvis.clustering.cluster_hierarchy).
+ *
+ * The hierarchy holds one cluster assignment per level, each clustering the nodes or clusters shown at the level
+ * below, and the scales under which each level is shown. Zooming out applies the next levels, zooming in opens
+ * them again, all in the browser.
+ */
+import {applyClusterAssignment, openClusters} from './clusterAssignment.js';
+
+/**
+ * Returns the level to show at `scale`: the number of leading `scales` (in decreasing order) it is below.
+ */
+export function levelForScale(scales, scale) {
+    let level = 0;
+    while (level < scales.length && scale < scales[level]) {
+        level += 1;
+    }
+    return level;
+}
+
+export default class ClusterHierarchy {
+
+    constructor(net, hierarchy) {
+        this.net = net;
+        this.levels = hierarchy.levels || [];
+        this.scales = (hierarchy.scales || []).slice(0, this.levels.length);
+        this.level = 0;
+        // Ids of the cluster nodes made at every applied level
+        this.made = [];
+    }
+
+    /**
+     * Shows the level matching `scale`. Returns true if the level changed.
+     */
+    update(scale) {
+        return this.show(levelForScale(this.scales, scale));
+    }
+
+    /**
+     * Clusters or opens levels until `level` is shown. Returns true if the level changed.
+     */
+    show(level) {
+        const previous = this.level;
+        while (this.level < level) {
+            this.made.push(applyClusterAssignment(this.net, this.levels[this.level]));
+            this.level += 1;
+        }
+        while (this.level > level) {
+            openClusters(this.net, this.made.pop());
+            this.level -= 1;
+        }
+        return this.level !== previous;
+    }
+}
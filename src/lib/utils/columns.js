@@ -0,0 +1,84 @@
+/**
+ * Expansion of columnar graph data into vis.js DataSet records.
+ *
+ * The columnar form sends every attribute once as a parallel array instead of repeating its key in every node and
+ * edge, and numeric columns may be packed as base64 typed arrays (see dashvis.columns).
+ */
+
+// DataView getter and byte width for the typed column dtypes
+const DTYPES = {
+    int8: ['getInt8', 1], uint8: ['getUint8', 1],
+    int16: ['getInt16', 2], uint16: ['getUint16', 2],
+    int32: ['getInt32', 4], uint32: ['getUint32', 4],
+    float32: ['getFloat32', 4], float64: ['getFloat64', 8],
+};
+
+/**
+ * Returns the bytes of the base64 string `text` as a DataView.
+ */
+export function decodeBase64(text) {
+    const binary = atob(text);
+    const view = new DataView(new ArrayBuffer(binary.length));
+    for (let i = 0; i < binary.length; i++) {
+        view.setUint8(i, binary.charCodeAt(i));
+    }
+    return view;
+}
+
+/**
+ * Returns the values of a column: arrays are returned as they are, and typed columns {dtype, data}, where data is a
+ * base64 string of little-endian values, are decoded into an array of numbers.
+ */
+export function decodeColumn(column) {
+    if (Array.isArray(column)) {
+        return column;
+    }
+    if (!Object.prototype.hasOwnProperty.call(DTYPES, column.dtype)) {
+        throw new Error('Unsupported column dtype ' + column.dtype);
+    }
+    const [getter, size] = DTYPES[column.dtype];
+    const view = decodeBase64(column.data);
+    const values = new Array(view.byteLength / size);
+    for (let i = 0; i < values.length; i++) {
+        values[i] = view[getter](i * size, true);
+    }
+    return values;
+}
+
+/**
+ * Expands `columns`, an object mapping attribute names to columns of equal length, into a list of records.
+ * Null values, and NaN values of numeric columns, are left out of the records so that vis.js applies its defaults.
+ */
+export function expandColumns(columns) {
+    if (!columns) {
+        return [];
+    }
+    const keys = Object.keys(columns);
+    const values = keys.map(key => decodeColumn(columns[key]));
+    const length = values.length > 0 ? values[0].length : 0;
+    for (let k = 0; k < keys.length; k++) {
+        if (values[k].length !== length) {
+            throw new Error('Column ' + keys[k] + ' has ' + values[k].length + ' values, expected ' + length);
+        }
+    }
+
+    const records = new Array(length);
+    for (let i = 0; i < length; i++) {
+        const record = {};
+        for (let k = 0; k < keys.length; k++) {
+            const value = values[k][i];
+            if (value !== null && value !== undefined && !Number.isNaN(value)) {
+                record[keys[k]] = value;
+            }
+        }
+        records[i] = record;
+    }
+    return records;
+}
+
+/**
+ * Expands a dataColumns property {nodes: columns, edges: columns} into the {nodes, edges} form of the data property.
+ */
+export function expandDataColumns(dataColumns) {
+    return {nodes: expandColumns(dataColumns.nodes), edges: expandColumns(dataColumns.edges)};
+}
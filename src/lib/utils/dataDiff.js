@@ -0,0 +1,104 @@
+/**
+ * Linear-time diffing of node / edge records against the contents of a vis DataSet.
+ *
+ * The previous implementation looked up every existing id in the incoming id list with indexOf,
+ * which is O(n*m) and freezes the browser on graphs with tens of thousands of items. Here both
+ * sides are indexed once (Set / Map), so a full diff is O(n + m).
+ */
+import {isEqual} from './isEqual.js';
+
+/**
+ * Returns true if applying `next` with DataSet.update would modify `previous`.
+ * DataSet.update merges fields, so keys missing from `next` never count as a change.
+ */
+export function recordChanged(previous, next) {
+    for (const key in next) {
+        if (Object.prototype.hasOwnProperty.call(next, key) && !isEqual(previous[key], next[key])) {
+            return true;
+        }
+    }
+    return false;
+}
+
+/**
+ * Computes the difference between the items currently stored (`existing`, as returned by DataSet.get())
+ * and the desired list of `records`.
+ *
+ * Returns an object {add, update, remove}:
+ *   add:    records whose id is not present yet (records without an id are always added, as vis
+ *           generates a fresh id for them)
+ *   update: records whose id is present and whose content differs from the stored item
+ *   remove: ids of stored items which are not present in `records`
+ * Records whose content has not changed are skipped entirely.
+ */
+export function diffRecords(existing, records) {
+    const existing_by_id = new Map();
+    for (let i = 0; i < existing.length; i++) {
+        existing_by_id.set(existing[i].id, existing[i]);
+    }
+
+    const add = [];
+    const update = [];
+    const seen_ids = new Set();
+    for (let i = 0; i < records.length; i++) {
+        const record = records[i];
+        if (record.id === undefined || record.id === null) {
+            add.push(record);
+            continue;
+        }
+        seen_ids.add(record.id);
+        const previous = existing_by_id.get(record.id);
+        if (previous === undefined) {
+            add.push(record);
+        } else if (recordChanged(previous, record)) {
+            update.push(record);
+        }
+    }
+
+    const remove = [];
+    for (const id of existing_by_id.keys()) {
+        if (!seen_ids.has(id)) {
+            remove.push(id);
+        }
+    }
+
+    return {add, update, remove};
+}
+
+/**
+ * Brings `dataSet` in line with `records`, touching only the items which actually changed.
+ * Returns the computed diff.
+ */
+export function syncDataSet(dataSet, records) {
+    const diff = diffRecords(dataSet.get(), records || []);
+    if (diff.remove.length > 0) {
+        dataSet.remove(diff.remove);
+    }
+    if (diff.add.length > 0 || diff.update.length > 0) {
+        // update() both inserts and merges, which keeps duplicated ids in the input from throwing
+        dataSet.update(diff.add.concat(diff.update));
+    }
+    return diff;
+}
+
+/**
+ * Applies an incremental change set of the form {add: [...], update: [...], remove: [ids]} to `dataSet`.
+ * Any of the three keys may be omitted. Returns the number of items touched.
+ */
+export function applyDelta(dataSet, delta) {
+    if (!delta) {
+        return 0;
+    }
+    let touched = 0;
+    if (delta.remove && delta.remove.length > 0) {
+        dataSet.remove(delta.remove);
+        touched += delta.remove.length;
+    }
+    const upserts = (delta.add || []).concat(delta.update || []);
+    if (upserts.length > 0) {
+        // add and update are both applied with update() so that a re-sent delta is harmless
+        dataSet.update(upserts);
+        touched += upserts.length;
+    }
+    return touched;
+}
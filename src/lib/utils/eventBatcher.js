@@ -0,0 +1,72 @@
+/**
+ * Collects network events into ordered batches, so that a burst of interaction reaches Dash as a single
+ * property update instead of one update per event.
+ */
+export class EventBatcher {
+
+    /**
+     * `flush` is called with the list of collected events, each structured as {seq, event, params}.
+     * `windowMs` is the collection window in milliseconds; when it is not a positive number, events are
+     * collected until the next animation frame.
+     */
+    constructor(flush, windowMs) {
+        this.flushCallback = flush;
+        this.windowMs = windowMs;
+        this.pending = [];
+        this.seq = 0;
+        this.handle = null;
+        this.flush = this.flush.bind(this);
+    }
+
+    push(event_name, params) {
+        this.seq += 1;
+        this.pending.push({seq: this.seq, event: event_name, params: params});
+        if (this.handle === null) {
+            this.schedule();
+        }
+    }
+
+    schedule() {
+        if (this.windowMs > 0 || typeof window === 'undefined' || !window.requestAnimationFrame) {
+            this.handle = {timeout: setTimeout(this.flush, this.windowMs > 0 ? this.windowMs : 16)};
+        } else {
+            this.handle = {frame: window.requestAnimationFrame(this.flush)};
+        }
+    }
+
+    flush() {
+        this.handle = null;
+        if (this.pending.length === 0) {
+            return;
+        }
+        const batch = this.pending;
+        this.pending = [];
+        this.flushCallback(batch);
+    }
+
+    cancel() {
+        if (this.handle !== null) {
+            if (this.handle.frame !== undefined) {
+                window.cancelAnimationFrame(this.handle.frame);
+            } else {
+                clearTimeout(this.handle.timeout);
+            }
+            this.handle = null;
+        }
+        this.pending = [];
+    }
+}
+
+/**
+ * Returns an EventBatcher for the `eventBatching` property value, or null if batching is disabled.
+ * true batches per animation frame, a number batches over a window of that many milliseconds.
+ */
+export function createEventBatcher(eventBatching, flush) {
+    if (eventBatching === true) {
+        return new EventBatcher(flush, 0);
+    }
+    if (typeof eventBatching === 'number' && eventBatching > 0) {
+        return new EventBatcher(flush, eventBatching);
+    }
+    return null;
+}
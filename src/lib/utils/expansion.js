@@ -0,0 +1,56 @@
+/**
+ * Expand-on-demand requests (see dashvis.expansion).
+ *
+ * The server answers a request with a dataDelta holding only what the browser lacks. It works out what the browser
+ * holds from the nodes expanded before, which every request lists, so no state is kept per client on the server.
+ * A node therefore only counts as expanded once the dataDelta answering its request has been applied: responses
+ * may be lost (callback errors, PreventUpdate, or a response dropped because a newer request superseded it).
+ */
+
+export default class ExpansionTracker {
+
+    constructor() {
+        this.reset();
+    }
+
+    /**
+     * Forgets every expansion, for instance when new data replaces the graph.
+     */
+    reset() {
+        // Nodes whose expansion has been applied, in order
+        this.expanded = [];
+        // Nodes of the last request not answered yet, and its id
+        this.pending = [];
+        this.pending_request_id = null;
+    }
+
+    /**
+     * Returns the expandRequest for double-clicked `nodeIds`, or null if they are all expanded already or are
+     * cluster nodes (per `isCluster`). The nodes of an unanswered request are requested again along with them,
+     * as its response is dropped once a newer request is sent.
+     */
+    request(nodeIds, isCluster, requestId) {
+        const done = new Set(this.expanded);
+        const clicked = (nodeIds || []).filter(node_id => !done.has(node_id) && !isCluster(node_id));
+        if (clicked.length === 0) {
+            return null;
+        }
+        this.pending = Array.from(new Set(this.pending.concat(clicked)));
+        this.pending_request_id = requestId;
+        return {nodeIds: this.pending.slice(), expanded: this.expanded.slice(), requestId};
+    }
+
+    /**
+     * Records the nodes of the pending request as expanded if `version`, that of a dataDelta just applied, is its
+     * request id. Returns true in that case.
+     */
+    applied(version) {
+        if (this.pending_request_id === null || version !== this.pending_request_id) {
+            return false;
+        }
+        this.expanded.push(...this.pending);
+        this.pending = [];
+        this.pending_request_id = null;
+        return true;
+    }
+}
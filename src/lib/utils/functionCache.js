@@ -0,0 +1,52 @@
+/**
+ * Bounded cache of functions compiled from their source text.
+ *
+ * Options and clustering props carry callbacks (addNode, ctxRenderer, joinCondition...) as strings, which used to be
+ * compiled again on every update. The cache keeps the least recently used entries out once `maxSize` is reached.
+ */
+export default class FunctionCache {
+
+    constructor(maxSize) {
+        this.maxSize = maxSize;
+        this.entries = new Map();
+        this.hits = 0;
+        this.misses = 0;
+        this.evictions = 0;
+    }
+
+    /**
+     * Returns the function compiled from `source`, calling `compile(source)` only if it is not cached yet.
+     * Results other than functions (for instance null when compilation failed) are not cached.
+     */
+    get(source, compile) {
+        if (this.entries.has(source)) {
+            const func = this.entries.get(source);
+            // Map keeps insertion order: re-inserting marks the entry as most recently used
+            this.entries.delete(source);
+            this.entries.set(source, func);
+            this.hits += 1;
+            return func;
+        }
+
+        this.misses += 1;
+        const func = compile(source);
+        if (typeof func === 'function') {
+            this.entries.set(source, func);
+            if (this.entries.size > this.maxSize) {
+                this.entries.delete(this.entries.keys().next().value);
+                this.evictions += 1;
+            }
+        }
+        return func;
+    }
+
+    stats() {
+        return {
+            hits: this.hits,
+            misses: this.misses,
+            evictions: this.evictions,
+            size: this.entries.size,
+            maxSize: this.maxSize,
+        };
+    }
+}
@@ -0,0 +1,55 @@
+/**
+ * Structural deep equality for JSON-like values (objects, arrays and primitives), as received from Dash.
+ *
+ * Unlike comparing JSON.stringify outputs it allocates nothing, stops at the first difference and does not depend
+ * on the order of object keys. NaN is considered equal to itself, and Dates are equal if they hold the same time.
+ */
+const hasOwnProperty = Object.prototype.hasOwnProperty;
+
+export function isEqual(a, b) {
+    if (a === b) {
+        return true;
+    }
+    if (typeof a !== 'object' || typeof b !== 'object' || a === null || b === null) {
+        // eslint-disable-next-line no-self-compare
+        return a !== a && b !== b;
+    }
+
+    const a_is_date = a instanceof Date;
+    if (a_is_date || b instanceof Date) {
+        // Dates have no own keys, so they would all compare equal below
+        return a_is_date && b instanceof Date && isEqual(a.getTime(), b.getTime());
+    }
+
+    const a_is_array = Array.isArray(a);
+    if (a_is_array !== Array.isArray(b)) {
+        return false;
+    }
+    if (a_is_array) {
+        if (a.length !== b.length) {
+            return false;
+        }
+        for (let i = 0; i < a.length; i++) {
+            if (!isEqual(a[i], b[i])) {
+                return false;
+            }
+        }
+        return true;
+    }
+
+    let key_count = 0;
+    for (const key in a) {
+        if (hasOwnProperty.call(a, key)) {
+            if (!hasOwnProperty.call(b, key) || !isEqual(a[key], b[key])) {
+                return false;
+            }
+            key_count += 1;
+        }
+    }
+    for (const key in b) {
+        if (hasOwnProperty.call(b, key)) {
+            key_count -= 1;
+        }
+    }
+    return key_count === 0;
+}
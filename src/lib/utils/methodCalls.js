@@ -0,0 +1,59 @@
+/**
+ * Batched execution of vis.js Network methods, so that a sequence of actions costs one Dash round-trip.
+ */
+
+/**
+ * Network methods which may be called through the `methodCalls` property. The value gives the position of the
+ * clustering options argument, whose function strings are compiled before the call, or null.
+ */
+export const NETWORK_METHODS = {
+    // Global and canvas
+    redraw: null, setSize: null, canvasToDOM: null, DOMtoCanvas: null,
+    // Clustering
+    cluster: 0, clusterByConnection: 1, clusterByHubsize: 1, clusterOutliers: 0, findNode: null,
+    getClusteredEdges: null, getBaseEdges: null, updateEdge: null, updateClusteredNode: null, isCluster: null,
+    getNodesInCluster: null, openCluster: null,
+    // Layout and manipulation
+    getSeed: null, enableEditMode: null, disableEditMode: null, addNodeMode: null, editNode: null, addEdgeMode: null,
+    editEdgeMode: null, deleteSelected: null,
+    // Nodes and edges
+    getPositions: null, getPosition: null, storePositions: null, moveNode: null, getBoundingBox: null,
+    getConnectedNodes: null, getConnectedEdges: null,
+    // Physics
+    startSimulation: null, stopSimulation: null, stabilize: null,
+    // Selection
+    getSelection: null, getSelectedNodes: null, getSelectedEdges: null, getNodeAt: null, getEdgeAt: null,
+    selectNodes: null, selectEdges: null, setSelection: null, unselectAll: null,
+    // Viewport
+    getScale: null, getViewPosition: null, focus: null, moveTo: null, fit: null, releaseNode: null,
+    // Configurator
+    getOptionsFromConfigurator: null,
+};
+
+/**
+ * Runs `calls`, a list of {method, args}, in order on `net` and returns one result per call:
+ * {method, result} on success, or {method, error} if the method is unknown or threw.
+ * A failing call does not stop the following ones. `prepareClusterOptions` converts clustering options.
+ */
+export function runMethodCalls(net, calls, prepareClusterOptions) {
+    const results = [];
+    for (let i = 0; i < calls.length; i++) {
+        const method = calls[i].method;
+        const args = (calls[i].args || []).slice();
+        if (!Object.prototype.hasOwnProperty.call(NETWORK_METHODS, method)) {
+            results.push({method: method, error: 'Unknown method ' + method});
+            continue;
+        }
+        try {
+            const options_index = NETWORK_METHODS[method];
+            if (options_index !== null && args[options_index]) {
+                args[options_index] = prepareClusterOptions(args[options_index]);
+            }
+            const result = net[method](...args);
+            results.push({method: method, result: result === undefined ? null : result});
+        } catch (exception) {
+            results.push({method: method, error: String(exception)});
+        }
+    }
+    return results;
+}
@@ -0,0 +1,31 @@
+/**
+ * Read-only props mirroring the state of the network (selection, viewport, configurator).
+ *
+ * They are refreshed after every update of the component. Pushing them unconditionally caused a setProps round-trip,
+ * and with it another update, every time; only values whose content changed are pushed now.
+ */
+import {isEqual} from './isEqual.js';
+
+export const NETWORK_STATE_PROPS = {
+    getSelection: net => net.getSelection(),
+    getSelectedNodes: net => net.getSelectedNodes(),
+    getSelectedEdges: net => net.getSelectedEdges(),
+    getScale: net => net.getScale(),
+    getViewPosition: net => net.getViewPosition(),
+    getOptionsFromConfigurator: net => net.getOptionsFromConfigurator(),
+};
+
+/**
+ * Returns the state props whose current value in `net` differs from `props`, or null if none changed.
+ */
+export function changedNetworkState(net, props) {
+    let changed = null;
+    for (const prop_name of Object.keys(NETWORK_STATE_PROPS)) {
+        const value = NETWORK_STATE_PROPS[prop_name](net);
+        if (!isEqual(value, props[prop_name])) {
+            changed = changed || {};
+            changed[prop_name] = value;
+        }
+    }
+    return changed;
+}
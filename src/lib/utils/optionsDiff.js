@@ -0,0 +1,70 @@
+/**
+ * Structural diffing of vis.js option trees, so that only the parts of the options which changed are passed to
+ * Network.setOptions. Re-applying unchanged physics or layout options makes vis.js redo work such as restarting the
+ * stabilization.
+ */
+import {isEqual} from './isEqual.js';
+
+function isPlainObject(value) {
+    return typeof value === 'object' && value !== null && !Array.isArray(value);
+}
+
+// vis.js replaces a group as a whole when it is set, so groups are compared and passed on in full
+function isAtomic(path) {
+    return path.length === 2 && path[0] === 'groups';
+}
+
+/**
+ * Returns the paths (arrays of keys) of the values in `next` which differ from `previous`.
+ * Nested objects are compared key by key, except for individual groups; any other value (including arrays) is
+ * compared as a whole.
+ * Keys only present in `previous` are not reported, as setOptions cannot unset an option.
+ */
+export function diffOptions(previous, next, path = [], changes = []) {
+    if (!isPlainObject(next)) {
+        return changes;
+    }
+    for (const key of Object.keys(next)) {
+        const previous_value = isPlainObject(previous) ? previous[key] : undefined;
+        const next_value = next[key];
+        const key_path = path.concat(key);
+        if (isPlainObject(previous_value) && isPlainObject(next_value) && !isAtomic(key_path)) {
+            diffOptions(previous_value, next_value, key_path, changes);
+        } else if (!isEqual(previous_value, next_value)) {
+            changes.push(key_path);
+        }
+    }
+    return changes;
+}
+
+/**
+ * Builds an options object holding only the given `paths` of `source`. Paths missing from `source` are skipped.
+ */
+export function pickPaths(source, paths) {
+    const picked = {};
+    for (const path of paths) {
+        let value = source;
+        for (const key of path) {
+            value = isPlainObject(value) ? value[key] : undefined;
+        }
+        if (value === undefined) {
+            continue;
+        }
+        let target = picked;
+        for (let i = 0; i < path.length - 1; i++) {
+            if (!isPlainObject(target[path[i]])) {
+                target[path[i]] = {};
+            }
+            target = target[path[i]];
+        }
+        target[path[path.length - 1]] = value;
+    }
+    return picked;
+}
+
+/**
+ * Copies an options object as received from Dash, before prepareOptions replaces function strings in place.
+ */
+export function cloneOptions(options) {
+    return options === undefined ? undefined : JSON.parse(JSON.stringify(options));
+}
@@ -0,0 +1,78 @@
+/**
+ * Bulk node positioning and the compact coordinate encoding shared with dashvis.positions: coordinates may be sent
+ * as base64 strings of little-endian Float32 values instead of JSON number arrays.
+ */
+import {decodeBase64} from './columns.js';
+
+/**
+ * Returns `value` as an array-like of numbers: arrays are returned as they are, strings are decoded from base64.
+ */
+export function decodeFloat32(value) {
+    if (typeof value !== 'string') {
+        return value;
+    }
+    const view = decodeBase64(value);
+    const values = new Float32Array(view.byteLength >> 2);
+    for (let i = 0; i < values.length; i++) {
+        values[i] = view.getFloat32(i * 4, true);
+    }
+    return values;
+}
+
+/**
+ * Returns `values` (numbers) as a base64 string of little-endian Float32 values.
+ */
+export function encodeFloat32(values) {
+    const view = new DataView(new ArrayBuffer(values.length * 4));
+    for (let i = 0; i < values.length; i++) {
+        view.setFloat32(i * 4, values[i], true);
+    }
+    const bytes = new Uint8Array(view.buffer);
+    let binary = '';
+    // fromCharCode takes its arguments on the stack, so convert in chunks
+    for (let i = 0; i < bytes.length; i += 0x8000) {
+        binary += String.fromCharCode.apply(null, bytes.subarray(i, i + 0x8000));
+    }
+    return btoa(binary);
+}
+
+/**
+ * Returns the positions of the nodes `nodeIds` in `positions` (as returned by Network.getPositions) in compact form:
+ * {nodeIds: [...], x: String, y: String}, with the coordinates encoded by encodeFloat32. Ids without a position are
+ * left out, and the ids keep their original type instead of becoming object keys.
+ */
+export function compactPositions(positions, nodeIds) {
+    const ids = [];
+    const xs = [];
+    const ys = [];
+    for (let i = 0; i < nodeIds.length; i++) {
+        const position = positions[nodeIds[i]];
+        if (position !== undefined) {
+            ids.push(nodeIds[i]);
+            xs.push(position.x);
+            ys.push(position.y);
+        }
+    }
+    return {nodeIds: ids, x: encodeFloat32(xs), y: encodeFloat32(ys)};
+}
+
+/**
+ * Moves the nodes `nodeIds` of `dataSet` to the coordinates `x` and `y` (arrays or base64 Float32 strings) with a
+ * single DataSet update, so that the network handles all of them in one pass and one redraw.
+ * Ids which are not in the DataSet are skipped, rather than added as new nodes. Returns the number of nodes moved.
+ */
+export function moveNodes(dataSet, nodeIds, x, y) {
+    const xs = decodeFloat32(x);
+    const ys = decodeFloat32(y);
+    if (xs.length !== nodeIds.length || ys.length !== nodeIds.length) {
+        throw new Error('moveNodes expects as many x and y coordinates as node ids');
+    }
+    const updates = [];
+    for (let i = 0; i < nodeIds.length; i++) {
+        if (dataSet.get(nodeIds[i]) !== null) {
+            updates.push({id: nodeIds[i], x: xs[i], y: ys[i]});
+        }
+    }
+    dataSet.update(updates);
+    return updates.length;
+}
@@ -0,0 +1,68 @@
+/**
+ * Throttling and debouncing of high-frequency network events before they are forwarded to Dash.
+ *
+ * Both modes deliver on the trailing edge, so the last event of a burst is never lost.
+ */
+
+/**
+ * Wraps `fn` according to `limit`, which is either {throttleMs: Number} or {debounceMs: Number}.
+ *   throttleMs: the first call is delivered immediately, further calls within the window are collapsed
+ *               into a single trailing call carrying the latest arguments.
+ *   debounceMs: calls are delivered only once no further call has been made for the given time.
+ * The returned function has a cancel() method which drops any pending trailing call.
+ */
+export function rateLimit(fn, limit) {
+    if (!limit || !(limit.throttleMs > 0 || limit.debounceMs > 0)) {
+        const passthrough = function (...args) {
+            fn.apply(null, args);
+        };
+        passthrough.cancel = function () {};
+        return passthrough;
+    }
+
+    let timer = null;
+    let pending_args = null;
+    let last_call = 0;
+
+    const flush = function () {
+        timer = null;
+        if (pending_args !== null) {
+            const args = pending_args;
+            pending_args = null;
+            last_call = Date.now();
+            fn.apply(null, args);
+        }
+    };
+
+    let limited;
+    if (limit.debounceMs > 0) {
+        limited = function (...args) {
+            pending_args = args;
+            if (timer !== null) {
+                clearTimeout(timer);
+            }
+            timer = setTimeout(flush, limit.debounceMs);
+        };
+    } else {
+        limited = function (...args) {
+            const elapsed = Date.now() - last_call;
+            pending_args = args;
+            if (timer === null) {
+                if (elapsed >= limit.throttleMs) {
+                    flush();
+                } else {
+                    timer = setTimeout(flush, limit.throttleMs - elapsed);
+                }
+            }
+        };
+    }
+
+    limited.cancel = function () {
+        if (timer !== null) {
+            clearTimeout(timer);
+            timer = null;
+        }
+        pending_args = null;
+    };
+    return limited;
+}
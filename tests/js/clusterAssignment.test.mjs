@@ -0,0 +1,109 @@
+// Run with: node --test tests/js/
+import {test} from 'node:test';
+import assert from 'node:assert/strict';
+import {existsSync, readFileSync} from 'node:fs';
+
+import {
+    applyClusterAssignment, groupAssignment, hasPrivateClusteringApi, openClusters, PRIVATE_CLUSTERING_API,
+} from '../../src/lib/utils/clusterAssignment.js';
+
+const VIS_NETWORK = new URL('../../node_modules/vis-network/', import.meta.url);
+
+// Just enough of vis-network for the clustering calls: _cluster replaces its children with a cluster node
+function fakeNetwork(edges) {
+    const nodes = {};
+    for (const id of ['a', 'b', 'c', 'd']) {
+        nodes[id] = {id, edges: []};
+    }
+    for (const [id, from, to] of edges) {
+        const edge = {id, fromId: from, toId: to};
+        nodes[from].edges.push(edge);
+        nodes[to].edges.push(edge);
+    }
+    const calls = [];
+    const refreshes = [];
+    const net = {
+        calls,
+        refreshes,
+        body: {nodes, emitter: {emit: name => refreshes.push(name)}},
+        clustering: {
+            clusteredEdges: {},
+            _cluster: (child_nodes, child_edges, options, refresh) => {
+                calls.push({nodes: Object.keys(child_nodes), edges: Object.keys(child_edges), options, refresh});
+                if (Object.keys(child_nodes).length > 1) {
+                    nodes[options.clusterNodeProperties.id] = {id: options.clusterNodeProperties.id, edges: []};
+                }
+            },
+        },
+    };
+    return net;
+}
+
+test('assignments are grouped by cluster, skipping unassigned nodes', () => {
+    const groups = groupAssignment({nodeIds: ['a', 'b', 'c', 'd'], clusters: [1, 0, 1, null]});
+    assert.deepEqual([...groups], [[1, ['a', 'c']], [0, ['b']]]);
+    assert.throws(() => groupAssignment({nodeIds: ['a'], clusters: []}));
+});
+
+test('all clusters are made with one data refresh', () => {
+    const net = fakeNetwork([['ab', 'a', 'b'], ['bc', 'b', 'c']]);
+    const made = applyClusterAssignment(net, {
+        nodeIds: ['a', 'b', 'c', 'missing'],
+        clusters: [0, 0, 1, 1],
+        clusterProperties: {0: {label: 'First'}},
+        clusterNodeProperties: {shape: 'box'},
+    });
+
+    assert.deepEqual(made, ['cluster:0']);
+    assert.equal(net.calls.length, 2);
+    assert.deepEqual(net.calls[0].nodes, ['a', 'b']);
+    assert.deepEqual(net.calls[0].edges, ['ab', 'bc']);
+    assert.deepEqual(net.calls[0].options.clusterNodeProperties, {id: 'cluster:0', shape: 'box', label: 'First'});
+    assert.equal(net.calls[0].refresh, false);
+    assert.deepEqual(net.calls[1].nodes, ['c']);
+    assert.deepEqual(net.refreshes, ['_dataChanged']);
+});
+
+test('without the private API clusters are made through Network.cluster', () => {
+    const net = fakeNetwork([['ab', 'a', 'b']]);
+    delete net.clustering._cluster;
+    const conditions = [];
+    const opened = [];
+    net.cluster = options => {
+        const members = Object.values(net.body.nodes).filter(node => options.joinCondition({id: node.id}));
+        conditions.push(members.map(node => node.id));
+        if (members.length > 1) {
+            net.body.nodes[options.clusterNodeProperties.id] = {id: options.clusterNodeProperties.id, isCluster: true};
+        }
+    };
+    net.isCluster = id => net.body.nodes[id] !== undefined && net.body.nodes[id].isCluster === true;
+    net.openCluster = (id, options, refresh) => opened.push([id, refresh]);
+
+    assert.equal(hasPrivateClusteringApi(net), false);
+    const made = applyClusterAssignment(net, {nodeIds: ['a', 'b', 'c'], clusters: [0, 0, 1]});
+    assert.deepEqual(made, ['cluster:0']);
+    assert.deepEqual(conditions, [['a', 'b'], ['c']]);
+
+    // Every cluster refreshes the data when it is opened, as there is no single refresh to emit
+    openClusters(net, made);
+    assert.deepEqual(opened, [['cluster:0', true]]);
+    assert.deepEqual(net.refreshes, []);
+});
+
+test('the installed vis-network still has the private clustering API', {
+    skip: !existsSync(VIS_NETWORK) && 'vis-network is not installed (npm install)',
+}, () => {
+    const version = JSON.parse(readFileSync(new URL('package.json', VIS_NETWORK))).version;
+    const pinned = JSON.parse(readFileSync(new URL('../../package.json', import.meta.url))).dependencies['vis-network'];
+    assert.equal(version, pinned);
+
+    // The unminified ES module build holds the ClusterEngine and Network sources
+    const build = ['peer/esm/vis-network.js', 'standalone/esm/vis-network.js', 'esnext/esm/vis-network.js']
+        .map(path => new URL(path, VIS_NETWORK)).find(existsSync);
+    assert.ok(build, 'no ES module build of vis-network found');
+    const source = readFileSync(build, 'utf8');
+    assert.equal(PRIVATE_CLUSTERING_API.length, 3);
+    assert.match(source, /\b_cluster\s*\(\s*\w+\s*,\s*\w+\s*,\s*\w+/, 'ClusterEngine._cluster');
+    assert.match(source, /\.clusteredEdges\s*=/, 'ClusterEngine.clusteredEdges');
+    assert.match(source, /\.on\(\s*["']_dataChanged["']/, 'the _dataChanged listener of the network body');
+});
@@ -0,0 +1,69 @@
+// Run with: node --test tests/js/
+import {test} from 'node:test';
+import assert from 'node:assert/strict';
+
+import ClusterHierarchy, {levelForScale} from '../../src/lib/utils/clusterHierarchy.js';
+
+// Just enough of vis-network for clustering and opening: cluster nodes replace their children in body.nodes
+function fakeNetwork(ids) {
+    const nodes = {};
+    const children = {};
+    for (const id of ids) {
+        nodes[id] = {id, edges: []};
+    }
+    return {
+        nodes,
+        body: {nodes, emitter: {emit: () => undefined}},
+        isCluster: id => children[id] !== undefined,
+        openCluster: id => {
+            for (const child of children[id]) {
+                nodes[child] = {id: child, edges: []};
+            }
+            delete children[id];
+            delete nodes[id];
+        },
+        clustering: {
+            clusteredEdges: {},
+            _cluster: (child_nodes, child_edges, options) => {
+                const id = options.clusterNodeProperties.id;
+                children[id] = Object.keys(child_nodes);
+                for (const child of children[id]) {
+                    delete nodes[child];
+                }
+                nodes[id] = {id, edges: []};
+            },
+        },
+    };
+}
+
+const hierarchy = {
+    levels: [
+        {nodeIds: ['a', 'b', 'c', 'd'], clusters: [0, 0, 1, 1], idPrefix: 'cluster:1:'},
+        {nodeIds: ['cluster:1:0', 'cluster:1:1'], clusters: [0, 0], idPrefix: 'cluster:2:'},
+    ],
+    scales: [0.5, 0.25],
+};
+
+test('levels are chosen by the scales they are shown below', () => {
+    assert.equal(levelForScale([0.5, 0.25], 1), 0);
+    assert.equal(levelForScale([0.5, 0.25], 0.5), 0);
+    assert.equal(levelForScale([0.5, 0.25], 0.3), 1);
+    assert.equal(levelForScale([0.5, 0.25], 0.1), 2);
+});
+
+test('zooming out applies levels and zooming in opens them again', () => {
+    const net = fakeNetwork(['a', 'b', 'c', 'd', 'e']);
+    const clusters = new ClusterHierarchy(net, hierarchy);
+
+    assert.equal(clusters.update(1), false);
+    assert.equal(clusters.update(0.1), true);
+    assert.equal(clusters.level, 2);
+    assert.deepEqual(Object.keys(net.nodes).sort(), ['cluster:2:0', 'e']);
+
+    assert.equal(clusters.update(0.3), true);
+    assert.deepEqual(Object.keys(net.nodes).sort(), ['cluster:1:0', 'cluster:1:1', 'e']);
+    assert.equal(clusters.update(0.4), false);
+
+    clusters.show(0);
+    assert.deepEqual(Object.keys(net.nodes).sort(), ['a', 'b', 'c', 'd', 'e']);
+});
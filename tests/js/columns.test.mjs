@@ -0,0 +1,31 @@
+// Run with: node --test tests/js/
+import {test} from 'node:test';
+import assert from 'node:assert/strict';
+
+import {decodeColumn, expandColumns, expandDataColumns} from '../../src/lib/utils/columns.js';
+
+test('typed columns encoded by dashvis.columns are decoded', () => {
+    // encode_column(np.array([1, -2, 300])), encode_column(np.array([2 ** 40, -1]))
+    assert.deepEqual(decodeColumn({dtype: 'int32', data: 'AQAAAP7///8sAQAA'}), [1, -2, 300]);
+    assert.deepEqual(decodeColumn({dtype: 'float64', data: 'AAAAAAAAcEIAAAAAAADwvw=='}), [2 ** 40, -1]);
+    assert.throws(() => decodeColumn({dtype: 'int64', data: ''}));
+});
+
+test('columns expand into records, leaving out missing values', () => {
+    const data = expandDataColumns({
+        nodes: {
+            id: [1, 2],
+            label: ['a', null],
+            // encode_column(np.array([0.5, np.nan], dtype=np.float32))
+            size: {dtype: 'float32', data: 'AAAAPwAAwH8='},
+        },
+        edges: {from: [1], to: [2]},
+    });
+
+    assert.deepEqual(data, {
+        nodes: [{id: 1, label: 'a', size: 0.5}, {id: 2}],
+        edges: [{from: 1, to: 2}],
+    });
+    assert.deepEqual(expandColumns(undefined), []);
+    assert.throws(() => expandColumns({id: [1, 2], label: ['a']}), /Column label/);
+});
@@ -0,0 +1,69 @@
+// Run with: node --test tests/js/
+import {test} from 'node:test';
+import assert from 'node:assert/strict';
+
+import {applyDelta, diffRecords, recordChanged, syncDataSet} from '../../src/lib/utils/dataDiff.js';
+
+function fakeDataSet(records) {
+    const items = new Map(records.map(record => [record.id, record]));
+    const calls = [];
+    return {
+        calls,
+        get: () => Array.from(items.values()),
+        update: updates => {
+            calls.push(['update', updates]);
+            updates.forEach(record => items.set(record.id, {...items.get(record.id), ...record}));
+        },
+        remove: ids => {
+            calls.push(['remove', ids]);
+            ids.forEach(id => items.delete(id));
+        },
+    };
+}
+
+test('records only count as changed by the keys they set', () => {
+    assert.equal(recordChanged({id: 1, label: 'a', x: 5}, {id: 1, label: 'a'}), false);
+    assert.equal(recordChanged({id: 1, label: 'a'}, {id: 1, label: 'b'}), true);
+    assert.equal(recordChanged({id: 1, font: {size: 12}}, {id: 1, font: {size: 12}}), false);
+    assert.equal(recordChanged({id: 1}, {id: 1, color: null}), true);
+});
+
+test('diffs add new ids, update changed records and remove missing ids', () => {
+    const existing = [{id: 1, label: 'a'}, {id: 2, label: 'b'}, {id: 3, label: 'c'}];
+    const records = [{id: 1, label: 'a'}, {id: 2, label: 'B'}, {id: 4}, {label: 'no id'}];
+
+    assert.deepEqual(diffRecords(existing, records), {
+        add: [{id: 4}, {label: 'no id'}],
+        update: [{id: 2, label: 'B'}],
+        remove: [3],
+    });
+    assert.deepEqual(diffRecords(existing, existing), {add: [], update: [], remove: []});
+    assert.deepEqual(diffRecords([], []), {add: [], update: [], remove: []});
+});
+
+test('syncing touches only what changed, in one remove and one update', () => {
+    const dataSet = fakeDataSet([{id: 1, label: 'a'}, {id: 2, label: 'b'}]);
+
+    syncDataSet(dataSet, [{id: 1, label: 'a'}, {id: 3, label: 'c'}]);
+    assert.deepEqual(dataSet.calls, [['remove', [2]], ['update', [{id: 3, label: 'c'}]]]);
+
+    dataSet.calls.length = 0;
+    syncDataSet(dataSet, [{id: 1, label: 'a'}, {id: 3, label: 'c'}]);
+    assert.deepEqual(dataSet.calls, []);
+
+    syncDataSet(dataSet, null);
+    assert.deepEqual(dataSet.get(), []);
+});
+
+test('deltas remove, then add and update, and may be applied twice', () => {
+    const dataSet = fakeDataSet([{id: 1, label: 'a'}, {id: 2, label: 'b'}]);
+    const delta = {add: [{id: 3}], update: [{id: 1, label: 'A'}], remove: [2]};
+
+    assert.equal(applyDelta(dataSet, delta), 3);
+    assert.deepEqual(dataSet.calls, [['remove', [2]], ['update', [{id: 3}, {id: 1, label: 'A'}]]]);
+    assert.equal(applyDelta(dataSet, delta), 3);
+    assert.deepEqual(dataSet.get(), [{id: 1, label: 'A'}, {id: 3}]);
+
+    assert.equal(applyDelta(dataSet, null), 0);
+    assert.equal(applyDelta(dataSet, {add: []}), 0);
+});
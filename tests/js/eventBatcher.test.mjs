@@ -0,0 +1,59 @@
+// Run with: node --test tests/js/
+import {test} from 'node:test';
+import assert from 'node:assert/strict';
+
+import {createEventBatcher, EventBatcher} from '../../src/lib/utils/eventBatcher.js';
+
+test('events within a window are flushed as one ordered batch', (context) => {
+    context.mock.timers.enable({apis: ['setTimeout']});
+    const batches = [];
+    const batcher = new EventBatcher(batch => batches.push(batch), 50);
+
+    batcher.push('click', {nodes: [1]});
+    context.mock.timers.tick(30);
+    batcher.push('hoverNode', {node: 2});
+    assert.deepEqual(batches, []);
+    // The window starts with the first event of a batch
+    context.mock.timers.tick(20);
+    assert.deepEqual(batches, [[
+        {seq: 1, event: 'click', params: {nodes: [1]}},
+        {seq: 2, event: 'hoverNode', params: {node: 2}},
+    ]]);
+
+    // Sequence numbers keep increasing across batches
+    batcher.push('blurNode', {node: 2});
+    context.mock.timers.tick(50);
+    assert.deepEqual(batches[1], [{seq: 3, event: 'blurNode', params: {node: 2}}]);
+    context.mock.timers.tick(100);
+    assert.equal(batches.length, 2);
+});
+
+test('batches wait for the next animation frame outside a window', (context) => {
+    const frames = [];
+    globalThis.window = {requestAnimationFrame: callback => frames.push(callback), cancelAnimationFrame: () => {}};
+    context.after(() => { delete globalThis.window; });
+    const batches = [];
+    const batcher = createEventBatcher(true, batch => batches.push(batch));
+
+    batcher.push('dragging', {pointer: 1});
+    batcher.push('dragging', {pointer: 2});
+    assert.equal(frames.length, 1);
+    frames[0]();
+    assert.deepEqual(batches.map(batch => batch.map(event => event.params.pointer)), [[1, 2]]);
+});
+
+test('cancel drops pending events and batching can be disabled', (context) => {
+    context.mock.timers.enable({apis: ['setTimeout']});
+    const batches = [];
+    const batcher = createEventBatcher(20, batch => batches.push(batch));
+
+    batcher.push('click', {});
+    batcher.cancel();
+    context.mock.timers.tick(50);
+    batcher.flush();
+    assert.deepEqual(batches, []);
+
+    assert.equal(createEventBatcher(false, () => {}), null);
+    assert.equal(createEventBatcher(0, () => {}), null);
+    assert.equal(createEventBatcher(undefined, () => {}), null);
+});
@@ -0,0 +1,42 @@
+// Run with: node --test tests/js/
+import {test} from 'node:test';
+import assert from 'node:assert/strict';
+
+import ExpansionTracker from '../../src/lib/utils/expansion.js';
+
+const isCluster = id => id.startsWith('cluster:');
+
+test('requests list the nodes expanded before and skip them', () => {
+    const tracker = new ExpansionTracker();
+
+    assert.deepEqual(tracker.request(['a'], isCluster, 1), {nodeIds: ['a'], expanded: [], requestId: 1});
+    assert.equal(tracker.applied(1), true);
+    assert.deepEqual(tracker.request(['b', 'a', 'b', 'cluster:0'], isCluster, 2),
+        {nodeIds: ['b'], expanded: ['a'], requestId: 2});
+    tracker.applied(2);
+    assert.deepEqual(tracker.expanded, ['a', 'b']);
+
+    assert.equal(tracker.request(['a', 'cluster:0'], isCluster, 3), null);
+    assert.equal(tracker.request([], isCluster, 3), null);
+
+    tracker.reset();
+    assert.deepEqual(tracker.request(['a'], isCluster, 3), {nodeIds: ['a'], expanded: [], requestId: 3});
+});
+
+test('nodes of a dropped response are requested again', () => {
+    const tracker = new ExpansionTracker();
+
+    tracker.request(['a'], isCluster, 1);
+    // The response to request 1 is dropped: request 2 carries both nodes, and neither counts as expanded yet
+    assert.deepEqual(tracker.request(['b'], isCluster, 2), {nodeIds: ['a', 'b'], expanded: [], requestId: 2});
+    assert.equal(tracker.applied(1), false);
+    assert.deepEqual(tracker.expanded, []);
+    // Double-clicking a node whose response never came sends it again
+    assert.deepEqual(tracker.request(['a'], isCluster, 3), {nodeIds: ['a', 'b'], expanded: [], requestId: 3});
+
+    // Deltas without the version of the request do not confirm it
+    assert.equal(tracker.applied(undefined), false);
+    assert.equal(tracker.applied(3), true);
+    assert.deepEqual(tracker.expanded, ['a', 'b']);
+    assert.equal(tracker.request(['b'], isCluster, 4), null);
+});
@@ -0,0 +1,52 @@
+// Run with: node --test tests/js/
+import {test} from 'node:test';
+import assert from 'node:assert/strict';
+
+import FunctionCache from '../../src/lib/utils/functionCache.js';
+
+function counting() {
+    const compiled = [];
+    const compile = source => {
+        compiled.push(source);
+        return source === 'invalid' ? null : new Function('return ' + JSON.stringify(source));
+    };
+    return {compiled, compile};
+}
+
+test('sources are compiled once while cached', () => {
+    const cache = new FunctionCache(2);
+    const {compiled, compile} = counting();
+
+    const func = cache.get('a', compile);
+    assert.equal(cache.get('a', compile), func);
+    assert.equal(func(), 'a');
+    assert.deepEqual(compiled, ['a']);
+    assert.deepEqual(cache.stats(), {hits: 1, misses: 1, evictions: 0, size: 1, maxSize: 2});
+});
+
+test('the least recently used source is evicted', () => {
+    const cache = new FunctionCache(2);
+    const {compiled, compile} = counting();
+
+    cache.get('a', compile);
+    cache.get('b', compile);
+    // Using a makes b the least recently used
+    cache.get('a', compile);
+    cache.get('c', compile);
+    assert.deepEqual(Array.from(cache.entries.keys()), ['a', 'c']);
+    assert.equal(cache.stats().evictions, 1);
+
+    cache.get('b', compile);
+    assert.deepEqual(compiled, ['a', 'b', 'c', 'b']);
+    assert.deepEqual(Array.from(cache.entries.keys()), ['c', 'b']);
+});
+
+test('failed compilations are not cached', () => {
+    const cache = new FunctionCache(2);
+    const {compiled, compile} = counting();
+
+    assert.equal(cache.get('invalid', compile), null);
+    assert.equal(cache.get('invalid', compile), null);
+    assert.deepEqual(compiled, ['invalid', 'invalid']);
+    assert.equal(cache.stats().size, 0);
+});
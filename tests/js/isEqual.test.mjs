@@ -0,0 +1,39 @@
+// Run with: node --test tests/js/
+import {test} from 'node:test';
+import assert from 'node:assert/strict';
+
+import {isEqual} from '../../src/lib/utils/isEqual.js';
+
+test('primitives compare by value, NaN equals itself', () => {
+    assert.equal(isEqual(1, 1), true);
+    assert.equal(isEqual('1', 1), false);
+    assert.equal(isEqual(NaN, NaN), true);
+    assert.equal(isEqual(NaN, 0), false);
+    assert.equal(isEqual(null, undefined), false);
+    assert.equal(isEqual(null, {}), false);
+    assert.equal(isEqual(0, -0), true);
+});
+
+test('objects compare by content regardless of key order', () => {
+    assert.equal(isEqual({a: 1, b: {c: [1, 2]}}, {b: {c: [1, 2]}, a: 1}), true);
+    assert.equal(isEqual({a: 1}, {a: 1, b: undefined}), false);
+    assert.equal(isEqual({a: 1, b: 2}, {a: 1}), false);
+    assert.equal(isEqual({a: [NaN]}, {a: [NaN]}), true);
+    assert.equal(isEqual({}, {}), true);
+});
+
+test('arrays compare element by element and differ from objects', () => {
+    assert.equal(isEqual([1, [2, 3]], [1, [2, 3]]), true);
+    assert.equal(isEqual([1, 2], [2, 1]), false);
+    assert.equal(isEqual([1], [1, 1]), false);
+    assert.equal(isEqual([], {}), false);
+    assert.equal(isEqual({0: 'a', length: 1}, ['a']), false);
+});
+
+test('dates compare by time', () => {
+    assert.equal(isEqual(new Date(0), new Date(0)), true);
+    assert.equal(isEqual(new Date(0), new Date(1)), false);
+    assert.equal(isEqual({at: new Date(5)}, {at: new Date(5)}), true);
+    assert.equal(isEqual(new Date(0), {}), false);
+    assert.equal(isEqual(new Date(NaN), new Date(NaN)), true);
+});
@@ -0,0 +1,45 @@
+// Run with: node --test tests/js/
+import {test} from 'node:test';
+import assert from 'node:assert/strict';
+
+import {runMethodCalls} from '../../src/lib/utils/methodCalls.js';
+
+function fakeNetwork(log) {
+    return {
+        selectNodes: ids => { log.push(['selectNodes', ids]); },
+        focus: (id, options) => { log.push(['focus', id, options]); },
+        getPositions: ids => Object.fromEntries(ids.map(id => [id, {x: 1, y: 2}])),
+        clusterByHubsize: (hubsize, options) => { log.push(['clusterByHubsize', hubsize, options]); },
+        fit: () => { throw new Error('no canvas'); },
+        destroy: () => { log.push(['destroy']); },
+    };
+}
+
+test('calls run in order and report one result each', () => {
+    const log = [];
+    const results = runMethodCalls(fakeNetwork(log), [
+        {method: 'selectNodes', args: [['a']]},
+        {method: 'fit'},
+        {method: 'focus', args: ['a', {scale: 2}]},
+        {method: 'getPositions', args: [['a']]},
+    ], options => options);
+
+    assert.deepEqual(log, [['selectNodes', ['a']], ['focus', 'a', {scale: 2}]]);
+    assert.deepEqual(results, [
+        {method: 'selectNodes', result: null},
+        {method: 'fit', error: 'Error: no canvas'},
+        {method: 'focus', result: null},
+        {method: 'getPositions', result: {a: {x: 1, y: 2}}},
+    ]);
+});
+
+test('unknown methods are refused and clustering options are prepared', () => {
+    const log = [];
+    const results = runMethodCalls(fakeNetwork(log), [
+        {method: 'destroy'},
+        {method: 'clusterByHubsize', args: [3, {joinCondition: 'x => true'}]},
+    ], options => ({prepared: options.joinCondition}));
+
+    assert.deepEqual(results[0], {method: 'destroy', error: 'Unknown method destroy'});
+    assert.deepEqual(log, [['clusterByHubsize', 3, {prepared: 'x => true'}]]);
+});
@@ -0,0 +1,68 @@
+// Run with: node --test tests/js/
+import {test} from 'node:test';
+import assert from 'node:assert/strict';
+
+import {changedNetworkState} from '../../src/lib/utils/networkState.js';
+
+function fakeNetwork() {
+    // Returns fresh objects on every call, like vis.js does
+    const state = {nodes: [], edges: [], scale: 1, view: {x: 0, y: 0}};
+    return {
+        state,
+        getSelection: () => ({nodes: state.nodes.slice(), edges: state.edges.slice()}),
+        getSelectedNodes: () => state.nodes.slice(),
+        getSelectedEdges: () => state.edges.slice(),
+        getScale: () => state.scale,
+        getViewPosition: () => ({x: state.view.x, y: state.view.y}),
+        getOptionsFromConfigurator: () => ({}),
+    };
+}
+
+// Mimics the end of DashNetwork.componentDidUpdate and Dash merging the pushed props back in
+function update(net, props, calls) {
+    const changed = changedNetworkState(net, props);
+    if (changed !== null) {
+        calls.push(changed);
+        Object.assign(props, changed);
+    }
+}
+
+test('state props are pushed once, then only when they change', () => {
+    const net = fakeNetwork();
+    const props = {};
+    const calls = [];
+
+    update(net, props, calls);
+    assert.equal(calls.length, 1);
+    assert.deepEqual(Object.keys(calls[0]).sort(), [
+        'getOptionsFromConfigurator', 'getScale', 'getSelectedEdges', 'getSelectedNodes', 'getSelection',
+        'getViewPosition',
+    ]);
+
+    // Further updates with an unchanged network do not call setProps at all
+    update(net, props, calls);
+    update(net, props, calls);
+    assert.equal(calls.length, 1);
+
+    net.state.nodes = [3];
+    update(net, props, calls);
+    assert.equal(calls.length, 2);
+    assert.deepEqual(calls[1], {getSelection: {nodes: [3], edges: []}, getSelectedNodes: [3]});
+
+    update(net, props, calls);
+    assert.equal(calls.length, 2);
+});
+
+test('viewport changes are pushed on their own', () => {
+    const net = fakeNetwork();
+    const props = {};
+    const calls = [];
+    update(net, props, calls);
+
+    net.state.scale = 0.5;
+    net.state.view = {x: 10, y: -4};
+    update(net, props, calls);
+
+    assert.equal(calls.length, 2);
+    assert.deepEqual(calls[1], {getScale: 0.5, getViewPosition: {x: 10, y: -4}});
+});
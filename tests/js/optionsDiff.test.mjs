@@ -0,0 +1,43 @@
+// Run with: node --test tests/js/
+import {test} from 'node:test';
+import assert from 'node:assert/strict';
+
+import {cloneOptions, diffOptions, pickPaths} from '../../src/lib/utils/optionsDiff.js';
+
+test('only the changed leaves of nested options are reported', () => {
+    const previous = {physics: {enabled: true, barnesHut: {gravitationalConstant: -2000, damping: 0.09}},
+        edges: {smooth: false}, height: '600px'};
+    const next = {physics: {enabled: true, barnesHut: {gravitationalConstant: -3000, damping: 0.09}},
+        edges: {smooth: {type: 'cubicBezier'}}, height: '600px', width: '100%'};
+
+    assert.deepEqual(diffOptions(previous, next), [
+        ['physics', 'barnesHut', 'gravitationalConstant'], ['edges', 'smooth'], ['width']]);
+    assert.deepEqual(diffOptions(next, next), []);
+    assert.deepEqual(diffOptions(undefined, {height: '1px'}), [['height']]);
+});
+
+test('arrays and groups are compared as a whole, removed keys are ignored', () => {
+    const previous = {groups: {a: {color: 'red', shape: 'dot'}}, layout: {hierarchical: {levelSeparation: 150}},
+        configure: {filter: ['nodes', 'edges']}};
+    const next = {groups: {a: {color: 'blue', shape: 'dot'}}, layout: {},
+        configure: {filter: ['nodes']}};
+
+    assert.deepEqual(diffOptions(previous, next), [['groups', 'a'], ['configure', 'filter']]);
+});
+
+test('picked paths rebuild a partial options object', () => {
+    const options = {physics: {barnesHut: {damping: 0.5, springLength: 95}}, groups: {a: {color: 'blue'}}};
+
+    assert.deepEqual(pickPaths(options, [['physics', 'barnesHut', 'damping'], ['groups', 'a'], ['missing', 'key']]),
+        {physics: {barnesHut: {damping: 0.5}}, groups: {a: {color: 'blue'}}});
+    assert.deepEqual(pickPaths(options, []), {});
+});
+
+test('cloned options are independent of the original', () => {
+    const options = {manipulation: {addNode: 'function (data, callback) { callback(data); }'}};
+    const clone = cloneOptions(options);
+    clone.manipulation.addNode = null;
+
+    assert.equal(typeof options.manipulation.addNode, 'string');
+    assert.equal(cloneOptions(undefined), undefined);
+});
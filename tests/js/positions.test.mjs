@@ -0,0 +1,41 @@
+// Run with: node --test tests/js/
+import {test} from 'node:test';
+import assert from 'node:assert/strict';
+
+import {compactPositions, decodeFloat32, encodeFloat32, moveNodes} from '../../src/lib/utils/positions.js';
+
+function fakeDataSet(ids) {
+    const items = new Map(ids.map(id => [id, {id}]));
+    const calls = [];
+    return {
+        calls,
+        get: id => items.has(id) ? items.get(id) : null,
+        update: records => { calls.push(records); },
+    };
+}
+
+test('base64 Float32 coordinates are decoded, arrays pass through', () => {
+    // Float32 little-endian 1.5, -2 and 1000000 as encoded by dashvis.positions.encode_float32
+    const encoded = Buffer.from(new Float32Array([1.5, -2, 1e6]).buffer).toString('base64');
+    assert.deepEqual(Array.from(decodeFloat32(encoded)), [1.5, -2, 1e6]);
+    const array = [1, 2];
+    assert.equal(decodeFloat32(array), array);
+});
+
+test('nodes are moved with a single update and unknown ids are skipped', () => {
+    const dataSet = fakeDataSet(['a', 'b']);
+    const moved = moveNodes(dataSet, ['a', 'missing', 'b'], [1, 2, 3], [4, 5, 6]);
+
+    assert.equal(moved, 2);
+    assert.deepEqual(dataSet.calls, [[{id: 'a', x: 1, y: 4}, {id: 'b', x: 3, y: 6}]]);
+    assert.throws(() => moveNodes(dataSet, ['a'], [1, 2], [3]));
+});
+
+test('compact positions keep id types and round-trip through the encoding', () => {
+    const compact = compactPositions({'1': {x: 0.5, y: -1}, b: {x: 2, y: 3}}, [1, 'missing', 'b']);
+
+    assert.deepEqual(compact.nodeIds, [1, 'b']);
+    assert.deepEqual(Array.from(decodeFloat32(compact.x)), [0.5, 2]);
+    assert.deepEqual(Array.from(decodeFloat32(compact.y)), [-1, 3]);
+    assert.equal(encodeFloat32([]), '');
+});
@@ -0,0 +1,74 @@
+// Run with: node --test tests/js/
+import {test} from 'node:test';
+import assert from 'node:assert/strict';
+
+import {rateLimit} from '../../src/lib/utils/rateLimit.js';
+
+function recorder() {
+    const calls = [];
+    const fn = (...args) => calls.push(args);
+    return {calls, fn};
+}
+
+test('without a limit every call is delivered at once', () => {
+    const {calls, fn} = recorder();
+    const limited = rateLimit(fn, {throttleMs: 0});
+    limited(1);
+    limited(2);
+    limited.cancel();
+    assert.deepEqual(calls, [[1], [2]]);
+});
+
+test('throttling delivers the first call and one trailing call per window', (context) => {
+    context.mock.timers.enable({apis: ['setTimeout', 'Date'], now: 1000});
+    const {calls, fn} = recorder();
+    const limited = rateLimit(fn, {throttleMs: 100});
+
+    limited('a');
+    limited('b');
+    limited('c');
+    assert.deepEqual(calls, [['a']]);
+
+    context.mock.timers.tick(99);
+    assert.deepEqual(calls, [['a']]);
+    context.mock.timers.tick(1);
+    // The trailing call carries the latest arguments
+    assert.deepEqual(calls, [['a'], ['c']]);
+
+    // A call in the next window waits for it to end
+    context.mock.timers.tick(50);
+    limited('d');
+    assert.deepEqual(calls, [['a'], ['c']]);
+    context.mock.timers.tick(50);
+    assert.deepEqual(calls, [['a'], ['c'], ['d']]);
+
+    // Once a full window passed without calls, the next one is delivered at once
+    context.mock.timers.tick(100);
+    limited('e');
+    assert.deepEqual(calls, [['a'], ['c'], ['d'], ['e']]);
+});
+
+test('debouncing delivers the last call once calls stop', (context) => {
+    context.mock.timers.enable({apis: ['setTimeout', 'Date'], now: 1000});
+    const {calls, fn} = recorder();
+    const limited = rateLimit(fn, {debounceMs: 100});
+
+    limited('a');
+    context.mock.timers.tick(60);
+    limited('b');
+    context.mock.timers.tick(60);
+    assert.deepEqual(calls, []);
+    context.mock.timers.tick(40);
+    assert.deepEqual(calls, [['b']]);
+});
+
+test('cancel drops the pending trailing call', (context) => {
+    context.mock.timers.enable({apis: ['setTimeout', 'Date'], now: 1000});
+    const {calls, fn} = recorder();
+    const limited = rateLimit(fn, {debounceMs: 100});
+
+    limited('a');
+    limited.cancel();
+    context.mock.timers.tick(200);
+    assert.deepEqual(calls, []);
+});
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+pa = pytest.importorskip('pyarrow')
+pc = pytest.importorskip('pyarrow.compute')
+
+from dashvis import GraphData  # noqa: E402
+from dashvis.arrow import from_arrow, to_numpy  # noqa: E402
+
+
+def test_numeric_columns_are_not_copied():
+    column = pa.chunked_array([pa.array([1, 2, 3], type=pa.int64())])
+    values = to_numpy(column)
+
+    assert not values.flags.writeable
+    assert np.shares_memory(values, np.frombuffer(column.chunk(0).buffers()[1], dtype=np.int64))
+    assert to_numpy(pa.array([1.5, None])).tolist()[0] == 1.5
+    assert to_numpy(pa.array(['a', None]).dictionary_encode()).tolist() == ['a', None]
+
+
+def test_edges_only_with_filter_and_sample():
+    edges = pa.table({'src': [1, 2, 3, 4], 'dst': [2, 3, 4, 1], 'weight': [0.1, 0.9, 0.8, 0.7]})
+
+    graph = from_arrow(edges, source='src', target='dst', edge_filter=pc.field('weight') > 0.5)
+    assert sorted(graph.nodes['id'].tolist()) == [1, 2, 3, 4]
+    assert graph.to_data()['edges'][0] == {'from': 2, 'to': 3, 'weight': 0.9}
+
+    sampled = GraphData.from_arrow(edges, source='src', target='dst', sample=0.5, seed=1)
+    assert sampled.edge_count == 2
+
+
+@pytest.mark.parametrize('sample, edge_count', [(1.0, 4), (0.25, 1), (np.float32(1), 4), (1, 1), (np.int64(3), 3),
+                                                (10, 4), (0, 0)])
+def test_floats_sample_fractions_and_integers_counts(sample, edge_count):
+    edges = pa.table({'from': [1, 2, 3, 4], 'to': [2, 3, 4, 1]})
+    assert from_arrow(edges, sample=sample, seed=0).edge_count == edge_count
+
+
+@pytest.mark.parametrize('sample', [1.5, 0.0, -1, True, '10'])
+def test_ambiguous_samples_are_rejected(sample):
+    edges = pa.table({'from': [1, 2], 'to': [2, 1]})
+    with pytest.raises(ValueError, match='sample'):
+        from_arrow(edges, sample=sample)
+
+
+def test_node_filter_drops_dangling_edges():
+    nodes = pa.table({'id': ['a', 'b', 'c'], 'kind': ['x', 'y', 'x']})
+    edges = pa.table({'from': ['a', 'b'], 'to': ['b', 'c']})
+
+    graph = from_arrow(edges, nodes, node_filter=pc.field('kind') == 'x', edge_columns=[])
+    assert graph.nodes['id'].tolist() == ['a', 'c']
+    assert graph.edge_count == 0
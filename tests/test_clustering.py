@@ -0,0 +1,68 @@
+import numpy as np
+
+from dashvis import GraphData, clustering
+
+
+def two_cliques():
+    # Two 4-cliques joined by the edge 3-4, plus two isolated nodes
+    edges = [(a, b) for a in range(4) for b in range(a + 1, 4)] + [(a, b) for a in range(4, 8) for b in range(a + 1, 8)]
+    return {
+        'nodes': [{'id': i, 'kind': 'ab'[i % 2] if i < 9 else None} for i in range(10)],
+        'edges': [{'from': a, 'to': b} for a, b in edges + [(3, 4)]],
+    }
+
+
+def test_components_hubs_and_attributes():
+    data = two_cliques()
+
+    np.testing.assert_array_equal(clustering.component_clusters(data), [0] * 8 + [-1, -1])
+    np.testing.assert_array_equal(clustering.hub_clusters(data, hubsize=4), [0] * 4 + [1] * 4 + [-1, -1])
+    np.testing.assert_array_equal(clustering.attribute_clusters(data, 'kind'), [0, 1] * 4 + [0, -1])
+
+
+def test_label_propagation_finds_the_cliques():
+    data = two_cliques()
+    for seed in range(5):
+        np.testing.assert_array_equal(clustering.label_propagation(data, seed=seed), [0] * 4 + [1] * 4 + [-1, -1])
+
+    graph = GraphData(np.arange(10), np.array([[e['from'], e['to']] for e in data['edges']]))
+    np.testing.assert_array_equal(clustering.label_propagation(graph, seed=0), [0] * 4 + [1] * 4 + [-1, -1])
+
+
+def test_cluster_assignment_payload():
+    data = two_cliques()
+    labels = np.array([0, 0, 0, 0, 1, 1, 1, 1, 2, -1])
+
+    payload = clustering.cluster_assignment(data, labels, properties={1: {'color': 'red'}},
+                                            cluster_node_properties={'shape': 'box'})
+    assert payload['nodeIds'] == list(range(8))
+    assert payload['clusters'] == [0] * 4 + [1] * 4
+    assert payload['clusterProperties'] == {0: {'label': '4 nodes'}, 1: {'label': '4 nodes', 'color': 'red'}}
+    assert payload['clusterNodeProperties'] == {'shape': 'box'}
+
+
+def test_cluster_hierarchy_coarsens_level_by_level():
+    # 4 groups of 4 fully connected 5-cliques, the groups joined in a ring by single edges
+    edges = []
+    for clique in range(16):
+        members = range(clique * 5, clique * 5 + 5)
+        edges += [(a, b) for a in members for b in members if a < b]
+    for group in range(4):
+        cliques = range(group * 4, group * 4 + 4)
+        edges += [(a * 5, b * 5) for a in cliques for b in cliques if a < b]
+        edges.append((group * 20 + 1, (group + 1) % 4 * 20 + 1))
+    data = {'nodes': [{'id': i} for i in range(80)], 'edges': [{'from': a, 'to': b} for a, b in edges]}
+
+    hierarchy = clustering.cluster_hierarchy(data, max_levels=2, min_nodes=2, seed=0)
+    first, second = hierarchy['levels']
+    assert hierarchy['scales'] == [0.5, 0.25]
+
+    assert first['idPrefix'] == 'cluster:1:'
+    assert len(first['clusterProperties']) == 16
+    assert first['clusterProperties'][0] == {'label': '5 nodes', 'value': 5}
+    assert sorted(second['nodeIds']) == sorted('cluster:1:' + str(cluster) for cluster in range(16))
+    assert len(second['clusterProperties']) == 4
+    assert {properties['value'] for properties in second['clusterProperties'].values()} == {20}
+
+    # Stops when a level would leave too few nodes to show
+    assert len(clustering.cluster_hierarchy(data, seed=0)['levels']) == 1
@@ -0,0 +1,41 @@
+import base64
+
+import numpy as np
+import pytest
+
+from dashvis.columns import data_columns, encode_column
+
+
+def decode(column):
+    return np.frombuffer(base64.b64decode(column['data']), dtype=np.dtype(column['dtype']).newbyteorder('<'))
+
+
+def test_numeric_columns_are_typed_and_narrowed():
+    small = encode_column(np.arange(5, dtype=np.int64))
+    large = encode_column(np.array([2 ** 40, -1]))
+
+    assert small['dtype'] == 'int32'
+    np.testing.assert_array_equal(decode(small), np.arange(5))
+    assert large['dtype'] == 'float64'
+    np.testing.assert_array_equal(decode(large), [2 ** 40, -1])
+    assert encode_column(np.array([2 ** 60])) == [2 ** 60]
+    assert encode_column(np.array([0.5], dtype=np.float32))['dtype'] == 'float32'
+
+
+def test_object_columns_replace_missing_values():
+    assert encode_column(np.array(['a', None, float('nan')], dtype=object)) == ['a', None, None]
+    assert encode_column(['a', 'b']) == ['a', 'b']
+    assert encode_column([True, False]) == [True, False]
+
+
+def test_data_columns_from_dicts_and_dataframes():
+    pd = pytest.importorskip('pandas')
+    frame = pd.DataFrame({'id': [1, 2, 3], 'label': ['a', 'b', None]})
+
+    payload = data_columns(frame, {'from': np.array([1, 2]), 'to': np.array([2, 3])})
+    assert set(payload) == {'nodes', 'edges'}
+    assert payload['nodes']['label'] == ['a', 'b', None]
+    np.testing.assert_array_equal(decode(payload['edges']['to']), [2, 3])
+
+    with pytest.raises(ValueError):
+        data_columns({'id': [1, 2], 'label': ['a']})
@@ -0,0 +1,108 @@
+import sqlite3
+
+import numpy as np
+import pytest
+
+from dashvis.data_sources import DataFrameSource, DataSource, MemorySource, NetworkXSource, SQLiteSource
+
+NODES = [{'id': 'a', 'team': 'red'}, {'id': 'b', 'team': 'blue'}, {'id': 'c', 'team': 'red'}, {'id': 'd'},
+         {'id': 'e', 'team': 'blue'}]
+EDGES = [{'from': 'a', 'to': 'b', 'weight': 1}, {'from': 'b', 'to': 'c', 'weight': 2},
+         {'from': 'c', 'to': 'd', 'weight': 3}, {'from': 'e', 'to': 'a', 'weight': 4}]
+
+
+def memory_source(tmp_path):
+    return MemorySource({'nodes': NODES, 'edges': EDGES})
+
+
+def dataframe_source(tmp_path):
+    pd = pytest.importorskip('pandas')
+    nodes = pd.DataFrame(NODES).rename(columns={'id': 'name'})
+    return DataFrameSource(nodes, pd.DataFrame(EDGES), node_id='name')
+
+
+def networkx_source(tmp_path):
+    nx = pytest.importorskip('networkx')
+    graph = nx.DiGraph()
+    graph.add_nodes_from((node['id'], {key: value for key, value in node.items() if key != 'id'}) for node in NODES)
+    graph.add_edges_from((edge['from'], edge['to'], {'weight': edge['weight']}) for edge in EDGES)
+    return NetworkXSource(graph)
+
+
+def sqlite_source(tmp_path):
+    path = str(tmp_path / 'graph.db')
+    with sqlite3.connect(path) as connection:
+        connection.execute('CREATE TABLE people (name TEXT PRIMARY KEY, team TEXT)')
+        connection.execute('CREATE TABLE knows (src TEXT, dst TEXT, weight INTEGER)')
+        connection.executemany('INSERT INTO people VALUES (?, ?)', [(node['id'], node.get('team')) for node in NODES])
+        connection.executemany('INSERT INTO knows VALUES (?, ?, ?)',
+                               [(edge['from'], edge['to'], edge['weight']) for edge in EDGES])
+    connection.close()
+    return SQLiteSource(path, nodes_table='people', edges_table='knows', node_id='name', source='src', target='dst')
+
+
+@pytest.fixture(params=[memory_source, dataframe_source, networkx_source, sqlite_source])
+def source(request, tmp_path):
+    return request.param(tmp_path)
+
+
+def edge_pairs(data):
+    return sorted((edge['from'], edge['to']) for edge in data['edges'])
+
+
+def test_paged_and_filtered_queries(source):
+    assert source.count() == 5
+    assert source.count({'team': 'red'}) == 2
+
+    first = source.page(0, size=2)
+    assert first['nodes'] == [{'id': 'a', 'team': 'red'}, {'id': 'b', 'team': 'blue'}]
+    assert first['edges'] == [{'from': 'a', 'to': 'b', 'weight': 1}]
+    assert [node['id'] for node in source.page(2, size=2)['nodes']] == ['e']
+
+    blue = source.page(0, size=10, where={'team': ['blue', 'green']})
+    assert [node['id'] for node in blue['nodes']] == ['b', 'e']
+    assert blue['edges'] == []
+    assert [node['id'] for node in source.page(where={'team': None})['nodes']] == ['d']
+
+
+def test_neighbourhood_queries(source):
+    assert sorted(source.neighbourhood_ids(['a'])) == ['a', 'b', 'e']
+    assert sorted(source.neighbourhood_ids(['a'], k=2)) == ['a', 'b', 'c', 'e']
+    assert source.neighbourhood_ids(['a'], k=3, direction='out') == ['a', 'b', 'c', 'd']
+    assert source.neighbourhood_ids(['a'], k=3, direction='in') == ['a', 'e']
+    assert len(source.neighbourhood_ids(['a'], k=3, max_nodes=2)) == 2
+
+    data = source.neighbourhood(['c'], k=1)
+    assert sorted(node['id'] for node in data['nodes']) == ['b', 'c', 'd']
+    assert edge_pairs(data) == [('b', 'c'), ('c', 'd')]
+    assert edge_pairs(source.subgraph(['a', 'e', 'missing'])) == [('e', 'a')]
+    with pytest.raises(ValueError, match='direction'):
+        source.neighbourhood(['a'], direction='up')
+
+
+def test_sqlite_queries_accept_numpy_scalars(tmp_path):
+    path = str(tmp_path / 'numbers.db')
+    with sqlite3.connect(path) as connection:
+        connection.execute('CREATE TABLE nodes (id INTEGER PRIMARY KEY, level INTEGER, active BOOLEAN)')
+        connection.execute('CREATE TABLE edges ("from" INTEGER, "to" INTEGER)')
+        connection.executemany('INSERT INTO nodes VALUES (?, ?, ?)', [(i, i % 3, i % 2) for i in range(6)])
+        connection.executemany('INSERT INTO edges VALUES (?, ?)', [(i, i + 1) for i in range(5)])
+    connection.close()
+    source = SQLiteSource(path)
+
+    # Ids and filter values taken from NumPy arrays are NumPy scalars
+    ids = np.arange(6)
+    assert source.count({'level': np.int64(0), 'active': np.bool_(True)}) == 1
+    assert source.count({'level': list(np.array([1, 2]))}) == 4
+    assert [node['id'] for node in source.node_records(ids[[4, 2]])] == [4, 2]
+    assert sorted(source.neighbours(ids[[2]])) == [1, 3]
+    assert edge_pairs(source.subgraph(ids[:3])) == [(0, 1), (1, 2)]
+
+
+def test_incomplete_adapters_cannot_be_created():
+    class NodesOnly(DataSource):
+        def nodes(self, where=None, offset=0, limit=None):
+            return []
+
+    with pytest.raises(TypeError, match='edges_between'):
+        NodesOnly()
@@ -0,0 +1,75 @@
+from dashvis.expansion import Expansion
+
+# a - b - c - d, with a hub e joined to a, b and f..i
+DATA = {
+    'nodes': [{'id': node_id} for node_id in 'abcdefghi'],
+    'edges': [{'from': 'a', 'to': 'b'}, {'from': 'b', 'to': 'c'}, {'from': 'c', 'to': 'd'}, {'from': 'e', 'to': 'a'},
+              {'from': 'e', 'to': 'b'}] + [{'from': 'e', 'to': node_id} for node_id in 'fghi'],
+}
+
+
+def ids(items):
+    return sorted(item['id'] if 'id' in item else item['from'] + item['to'] for item in items)
+
+
+def test_deltas_only_hold_what_the_browser_lacks():
+    expansion = Expansion(DATA, seeds=['a', 'b'])
+    assert expansion.initial_data() == {'nodes': [{'id': 'a'}, {'id': 'b'}], 'edges': [{'from': 'a', 'to': 'b'}]}
+
+    delta = expansion.expand({'nodeIds': ['b'], 'expanded': [], 'requestId': 1})
+    assert delta['version'] == 1
+    assert ids(delta['nodes']['add']) == ['c', 'e']
+    assert ids(delta['edges']['add']) == ['bc', 'ea', 'eb']
+
+    # The browser now holds a, b, c and e: expanding e adds its leaves, c and e share no new edge
+    delta = expansion.expand({'nodeIds': ['e'], 'expanded': ['b'], 'requestId': 2})
+    assert ids(delta['nodes']['add']) == ['f', 'g', 'h', 'i']
+    assert ids(delta['edges']['add']) == ['ef', 'eg', 'eh', 'ei']
+
+    # Nodes already expanded, unknown nodes and missing requests add nothing
+    assert expansion.expand({'nodeIds': ['b', 'x'], 'expanded': ['b']}) == {'nodes': {'add': []},
+                                                                             'edges': {'add': []}}
+    assert expansion.expand(None) is None
+
+
+def test_capped_expansion_and_explicit_known_nodes():
+    expansion = Expansion(DATA, seeds=['e'], max_nodes=2)
+
+    first = expansion.expand({'nodeIds': ['e'], 'expanded': []})
+    assert len(first['nodes']['add']) == 2
+    second = expansion.expand({'nodeIds': ['e'], 'expanded': ['e']})
+    assert not set(ids(first['nodes']['add'])) & set(ids(second['nodes']['add']))
+
+    delta = expansion.expand({'nodeIds': ['c']}, known=['c', 'd', 'b'])
+    assert ids(delta['nodes']['add']) == []
+    delta = Expansion(DATA, seeds=['c'], k=2).expand({'nodeIds': ['c']}, known=['c', 'b'])
+    assert ids(delta['nodes']['add']) == ['a', 'd', 'e']
+    assert ids(delta['edges']['add']) == ['ab', 'cd', 'ea', 'eb']
+
+
+def test_requests_only_replay_the_nodes_expanded_since_a_cached_request(monkeypatch):
+    expansion = Expansion(DATA, seeds=['a'], cache_size=2)
+    hops = []
+    k_hop = expansion.index.k_hop_rows
+
+    def counted_k_hop(seeds, *args):
+        hops.append(seeds.tolist())
+        return k_hop(seeds, *args)
+
+    monkeypatch.setattr(expansion.index, 'k_hop_rows', counted_k_hop)
+
+    expected = Expansion(DATA, seeds=['a'], cache_size=0)
+    expanded = []
+    for node_id in 'bce':
+        request = {'nodeIds': [node_id], 'expanded': list(expanded)}
+        hops.clear()
+        assert expansion.expand(request) == expected.expand(request)
+        # Only the requested node is expanded, the nodes shown come from the previous request
+        assert len(hops) == 1
+        expanded.append(node_id)
+
+    # A request whose predecessor was dropped replays from the longest prefix cached
+    hops.clear()
+    expansion.expand({'nodeIds': ['d'], 'expanded': ['b', 'c', 'd', 'f']})
+    assert len(hops) == 3
+    assert expansion.known_mask(['b', 'c']).tolist() == expected.known_mask(['b', 'c']).tolist()
@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from dashvis import GraphData
+
+
+def test_arrays_to_data_and_columns():
+    graph = GraphData(np.array([10, 20, 30]), np.array([[10, 20], [10, 30]]))
+
+    np.testing.assert_array_equal(graph.degree(), [2, 1, 1])
+    graph.size_by('degree', min_size=10, max_size=20).set_edges(width=2)
+    assert graph.to_data() == {
+        'nodes': [{'id': 10, 'size': 20.0}, {'id': 20, 'size': 10.0}, {'id': 30, 'size': 10.0}],
+        'edges': [{'from': 10, 'to': 20, 'width': 2}, {'from': 10, 'to': 30, 'width': 2}],
+    }
+    assert set(graph.to_columns()['edges']) == {'from', 'to', 'width'}
+
+
+def test_dataframes_with_renamed_columns_and_groups():
+    pd = pytest.importorskip('pandas')
+    nodes = pd.DataFrame({'name': ['a', 'b', 'c'], 'kind': pd.Series(['x', None, 'y'], dtype='string')})
+    edges = pd.DataFrame({'src': ['a'], 'dst': ['c']})
+
+    graph = GraphData(nodes, edges, node_id='name', source='src', target='dst')
+    graph.group_by('kind', {'x': 'first'}, default='other')
+    data = graph.to_data()
+
+    assert [node.get('group') for node in data['nodes']] == ['first', None, 'other']
+    assert 'kind' not in data['nodes'][1]
+    assert data['edges'] == [{'from': 'a', 'to': 'c'}]
+
+
+def test_invalid_graphs_are_rejected():
+    with pytest.raises(ValueError, match='Duplicate'):
+        GraphData(['a', 'b', 'a'])
+    with pytest.raises(ValueError, match='Duplicate'):
+        GraphData([5, 6, 5])
+    with pytest.raises(ValueError, match='unknown'):
+        GraphData([1, 2], [[1, 3]])
+    with pytest.raises(ValueError, match='unknown'):
+        GraphData(['a', 'b'], [['a', 'c']])
+    with pytest.raises(ValueError, match='Missing column'):
+        GraphData({'name': [1]})
+
+
+def test_mixed_id_types():
+    ids = np.array([1, 'a', 2.5], dtype=object)
+    graph = GraphData({'id': ids}, {'from': np.array(['a', 1], dtype=object), 'to': np.array([2.5, 'a'], dtype=object)})
+    node_ids, sources, targets = graph.edge_index()
+    assert (node_ids, sources.tolist(), targets.tolist()) == ([1, 'a', 2.5], [1, 0], [2, 1])
+    assert graph.to_data()['edges'] == [{'from': 'a', 'to': 2.5}, {'from': 1, 'to': 'a'}]
+
+    with pytest.raises(ValueError, match='Duplicate node ids: \\[1\\]'):
+        GraphData({'id': np.array([1, 'a', 1], dtype=object)})
+    with pytest.raises(ValueError, match="unknown node ids, for instance \\['b'\\]"):
+        GraphData({'id': ids}, {'from': np.array([1], dtype=object), 'to': np.array(['b'], dtype=object)})
+    # Lists mixing numbers and strings keep their types
+    assert GraphData([1, 'a'], [[1, 'a']]).to_data()['edges'] == [{'from': 1, 'to': 'a'}]
+    # Integer ids with edges referring to strings
+    with pytest.raises(ValueError, match='unknown'):
+        GraphData([1, 2], {'from': np.array([1], dtype=object), 'to': np.array(['x'], dtype=object)})
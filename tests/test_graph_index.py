@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from dashvis import GraphData
+from dashvis.graph_index import GraphIndex
+
+DATA = {
+    'nodes': [{'id': 'a', 'label': 'A'}, {'id': 'b'}, {'id': 'c'}, {'id': 'd'}, {'id': 'e'}],
+    'edges': [{'from': 'a', 'to': 'b', 'width': 2}, {'from': 'b', 'to': 'c'}, {'from': 'c', 'to': 'd'},
+              {'from': 'e', 'to': 'a'}, {'from': 'a', 'to': 'missing'}],
+}
+
+
+def test_degrees_and_k_hop_expansion():
+    index = GraphIndex(DATA)
+
+    assert index.edge_count == 4
+    np.testing.assert_array_equal(index.degree(), [2, 2, 2, 1, 1])
+    np.testing.assert_array_equal(index.degree(['a', 'd'], direction='out'), [1, 0])
+    assert index.neighbours('a') == ['b', 'e']
+    assert index.k_hop(['a'], k=2) == ['a', 'b', 'e', 'c']
+    assert index.k_hop(['a'], k=3, direction='out') == ['a', 'b', 'c', 'd']
+    assert index.k_hop(['c', 'a'], k=1, direction='in') == ['c', 'a', 'b', 'e']
+    assert index.k_hop(['a'], k=10, max_nodes=3) == ['a', 'b', 'e']
+
+    with pytest.raises(KeyError, match='missing'):
+        index.k_hop(['missing'])
+    with pytest.raises(ValueError, match='direction'):
+        index.degree(direction='up')
+
+
+def test_masked_k_hop_and_incident_edges():
+    index = GraphIndex(DATA)
+    known = np.zeros(index.node_count, dtype=bool)
+    known[index.positions(['a', 'b'])] = True
+
+    assert 'a' in index and 'missing' not in index
+    assert index.node_table is DATA['nodes']
+    assert index.k_hop_rows(index.positions(['a']), k=2, known=known).tolist() == [4, 2]
+    assert index.k_hop_rows(index.positions(['a']), k=2, max_nodes=1, known=known).tolist() == [4]
+    assert index.incident_edge_rows(index.positions(['c', 'e', 'c']), known).tolist() == [1, 3]
+
+
+def test_induced_subgraph_payloads():
+    index = GraphIndex(DATA)
+
+    assert index.subgraph(['b', 'a', 'd']) == {
+        'nodes': [{'id': 'b'}, {'id': 'a', 'label': 'A'}, {'id': 'd'}],
+        'edges': [{'from': 'a', 'to': 'b', 'width': 2}],
+    }
+    columns = index.k_hop_subgraph(['d'], k=1, columns=True)
+    assert columns['nodes'] == {'id': ['d', 'c']}
+    assert columns['edges'] == {'from': ['c'], 'to': ['d']}
+
+
+def test_graph_data_source():
+    graph = GraphData(np.arange(5), np.array([[0, 1], [1, 2], [2, 2], [3, 4]])).set_nodes(size=10)
+    index = GraphIndex(graph)
+
+    np.testing.assert_array_equal(index.degree(), [1, 2, 3, 1, 1])
+    assert index.k_hop_subgraph([2], k=1) == {
+        'nodes': [{'id': 2, 'size': 10}, {'id': 1, 'size': 10}],
+        'edges': [{'from': 1, 'to': 2}, {'from': 2, 'to': 2}],
+    }
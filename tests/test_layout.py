@@ -0,0 +1,117 @@
+import numpy as np
+
+from dashvis import layout
+
+
+def chain(length):
+    return {
+        'nodes': [{'id': i, 'label': 'Node ' + str(i)} for i in range(length)],
+        'edges': [{'from': i, 'to': i + 1} for i in range(length - 1)],
+    }
+
+
+def positions(data):
+    return np.array([[node['x'], node['y']] for node in data['nodes']])
+
+
+def test_barnes_hut_fills_positions_and_disables_physics():
+    data = chain(20)
+    result = layout.barnes_hut(data, iterations=50, seed=1)
+
+    assert [node['id'] for node in result['nodes']] == list(range(20))
+    assert all(node['physics'] is False for node in result['nodes'])
+    assert np.isfinite(positions(result)).all()
+    assert result['edges'] == data['edges']
+    # The input is left untouched
+    assert 'x' not in data['nodes'][0]
+
+
+def test_barnes_hut_is_deterministic_for_a_seed():
+    first = layout.barnes_hut(chain(30), iterations=30, seed=7)
+    second = layout.barnes_hut(chain(30), iterations=30, seed=7)
+
+    np.testing.assert_array_equal(positions(first), positions(second))
+
+
+def test_connected_nodes_end_up_closer_than_unconnected_ones():
+    pos = positions(layout.barnes_hut(chain(40), seed=3))
+
+    neighbours = np.linalg.norm(pos[1:] - pos[:-1], axis=1).mean()
+    ends = np.linalg.norm(pos[0] - pos[-1])
+    assert neighbours < ends / 5
+
+
+def test_fixed_nodes_keep_their_position():
+    data = chain(10)
+    data['nodes'][0].update(x=500.0, y=-500.0, fixed=True)
+    result = layout.barnes_hut(data, iterations=20, seed=1)
+
+    assert (result['nodes'][0]['x'], result['nodes'][0]['y']) == (500.0, -500.0)
+
+
+def test_tree_repulsion_approximates_exact_repulsion():
+    rng = np.random.default_rng(0)
+    pos = rng.uniform(-1000, 1000, size=(2000, 2))
+
+    exact = layout._exact_repulsion(pos, 1e4)
+    approximate = layout._tree_repulsion(pos, 1e4, theta=0.5)
+
+    error = np.linalg.norm(exact - approximate, axis=1) / np.linalg.norm(exact, axis=1)
+    assert np.median(error) < 0.01
+
+
+def test_connected_components_labels_in_order_of_first_node():
+    labels = layout.connected_components(7, [0, 1, 4, 6], [1, 2, 5, 3])
+
+    assert labels.tolist() == [0, 0, 0, 1, 2, 2, 1]
+
+
+def test_partition_splits_large_components():
+    parts, components = layout.partition(10, list(range(9)), list(range(1, 10)), max_partition_size=4)
+
+    assert components.tolist() == [0] * 10
+    assert sorted(np.bincount(parts).tolist()) == [2, 4, 4]
+
+
+def test_parallel_layout_keeps_components_apart():
+    data = chain(10)
+    data['nodes'] += [{'id': 'a'}, {'id': 'b'}]
+    data['edges'] += [{'from': 'a', 'to': 'b'}]
+    result = layout.parallel_layout(data, processes=1, max_partition_size=5, iterations=30, seed=0)
+
+    pos = positions(result)
+    assert np.isfinite(pos).all()
+    assert all(node['physics'] is False for node in result['nodes'])
+    # The two components do not overlap
+    chain_box = pos[:10].min(axis=0), pos[:10].max(axis=0)
+    assert not all((chain_box[0] <= pos[10]) & (pos[10] <= chain_box[1]))
+
+
+def test_empty_graphs_are_laid_out():
+    empty = {'nodes': [], 'edges': []}
+    assert layout.barnes_hut(empty) == empty
+    assert layout.parallel_layout(empty) == empty
+    assert layout.parallel_layout(empty, processes=1) == empty
+
+
+def test_parallel_layout_batches_many_small_components():
+    data = {'nodes': [{'id': i} for i in range(600)], 'edges': [{'from': i, 'to': i + 1} for i in range(0, 600, 2)]}
+    data['edges'] += [{'from': i, 'to': i + 1} for i in range(400, 409)]
+    result = layout.parallel_layout(data, processes=1, max_partition_size=100, iterations=50, seed=0)
+
+    pos = positions(result)
+    assert np.isfinite(pos).all()
+    # Pairs stay together and apart from every other pair
+    pair_length = np.linalg.norm(pos[0:400:2] - pos[1:400:2], axis=1)
+    assert pair_length.max() < 300
+    centres = (pos[0:400:2] + pos[1:400:2]) / 2
+    gaps = np.linalg.norm(centres[:, None] - centres[None], axis=2) + np.eye(len(centres)) * 1e9
+    assert gaps.min() > pair_length.max()
+
+
+def test_jobs_pack_small_tasks_together():
+    # Tasks are (part count, part size, ...): one large part, then batches of small parts
+    tasks = [(1, 90), (10, 2), (30, 2), (5, 4), (1, 30)]
+    jobs = layout._pack_jobs(tasks, max_size=50)
+
+    assert jobs == [[0], [2], [4, 1], [3]]
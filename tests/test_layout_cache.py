@@ -0,0 +1,59 @@
+import os
+
+import numpy as np
+
+from dashvis import layout
+from dashvis.layout_cache import LayoutCache, fingerprint
+
+
+def triangle(label='Node'):
+    return {
+        'nodes': [{'id': i, 'label': label + ' ' + str(i)} for i in range(3)],
+        'edges': [{'from': 0, 'to': 1}, {'from': 1, 'to': 2}, {'from': 2, 'to': 0}],
+    }
+
+
+def test_fingerprint_ignores_attributes_and_order_but_not_structure_or_seed():
+    data = triangle()
+    reordered = dict(data, nodes=list(reversed(data['nodes'])))
+
+    assert fingerprint(data, seed=1) == fingerprint(triangle('Other'), seed=1)
+    assert fingerprint(data, seed=1) == fingerprint(reordered, seed=1)
+    assert fingerprint(data, seed=1) != fingerprint(data, seed=2)
+    assert fingerprint(data, seed=1) != fingerprint(dict(data, edges=data['edges'][:2]), seed=1)
+
+
+def test_layout_is_computed_once_and_reinjected(tmp_path):
+    cache = LayoutCache(str(tmp_path))
+    calls = []
+
+    def counting_layout(data, **options):
+        calls.append(options)
+        return layout.barnes_hut(data, iterations=10, **options)
+
+    first = cache.layout(triangle(), seed=3, layout_function=counting_layout)
+    second = cache.layout(triangle('Renamed'), seed=3, layout_function=counting_layout)
+
+    assert len(calls) == 1
+    assert [(n['x'], n['y']) for n in first['nodes']] == [(n['x'], n['y']) for n in second['nodes']]
+    assert second['nodes'][0]['label'] == 'Renamed 0'
+    assert second['nodes'][0]['physics'] is False
+
+
+def test_store_accepts_get_positions_results(tmp_path):
+    cache = LayoutCache(str(tmp_path))
+    cache.store(triangle(), {'0': {'x': 1, 'y': 2}, '1': {'x': 3, 'y': 4}, '2': {'x': 5, 'y': 6}}, seed=9)
+
+    cached = cache.lookup(triangle(), seed=9)
+    assert [(n['x'], n['y']) for n in cached['nodes']] == [(1, 2), (3, 4), (5, 6)]
+    assert cache.lookup(triangle(), seed=10) is None
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    cache = LayoutCache(str(tmp_path), max_entries=2)
+    for seed in range(3):
+        cache.store(triangle(), np.zeros((3, 2)), seed=seed)
+        os.utime(os.path.join(str(tmp_path), fingerprint(triangle(), seed=seed) + '.npz'), (seed, seed))
+
+    assert cache.lookup(triangle(), seed=0) is None
+    assert cache.lookup(triangle(), seed=2) is not None
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from dashvis import positions
+
+
+def test_float32_round_trip():
+    values = np.array([0.0, -1.5, 1e6, 3.25])
+    encoded = positions.encode_float32(values)
+
+    assert isinstance(encoded, str)
+    np.testing.assert_array_equal(positions.decode_float32(encoded), values.astype(np.float32))
+
+
+def test_move_nodes_payload():
+    payload = positions.move_nodes(np.array([3, 1, 2]), [[0, 1], [2, 3], [4, 5]])
+
+    assert payload['nodeIds'] == [3, 1, 2]
+    assert all(type(node_id) is int for node_id in payload['nodeIds'])
+    np.testing.assert_array_equal(positions.decode_float32(payload['x']), [0, 2, 4])
+    np.testing.assert_array_equal(positions.decode_float32(payload['y']), [1, 3, 5])
+
+    with pytest.raises(ValueError):
+        positions.move_nodes(['a'], [[0, 1], [2, 3]])
+
+
+def test_decode_compact_get_positions_result():
+    result = {'nodeIds': ['a', 2], 'x': positions.encode_float32([1, 3]), 'y': positions.encode_float32([2, 4])}
+
+    assert positions.is_compact(result)
+    assert not positions.is_compact({'a': {'x': 1, 'y': 2}})
+    node_ids, xy = positions.decode_positions(result)
+    assert node_ids == ['a', 2]
+    assert xy.dtype == np.float32
+    np.testing.assert_array_equal(xy, [[1, 2], [3, 4]])
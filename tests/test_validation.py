@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+
+from dashvis import validation
+from dashvis.columns import data_columns
+
+
+def graph(node_count):
+    return {
+        'nodes': [{'id': i} for i in range(node_count)],
+        'edges': [{'id': 'e' + str(i), 'from': i, 'to': (i + 1) % node_count} for i in range(node_count)],
+    }
+
+
+def test_valid_graphs_have_no_problems():
+    assert validation.data_problems(graph(100)) == []
+    assert validation.data_problems(data_columns={'nodes': {'id': [1, 2]}, 'edges': {'from': [1], 'to': [2]}}) == []
+    data = graph(10)
+    assert validation.validate_data(data) is data
+
+
+def test_problems_are_reported():
+    data = graph(10)
+    data['nodes'] += [{'id': 3}, {'label': 'no id'}]
+    data['edges'] += [{'id': 'e0', 'from': 0, 'to': 'missing'}]
+
+    problems = validation.data_problems(data)
+    assert problems == [
+        '1 nodes have no id',
+        '1 duplicate node ids: 3',
+        '1 duplicate edge ids: \'e0\'',
+        '1 edges have a \'to\' which is not a node id: \'missing\'',
+    ]
+    with pytest.raises(ValueError, match='duplicate node ids'):
+        validation.validate_data(data)
+    assert validation.data_problems({'nodes': [{'id': [1]}], 'edges': []}) == [
+        'Node ids must be strings or numbers, found list']
+
+
+def test_typed_columns_are_validated():
+    payload = data_columns({'id': [1, 2, 2]}, {'from': [1], 'to': [5]})
+
+    assert validation.data_problems(data_columns=payload) == [
+        '1 duplicate node ids: 2', '1 edges have a \'to\' which is not a node id: 5']
+
+
+def test_installed_components_validate_large_graphs_once(monkeypatch):
+    class Component:
+        def __init__(self, **props):
+            self.__dict__.update(props)
+
+        def to_plotly_json(self):
+            return {'props': dict(self.__dict__)}
+
+    validation.install(Component)
+    monkeypatch.setattr(validation, 'AUTO_VALIDATE_MIN_ITEMS', 10)
+    invalid = graph(20)
+    invalid['edges'].append({'from': 0, 'to': 99})
+
+    Component(data=graph(2)).to_plotly_json()
+    Component(data=invalid, validateData=False).to_plotly_json()
+    with pytest.raises(ValueError, match='not a node id'):
+        Component(data=invalid).to_plotly_json()
+
+    calls = []
+    monkeypatch.setattr(validation, 'validate_data', lambda **value: calls.append(value))
+    component = Component(data=graph(20))
+    component.to_plotly_json()
+    component.to_plotly_json()
+    assert len(calls) == 1
+
+
+def test_generated_component_validates_unless_disabled():
+    from dashvis import DashNetwork
+
+    invalid = graph(validation.AUTO_VALIDATE_MIN_ITEMS)
+    invalid['edges'].append({'from': 0, 'to': 'missing'})
+
+    with pytest.raises(ValueError, match='not a node id'):
+        DashNetwork(id='network', data=invalid).to_plotly_json()
+    unchecked = DashNetwork(id='network', data=invalid, validateData=False).to_plotly_json()
+    assert unchecked['props']['validateData'] is False
+    assert unchecked['props']['data'] is invalid
+
+
+def test_unhashable_endpoints_are_reported():
+    data = graph(3)
+    data['edges'] += [{'from': [1], 'to': 1}, {'from': 0, 'to': {'id': 2}}]
+
+    assert validation.data_problems(data) == [
+        '1 edges have a \'from\' which is not a string or number: [1]',
+        '1 edges have a \'to\' which is not a string or number: {\'id\': 2}',
+    ]
+
+
+@pytest.mark.parametrize('dtype', ['int16', 'int32', 'float64', 'uint8'])
+def test_typed_column_lengths(dtype):
+    for count in (1, 2, 3, 15000):
+        columns = data_columns({'id': np.zeros(count, dtype=dtype)})
+        assert validation._item_count(columns) == count
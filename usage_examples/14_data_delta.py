@@ -0,0 +1,65 @@
+import dash
+import dashvis.stylesheets
+from dash import Input
+from dash import Output
+from dash import dcc
+from dash import html
+from dashvis import DashNetwork
+
+from usage_examples._common import default_options_
+
+app = dash.Dash(__name__, external_stylesheets=[dashvis.stylesheets.VIS_NETWORK_STYLESHEET],
+                suppress_callback_exceptions=True)
+
+network = DashNetwork(
+    id='network',
+    style={'height': '400px'},
+    options=default_options_,
+    data={'nodes': [{'id': 0, 'label': 'Node 0'}], 'edges': []},
+    enableHciEvents=False,
+    enablePhysicsEvents=False,
+    enableOtherEvents=False
+)
+
+app.layout = html.Div([
+    html.Header(
+        "This demo shows how to grow a network incrementally with dataDelta, "
+        "sending only the nodes and edges that changed."),
+    network,
+    html.Br(),
+    dcc.Interval(id='stream', interval=1000, max_intervals=50),
+    html.Div(["Acknowledged version: ", html.Span(id='ack')]),
+])
+
+
+@app.callback(
+    Output('network', 'dataDelta'),
+    Input('stream', 'n_intervals'),
+    prevent_initial_call=True
+)
+def stream_nodes(n_intervals):
+    new_id = n_intervals
+    return {
+        'version': n_intervals,
+        'nodes': {
+            'add': [{'id': new_id, 'label': 'Node ' + str(new_id)}],
+            'update': [{'id': new_id - 1, 'color': '#97C2FC'}],
+        },
+        'edges': {
+            'add': [{'id': 'e' + str(new_id), 'from': new_id - 1, 'to': new_id}],
+        },
+    }
+
+
+@app.callback(
+    Output('ack', 'children'),
+    Input('network', 'dataDeltaVersion'),
+)
+def show_ack(version):
+    return str(version)
+
+
+server = app.server
+
+if __name__ == '__main__':
+    app.run_server(debug=True)
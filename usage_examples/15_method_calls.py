@@ -0,0 +1,61 @@
+import json
+
+import dash
+import dashvis.stylesheets
+from dash import Input
+from dash import Output
+from dash import html
+from dashvis import DashNetwork
+
+from usage_examples._common import default_options_
+
+app = dash.Dash(__name__, external_stylesheets=[dashvis.stylesheets.VIS_NETWORK_STYLESHEET],
+                suppress_callback_exceptions=True)
+
+network = DashNetwork(
+    id='network',
+    style={'height': '400px'},
+    options=default_options_,
+    data={'nodes': [{'id': i, 'label': 'Node ' + str(i)} for i in range(1, 6)],
+          'edges': [{'id': 'e' + str(i), 'from': i, 'to': i + 1} for i in range(1, 5)]},
+    enableHciEvents=False,
+    enablePhysicsEvents=False,
+    enableOtherEvents=False
+)
+
+app.layout = html.Div([
+    html.Header(
+        "This demo shows how to run several network methods in a single round-trip with methodCalls."),
+    network,
+    html.Br(),
+    html.Button('Select, focus and read positions', id='run'),
+    html.Pre(id='results'),
+])
+
+
+@app.callback(
+    Output('network', 'methodCalls'),
+    Input('run', 'n_clicks'),
+    prevent_initial_call=True
+)
+def run_calls(n_clicks):
+    return [
+        {'method': 'selectNodes', 'args': [[1, 3]]},
+        {'method': 'focus', 'args': [1, {'scale': 1.5}]},
+        {'method': 'getPositions', 'args': [[1, 3]]},
+        {'method': 'getConnectedNodes', 'args': [1]},
+    ]
+
+
+@app.callback(
+    Output('results', 'children'),
+    Input('network', 'methodResults'),
+)
+def show_results(results):
+    return json.dumps(results, indent=2)
+
+
+server = app.server
+
+if __name__ == '__main__':
+    app.run_server(debug=True)
@@ -0,0 +1,51 @@
+import dash
+import dashvis.stylesheets
+import numpy as np
+from dash import Input
+from dash import Output
+from dash import html
+from dashvis import DashNetwork, GraphData
+from dashvis.expansion import Expansion
+
+from usage_examples._common import default_options_
+
+app = dash.Dash(__name__, external_stylesheets=[dashvis.stylesheets.VIS_NETWORK_STYLESHEET],
+                suppress_callback_exceptions=True)
+
+# A random graph of 100,000 nodes of which only node 0 is sent at first
+rng = np.random.default_rng(0)
+graph = GraphData(np.arange(100000), rng.integers(0, 100000, (300000, 2)))
+graph.set_nodes(label=graph.nodes['id'].astype(str))
+expansion = Expansion(graph, seeds=[0], max_nodes=20)
+
+network = DashNetwork(
+    id='network',
+    style={'height': '400px'},
+    options=default_options_,
+    data=expansion.initial_data(),
+    expandOnDoubleClick=True,
+    enableHciEvents=False,
+    enablePhysicsEvents=False,
+    enableOtherEvents=False
+)
+
+app.layout = html.Div([
+    html.Header(
+        "This demo shows how to grow a large graph from a seed node: double-click nodes to load their neighbours."),
+    network,
+])
+
+
+@app.callback(
+    Output('network', 'dataDelta'),
+    Input('network', 'expandRequest'),
+    prevent_initial_call=True
+)
+def expand(request):
+    return expansion.expand(request)
+
+
+server = app.server
+
+if __name__ == '__main__':
+    app.run_server(debug=True)